@@ -21,26 +21,42 @@ Arquitetura:
 Versão: 4.0 (Modular Architecture)
 """
 
+import argparse
 import os
 import sys
 
-import uvicorn
-from dotenv import load_dotenv
 
-# Load environment variables from .env file
-load_dotenv()
+def _parse_args(argv: list[str] | None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Servidor de Busca NCM (Nesh)")
+    parser.add_argument(
+        "--reload",
+        action="store_true",
+        help="Ativa o hot reload (apenas desenvolvimento).",
+    )
+    return parser.parse_args([] if argv is None else argv)
 
 
-def main():
+def main(argv: list[str] | None = None):
     """
     Função principal que configura e inicia o servidor Uvicorn.
 
     Adiciona o diretório raiz ao PYTHONPATH e inicia o servidor
     escutando em 127.0.0.1:8000 com reload desativado por padrão.
-    Para reativar o reload, defina NESH_RELOAD com um valor truthy
-    como "1", "true" ou "yes".
+    Para reativar o reload, passe --reload ou defina NESH_RELOAD com
+    um valor truthy como "1", "true" ou "yes".
     """
+    args = _parse_args(argv)
     project_root = os.path.dirname(os.path.abspath(__file__))
+
+    # Imports pesados só quando o servidor vai de fato subir:
+    # `import Nesh` (ferramentas, testes) e `--help` não pagam esse custo.
+    import uvicorn
+    from dotenv import load_dotenv
+
+    # Load environment variables from the project's .env file.
+    # Caminho explícito evita a busca ascendente de find_dotenv() a cada start/reload.
+    load_dotenv(os.path.join(project_root, ".env"))
+
     if project_root not in sys.path:
         # Garante imports absolutos tanto no processo principal quanto em subprocessos.
         sys.path.insert(0, project_root)
@@ -52,8 +68,27 @@ def main():
 
     # Hot reload controlado:
     # - Desligado por padrão porque o watcher costuma travar no Windows/OneDrive
-    # - Pode ser reativado explicitamente com NESH_RELOAD=1
-    reload_enabled = os.getenv("NESH_RELOAD", "0").lower() not in {"0", "false", "no"}
+    # - Pode ser reativado explicitamente com --reload ou NESH_RELOAD=1
+    reload_enabled = args.reload or os.getenv("NESH_RELOAD", "0").lower() not in {
+        "0",
+        "false",
+        "no",
+    }
+
+    if reload_enabled:
+        # Sem watchfiles o Uvicorn cai no StatReload, que faz polling a cada
+        # 250 ms e consome boa parte de um núcleo. Melhor desligar o reload.
+        try:
+            import watchfiles  # noqa: F401
+        except ImportError:
+            print(
+                "⚠️ NESH_RELOAD ignorado: 'watchfiles' não está instalado "
+                "(instale uvicorn[standard]). Iniciando sem reload."
+            )
+            reload_enabled = False
+
+    # Debounce: agrupa rajadas de eventos (autosave, troca de branch) em um único restart.
+    reload_delay = float(os.getenv("NESH_RELOAD_DELAY", "0.1"))
 
     print(f"Starting Nesh Server on http://{HOST}:{PORT}")
 
@@ -76,7 +111,9 @@ def main():
             port=PORT,
             reload=True,
             reload_dirs=[backend_dir],
+            reload_includes=["*.py"],
             reload_excludes=reload_excludes,
+            reload_delay=reload_delay,
         )
         return
 
@@ -91,4 +128,4 @@ def main():
 
 
 if __name__ == "__main__":
-    main()
+    main(sys.argv[1:])
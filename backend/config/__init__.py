@@ -1,41 +1,65 @@
-"""Public config package exports."""
-
-from .constants import ApiRoutes as ApiRoutes
-from .constants import CacheConfig as CacheConfig
-from .constants import DatabaseConfig as DatabaseConfig
-from .constants import HttpHeaders as HttpHeaders
-from .constants import Messages as Messages
-from .constants import PerformanceConfig as PerformanceConfig
-from .constants import RegexPatterns as RegexPatterns
-from .constants import SearchConfig as SearchConfig
-from .constants import ServerConfig as ServerConfig
-from .exceptions import ChapterNotFoundError as ChapterNotFoundError
-from .exceptions import ConfigurationError as ConfigurationError
-from .exceptions import DatabaseError as DatabaseError
-from .exceptions import DatabaseNotFoundError as DatabaseNotFoundError
-from .exceptions import InvalidQueryError as InvalidQueryError
-from .exceptions import NeshError as NeshError
-from .loader import CONFIG as CONFIG
-from .logging_config import get_logger as get_logger
-from .logging_config import setup_logging as setup_logging
-
-__all__ = [
-    "CONFIG",
-    "ApiRoutes",
-    "HttpHeaders",
-    "CacheConfig",
-    "SearchConfig",
-    "DatabaseConfig",
-    "ServerConfig",
-    "RegexPatterns",
-    "Messages",
-    "PerformanceConfig",
-    "NeshError",
-    "ConfigurationError",
-    "DatabaseError",
-    "DatabaseNotFoundError",
-    "ChapterNotFoundError",
-    "InvalidQueryError",
-    "setup_logging",
-    "get_logger",
-]
+"""Public config package exports.
+
+Os re-exports são resolvidos sob demanda (PEP 562): importar
+``backend.config.constants`` não carrega as settings Pydantic nem lê
+``settings.json``.
+"""
+
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .constants import ApiRoutes as ApiRoutes
+    from .constants import CacheConfig as CacheConfig
+    from .constants import DatabaseConfig as DatabaseConfig
+    from .constants import HttpHeaders as HttpHeaders
+    from .constants import Messages as Messages
+    from .constants import PerformanceConfig as PerformanceConfig
+    from .constants import RegexPatterns as RegexPatterns
+    from .constants import SearchConfig as SearchConfig
+    from .constants import ServerConfig as ServerConfig
+    from .exceptions import ChapterNotFoundError as ChapterNotFoundError
+    from .exceptions import ConfigurationError as ConfigurationError
+    from .exceptions import DatabaseError as DatabaseError
+    from .exceptions import DatabaseNotFoundError as DatabaseNotFoundError
+    from .exceptions import InvalidQueryError as InvalidQueryError
+    from .exceptions import NeshError as NeshError
+    from .loader import CONFIG as CONFIG
+    from .logging_config import get_logger as get_logger
+    from .logging_config import setup_logging as setup_logging
+
+_LAZY_EXPORTS: dict[str, str] = {
+    "CONFIG": "loader",
+    "ApiRoutes": "constants",
+    "HttpHeaders": "constants",
+    "CacheConfig": "constants",
+    "SearchConfig": "constants",
+    "DatabaseConfig": "constants",
+    "ServerConfig": "constants",
+    "RegexPatterns": "constants",
+    "Messages": "constants",
+    "PerformanceConfig": "constants",
+    "NeshError": "exceptions",
+    "ConfigurationError": "exceptions",
+    "DatabaseError": "exceptions",
+    "DatabaseNotFoundError": "exceptions",
+    "ChapterNotFoundError": "exceptions",
+    "InvalidQueryError": "exceptions",
+    "setup_logging": "logging_config",
+    "get_logger": "logging_config",
+}
+
+__all__ = list(_LAZY_EXPORTS)
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(f"{__name__}.{module_name}"), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
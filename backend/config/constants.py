@@ -3,7 +3,15 @@ Constantes centralizadas do Nesh.
 Todos os magic numbers e strings hardcoded devem ser definidos aqui.
 """
 
-from enum import Enum
+import functools
+import re
+from enum import StrEnum
+
+
+@functools.cache
+def compiled(pattern: str, flags: int = 0) -> re.Pattern[str]:
+    """Compila um padrão regex uma única vez por processo."""
+    return re.compile(pattern, flags)
 
 
 class ApiRoutes:
@@ -67,7 +75,7 @@ class DatabaseConfig:
     DEFAULT_DB_FILENAME = "database/nesh.db"
 
 
-class ViewMode(str, Enum):
+class ViewMode(StrEnum):
     """Modos de visualização da TIPI.
 
     FAMILY: Retorna apenas família NCM (posição + ancestrais + descendentes)
@@ -88,6 +96,11 @@ class ServerConfig:
 class RegexPatterns:
     """Padrões regex usados na aplicação."""
 
+    @classmethod
+    def get(cls, name: str) -> re.Pattern[str]:
+        """Retorna o padrão ``name`` já compilado (cache por processo)."""
+        return compiled(getattr(cls, name))
+
     # Padrão para detectar NCM numérico
     NCM_NUMERIC = r"^[\d\.,\s-]+$"
 
@@ -181,7 +194,10 @@ class RegexPatterns:
         r"|"
         # ── Grupo 2: unidades curtas que EXIGEM dígito antes (0-3 espaços) ──
         # Evita falsos positivos: "bar" (estabelecimento), "N" em "Não", "J" em "José", etc.
-        r"(?:(?<=\d)|(?<=\d\s)|(?<=\d\s\s)|(?<=\d\s\s\s))"
+        # O lookahead de 1 caractere descarta a maioria das posições antes de
+        # avaliar os quatro lookbehinds (de largura fixa, custo O(1) cada).
+        r"(?=[WVAKmltgNJb])"
+        r"(?:(?<=\d\s)|(?<=\d)|(?<=\d\s\s)|(?<=\d\s\s\s))"
         r"(?:W|V|A|K|m|l|t|g|N|J|bar)"
         r"(?![A-Za-zÀ-ÿ0-9_])"
         r")"
@@ -200,3 +216,16 @@ class Messages:
     # Erros HTTP
     MISSING_NCM_PARAM = "Parâmetro 'ncm' é obrigatório"
     CHAPTER_NOT_FOUND = "Capítulo {chapter} não encontrado"
+
+
+# Padrões pré-compilados uma única vez no import do módulo.
+# Consumidores devem importar estes objetos em vez de recompilar as strings.
+NOTE_HEADER_RE = RegexPatterns.get("NOTE_HEADER")
+MEASUREMENT_UNITS_RE = RegexPatterns.get("MEASUREMENT_UNITS")
+
+
+# Pré-filtro: todo match de MEASUREMENT_UNITS começa por um destes caracteres
+# (comparação case-insensitive, incluindo as variantes Unicode de K/µ/Ω).
+# Uma busca por classe de caracteres é um scan linear barato que descarta
+# fragmentos sem unidade possível (espaços entre tags, códigos NCM, números).
+MEASUREMENT_UNITS_PREFILTER_RE = re.compile(r"[abcdfghjklmnoprtvw°ºµΩ]", re.IGNORECASE)
@@ -4,6 +4,7 @@ Fornece loggers configurados para cada módulo.
 """
 
 import logging
+import logging.handlers
 import re
 import sys
 from typing import Any, Optional
@@ -92,11 +93,35 @@ def _remove_managed_handlers(logger: logging.Logger) -> None:
                 pass  # Safe to ignore: handler is being removed regardless
 
 
+# Formato com timestamp, nível e módulo (compartilhado entre chamadas de setup_logging)
+_FORMATTER = logging.Formatter(
+    fmt="%(asctime)s | %(levelname)-8s | %(name)s | %(message)s",
+    datefmt="%Y-%m-%d %H:%M:%S",
+)
+_STDOUT_UTF8_ATTR = "_nesh_utf8"
+
+
+def _ensure_utf8_stdout() -> None:
+    """Reconfigura stdout para UTF-8 uma única vez por stream."""
+    stream = sys.stdout
+    if getattr(stream, _STDOUT_UTF8_ATTR, False) or not hasattr(stream, "reconfigure"):
+        return
+    try:
+        stream.reconfigure(encoding="utf-8")
+    except Exception:  # noqa: S110 - stdout reconfigure is best-effort
+        return  # Safe to ignore: stdout encoding is non-critical
+    try:
+        setattr(stream, _STDOUT_UTF8_ATTR, True)
+    except (AttributeError, TypeError):  # noqa: S110 - stream may not accept attrs
+        pass  # Safe to ignore: only costs a redundant reconfigure next time
+
+
 def setup_logging(
     level: int | str = logging.INFO,
     log_file: Optional[str] = None,
     *,
     redact_sensitive_data: bool = True,
+    buffer_capacity: int = 0,
 ) -> None:
     """
     Configura o logging global da aplicação.
@@ -105,12 +130,10 @@ def setup_logging(
         level: Nível de logging (default: INFO)
         log_file: Caminho opcional para arquivo de log
         redact_sensitive_data: Redige segredos e tokens antes de enviar ao log.
+        buffer_capacity: Se > 0, agrupa até N registros do console antes de
+            escrever (WARNING ou acima força o flush imediato).
     """
-    # Formato com timestamp, nível e módulo
-    formatter = logging.Formatter(
-        fmt="%(asctime)s | %(levelname)-8s | %(name)s | %(message)s",
-        datefmt="%Y-%m-%d %H:%M:%S",
-    )
+    formatter = _FORMATTER
     resolved_level = _resolve_logging_level(level)
     active_filters: list[logging.Filter] = []
     if redact_sensitive_data:
@@ -121,14 +144,21 @@ def setup_logging(
         # Windows requires specific handling or reconfiguring stdout
         # Using sys.stdout directly often fails with Unicode if not configured
         # Simple fix: Use UTF-8 encoding for file handlers, but for stream rely on python's new utf-8 mode
-        if hasattr(sys.stdout, "reconfigure"):
-            try:
-                sys.stdout.reconfigure(encoding="utf-8")
-            except Exception:  # noqa: S110 - stdout reconfigure is best-effort
-                pass  # Safe to ignore: stdout encoding is non-critical
+        _ensure_utf8_stdout()
 
-    console_handler = logging.StreamHandler(sys.stdout)
+    console_handler: logging.Handler = logging.StreamHandler(sys.stdout)
     console_handler.setFormatter(formatter)
+    if buffer_capacity > 0:
+        # Modo enxuto: o formato não usa thread/process, então pulamos esses
+        # lookups por LogRecord (afeta o processo inteiro, por isso é opt-in).
+        logging.logThreads = False
+        logging.logProcesses = False
+        logging.logMultiprocessing = False
+        console_handler = logging.handlers.MemoryHandler(
+            capacity=buffer_capacity,
+            flushLevel=logging.WARNING,
+            target=console_handler,
+        )
     setattr(console_handler, NESH_MANAGED_HANDLER_ATTR, True)
     for active_filter in active_filters:
         console_handler.addFilter(active_filter)
@@ -1,12 +1,18 @@
+import functools
+import hashlib
 import json
 import logging
 import os
 import secrets
-from typing import List, Literal, Optional, Set
+import sys
+from pathlib import Path
+from typing import Any, ClassVar, FrozenSet, List, Literal, Optional, Self, Set
 
-from pydantic import BaseModel, Field, field_validator
+import orjson
+from pydantic import BaseModel, Field, PrivateAttr, field_validator, model_validator
 from pydantic_settings import (
     BaseSettings,
+    InitSettingsSource,
     JsonConfigSettingsSource,
     PydanticBaseSettingsSource,
     SettingsConfigDict,
@@ -18,7 +24,37 @@ PROJECT_ROOT = os.path.dirname(
 )
 
 
-class ServerSettings(BaseModel):
+@functools.lru_cache(maxsize=32)
+def _resolve_project_path(filename: str) -> str:
+    # Memoizado pelo próprio nome do arquivo: continua correto quando o campo é
+    # reatribuído em runtime e evita isabs/join a cada leitura de `*_path`.
+    if os.path.isabs(filename):
+        return filename
+    return os.path.join(PROJECT_ROOT, filename)
+
+
+def _intern_str_fields(model: BaseModel, field_names: tuple[str, ...]) -> None:
+    # Escreve direto no __dict__: sem revalidação nem validate_assignment.
+    for name in field_names:
+        value = model.__dict__.get(name)
+        if isinstance(value, str):
+            model.__dict__[name] = sys.intern(value)
+
+
+class _InternedStrSettings(BaseModel):
+    """Interna campos de baixa cardinalidade (nunca segredos) a cada load."""
+
+    _interned_fields: ClassVar[tuple[str, ...]] = ()
+
+    @model_validator(mode="after")
+    def _intern_fields(self) -> Self:
+        _intern_str_fields(self, self._interned_fields)
+        return self
+
+
+class ServerSettings(_InternedStrSettings):
+    _interned_fields: ClassVar[tuple[str, ...]] = ("host", "env")
+
     port: int = 8000
     host: str = "127.0.0.1"
     env: str = "development"
@@ -26,9 +62,11 @@ class ServerSettings(BaseModel):
     cors_allowed_origin_regex: Optional[str] = None
 
 
-class DatabaseSettings(BaseModel):
+class DatabaseSettings(_InternedStrSettings):
     """Database configuration with dual-mode SQLite/PostgreSQL support."""
 
+    _interned_fields: ClassVar[tuple[str, ...]] = ("engine",)
+
     # SQLite paths (dev/legacy)
     filename: str = "database/nesh.db"
     tipi_filename: str = "database/tipi.db"
@@ -40,6 +78,23 @@ class DatabaseSettings(BaseModel):
     # Engine mode: sqlite or postgresql
     engine: Literal["sqlite", "postgresql"] = "sqlite"
 
+    # Tenant do RLS como set_config de sessão (is_local=false), reenviado só
+    # quando muda na conexão. INSEGURO atrás de pooler em modo transação
+    # (PgBouncer/Neon pooled): o backend muda a cada transação e o tenant
+    # vazaria entre requisições. Padrão: is_local=true em toda sessão.
+    postgres_tenant_session_scope: bool = False
+
+    # SQLite PRAGMAs aplicados a cada conexão do pool
+    sqlite_cache_size: int = -65536  # negativo = KiB (64 MiB)
+    sqlite_mmap_size: int = Field(default=268_435_456, ge=0)  # 256 MiB
+    sqlite_busy_timeout_ms: int = Field(default=5000, ge=0)
+    sqlite_wal_autocheckpoint: int = Field(default=1000, ge=0)
+    sqlite_temp_store: Literal["DEFAULT", "FILE", "MEMORY"] = "MEMORY"
+    # Conexões ociosas além disso (segundos) são fechadas; 0 desativa
+    sqlite_pool_idle_timeout: float = Field(default=300.0, ge=0)
+    # Statement cache do sqlite3 por conexão (chaveado pelo texto SQL)
+    sqlite_cached_statements: int = Field(default=256, ge=0)
+
     @property
     def is_postgres(self) -> bool:
         """Returns True if using PostgreSQL engine."""
@@ -48,23 +103,17 @@ class DatabaseSettings(BaseModel):
     @property
     def path(self) -> str:
         """Returns SQLite DB path (relative to root if not absolute)."""
-        if os.path.isabs(self.filename):
-            return self.filename
-        return os.path.join(PROJECT_ROOT, self.filename)
+        return _resolve_project_path(self.filename)
 
     @property
     def tipi_path(self) -> str:
         """Returns TIPI SQLite DB path."""
-        if os.path.isabs(self.tipi_filename):
-            return self.tipi_filename
-        return os.path.join(PROJECT_ROOT, self.tipi_filename)
+        return _resolve_project_path(self.tipi_filename)
 
     @property
     def services_path(self) -> str:
         """Returns services SQLite DB path."""
-        if os.path.isabs(self.services_filename):
-            return self.services_filename
-        return os.path.join(PROJECT_ROOT, self.services_filename)
+        return _resolve_project_path(self.services_filename)
 
     @property
     def async_url(self) -> str:
@@ -78,9 +127,15 @@ class SearchSettings(BaseModel):
     stopwords: List[str] = Field(default_factory=list)
     max_query_length: int = 100
 
+    _stopwords_set: FrozenSet[str] = PrivateAttr(default=frozenset())
+
+    def model_post_init(self, context: Any, /) -> None:
+        # Congelado uma vez no load: evita materializar um set novo a cada acesso.
+        self._stopwords_set = frozenset(self.stopwords)
+
     @property
-    def stopwords_set(self) -> Set[str]:
-        return set(self.stopwords)
+    def stopwords_set(self) -> FrozenSet[str]:
+        return self._stopwords_set
 
 
 class FeatureSettings(BaseModel):
@@ -92,12 +147,19 @@ class FeatureSettings(BaseModel):
 class CacheSettings(BaseModel):
     enable_redis: bool = False
     redis_url: str = "redis://localhost:6379/0"
+    # Pool de conexões Redis: teto de sockets e espera máxima (s) por um livre
+    redis_max_connections: int = Field(default=50, ge=1)
+    redis_pool_timeout: float = Field(default=1.0, gt=0)
     max_payload_bytes: int = Field(default=32_768, ge=0)
     chapter_cache_ttl: int = 3600
     fts_cache_ttl: int = 600
     services_search_ttl: int = 600
     services_detail_ttl: int = 1800
     status_cache_ttl: int = 20
+    # Anchors com comentários aprovados: lidos a cada render de capítulo
+    comment_anchors_ttl: int = Field(default=30, ge=1)
+    # Capítulos como HASH no Redis (um campo por chave): permite HMGET parcial
+    chapter_hash_mode: bool = False
 
 
 class AuthSettings(BaseModel):
@@ -179,9 +241,12 @@ class SecuritySettings(BaseModel):
         return self.ai_chat_allowed_email_set
 
 
-class LoggingSettings(BaseModel):
+class LoggingSettings(_InternedStrSettings):
+    _interned_fields: ClassVar[tuple[str, ...]] = ("level",)
+
     level: str = "INFO"
     redact_sensitive_data: bool = True
+    buffer_capacity: int = Field(default=0, ge=0)
 
     @property
     def normalized_level(self) -> str:
@@ -192,7 +257,9 @@ class LoggingSettings(BaseModel):
         return getattr(logging, self.normalized_level, logging.INFO)
 
 
-class ObservabilitySettings(BaseModel):
+class ObservabilitySettings(_InternedStrSettings):
+    _interned_fields: ClassVar[tuple[str, ...]] = ("sentry_environment",)
+
     metrics_token: str = ""
     sentry_dsn: str = ""
     sentry_environment: str = ""
@@ -207,6 +274,32 @@ class ObservabilitySettings(BaseModel):
         return bool(self.metrics_token.strip())
 
 
+def _read_settings_json(json_file: Any) -> dict[str, Any]:
+    """Lê settings.json com orjson direto dos bytes; ausente ou não-objeto vira {}."""
+    if json_file is None or not os.path.isfile(json_file):
+        return {}
+    raw = orjson.loads(Path(json_file).read_bytes())
+    return raw if isinstance(raw, dict) else {}
+
+
+class OrjsonConfigSettingsSource(JsonConfigSettingsSource):
+    """
+    settings.json source parsed with orjson straight from bytes.
+
+    Overrides only the public constructor: the file is read here and handed
+    to ``InitSettingsSource``, so no private pydantic-settings reader hook is
+    involved. Subclassing keeps the ``json_file`` config key recognized.
+    """
+
+    def __init__(self, settings_cls: type[BaseSettings], json_file: Any = None) -> None:
+        if json_file is None:
+            json_file = settings_cls.model_config.get("json_file")
+        self.json_file_path = json_file
+        self.json_file_encoding = None
+        self.json_data = _read_settings_json(json_file)
+        InitSettingsSource.__init__(self, settings_cls, self.json_data)
+
+
 class AppSettings(BaseSettings):
     """
     Main Application Configuration.
@@ -224,19 +317,6 @@ class AppSettings(BaseSettings):
     logging: LoggingSettings = Field(default_factory=LoggingSettings)
     observability: ObservabilitySettings = Field(default_factory=ObservabilitySettings)
 
-    # Legacy compatibility property
-    @property
-    def db_path(self) -> str:
-        return self.database.path
-
-    @property
-    def port(self) -> int:
-        return self.server.port
-
-    @property
-    def stopwords(self) -> Set[str]:
-        return self.search.stopwords_set
-
     model_config = SettingsConfigDict(
         env_file=".env",
         json_file=os.path.join(PROJECT_ROOT, "backend", "config", "settings.json"),
@@ -258,7 +338,7 @@ class AppSettings(BaseSettings):
             init_settings,
             env_settings,
             dotenv_settings,
-            JsonConfigSettingsSource(settings_cls),
+            OrjsonConfigSettingsSource(settings_cls),
             file_secret_settings,
         )
 
@@ -269,19 +349,63 @@ class AppSettings(BaseSettings):
         1. Environment Variables
         2. settings.json
         3. Defaults
+
+        The result is memoized while settings.json, .env and the process
+        environment are unchanged; ``reload_settings()`` forces a rebuild.
         """
-        return cls()
+        return _load_cached(cls, _settings_sources_key(cls))
 
 
-# Singleton instance
-settings = AppSettings.load()
+def _file_mtime_ns(path: str) -> int | None:
+    try:
+        return os.stat(path).st_mtime_ns
+    except OSError:
+        return None
+
+
+def _settings_sources_key(settings_cls: type[AppSettings]) -> tuple[Any, ...]:
+    json_file = settings_cls.model_config.get("json_file")
+    env_file = settings_cls.model_config.get("env_file")
+    return (
+        _file_mtime_ns(json_file) if isinstance(json_file, str) else None,
+        _file_mtime_ns(env_file) if isinstance(env_file, str) else None,
+        frozenset(os.environ.items()),
+    )
+
+
+# Opt-in: settings.json gerado internamente dispensa validação no cold start.
+# Ignora env/.env; o caminho validado continua sendo o padrão.
+TRUST_SETTINGS_JSON_ENV = "NESH_TRUST_SETTINGS_JSON"
+
 
+def _construct_trusted(settings_cls: type[AppSettings]) -> AppSettings:
+    raw = _read_settings_json(settings_cls.model_config.get("json_file"))
 
-def _get_model_fields(model: BaseModel) -> Set[str]:
-    model_fields = getattr(model, "model_fields", None)
-    if isinstance(model_fields, dict):
-        return set(model_fields.keys())
-    return set(getattr(model, "__fields__", {}).keys())
+    values: dict[str, Any] = {}
+    for name, field in settings_cls.model_fields.items():
+        section = raw.get(name)
+        model_cls = field.annotation
+        if (
+            isinstance(section, dict)
+            and isinstance(model_cls, type)
+            and issubclass(model_cls, BaseModel)
+        ):
+            values[name] = model_cls.model_construct(**section)
+    return settings_cls.model_construct(**values)
+
+
+@functools.lru_cache(maxsize=1)
+def _load_cached(
+    settings_cls: type[AppSettings], sources_key: tuple[Any, ...]
+) -> AppSettings:
+    del sources_key  # only part of the cache key
+    if os.environ.get(TRUST_SETTINGS_JSON_ENV) == "1":
+        return _construct_trusted(settings_cls)
+    return settings_cls()
+
+
+# Singleton instance
+settings = AppSettings.load()
 
 
 def reload_settings() -> "AppSettings":
@@ -289,31 +413,48 @@ def reload_settings() -> "AppSettings":
     Reloads settings from env/settings.json into the existing instance.
     Keeps references stable for modules that imported `settings`.
     """
+    _load_cached.cache_clear()
     new_settings = AppSettings.load()
-    for field_name in _get_model_fields(new_settings):
-        setattr(settings, field_name, getattr(new_settings, field_name))
+    # Troca todas as seções de uma vez (um único dict.update), sem passar
+    # pelo __setattr__ do Pydantic campo a campo: leitores concorrentes não
+    # observam uma mistura de seções antigas e novas.
+    settings.__dict__.update(
+        {
+            field_name: getattr(new_settings, field_name)
+            for field_name in type(new_settings).model_fields
+        }
+    )
     return settings
 
 
-def is_valid_admin_token(token: str | None) -> bool:
-    if not token:
+@functools.lru_cache(maxsize=8)
+def _credential_digests(current: str, previous: str) -> tuple[bytes, ...]:
+    # Memoizado pelos valores: acompanha reload_settings() e mutações em runtime.
+    return tuple(
+        hashlib.sha256(secret.encode("utf-8")).digest()
+        for secret in (current, previous)
+        if secret
+    )
+
+
+def _valid_credential(candidate: str | None, current: str, previous: str) -> bool:
+    if not candidate:
         return False
-    current = settings.auth.admin_token
-    previous = settings.auth.admin_token_previous
-    if current and secrets.compare_digest(token, current):
-        return True
-    if previous and secrets.compare_digest(token, previous):
-        return True
-    return False
+    digest = hashlib.sha256(candidate.encode("utf-8")).digest()
+    matched = False
+    for expected in _credential_digests(current, previous):
+        # Sem curto-circuito: o tempo não revela qual credencial casou.
+        matched |= secrets.compare_digest(digest, expected)
+    return matched
+
+
+def is_valid_admin_token(token: str | None) -> bool:
+    auth = settings.auth
+    return _valid_credential(token, auth.admin_token, auth.admin_token_previous)
 
 
 def is_valid_admin_password(password: str | None) -> bool:
-    if not password:
-        return False
-    current = settings.auth.admin_password
-    previous = settings.auth.admin_password_previous
-    if current and secrets.compare_digest(password, current):
-        return True
-    if previous and secrets.compare_digest(password, previous):
-        return True
-    return False
+    auth = settings.auth
+    return _valid_credential(
+        password, auth.admin_password, auth.admin_password_previous
+    )
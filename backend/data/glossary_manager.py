@@ -7,45 +7,139 @@ the manager stays empty and the API continues to work.
 
 from __future__ import annotations
 
-import json
+import mmap
 import os
 import re
-from typing import Any, Dict, Optional
-
-
+import sys
+from collections.abc import Mapping
+from dataclasses import dataclass, field
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Any, Dict, FrozenSet, Optional
+
+import orjson
+
+_EMPTY_TERMS: Mapping[str, Dict[str, Any]] = MappingProxyType({})
+
+
+def _trie_pattern(node: Dict[str, Any]) -> str:
+    """
+    Emit a concatenation-safe regex for a character trie node.
+
+    Children are tried before the node's own end marker (greedy ``?``), so
+    the longest term at a position wins and backtracking yields the next
+    shorter one, exactly like a longest-first alternation.
+    """
+    branches = [
+        re.escape(char) + _trie_pattern(child)
+        for char, child in sorted(node.items())
+        if char
+    ]
+    if not branches:
+        return ""
+    body = branches[0] if len(branches) == 1 else "(?:" + "|".join(branches) + ")"
+    if "" in node:
+        return "(?:" + body + ")?"
+    return body
+
+
+@lru_cache(maxsize=8)
+def _compile_glossary_regex(terms: FrozenSet[str]) -> re.Pattern[str]:
+    # Shared prefixes (e.g. "import", "tribut") are factored into a trie so
+    # the pattern source and the compiled program shrink.
+    trie: Dict[str, Any] = {}
+    for term in terms:
+        node = trie
+        for char in term:
+            node = node.setdefault(char, {})
+        node[""] = {}
+    # Atomic group (stdlib ``re`` since 3.11) drops the retry states once a
+    # term has matched. The closing \b stays inside the group so a longer
+    # term failing the boundary still falls back to a shorter one.
+    return re.compile(r"\b(?>(" + _trie_pattern(trie) + r")\b)", re.IGNORECASE)
+
+
+def _read_json_mapped(path: str) -> Any:
+    """
+    Parse a JSON file with orjson straight from an mmap'd view.
+
+    Avoids materializing a Python ``bytes`` copy of multi-MB glossaries and
+    the ``str`` decode round-trip of ``json.load`` on a text handle.
+    """
+    with open(path, "rb") as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            # mmap rejects empty files; keep orjson's JSONDecodeError.
+            return orjson.loads(b"")
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            with memoryview(mm) as view:
+                return orjson.loads(view)
+
+
+def _first_chars(terms: FrozenSet[str]) -> FrozenSet[str]:
+    # Both cases so the check can run on the raw text without lowercasing it.
+    return frozenset(
+        variant for term in terms for variant in (term[0], term[0].upper())
+    )
+
+
+@dataclass(slots=True, eq=False, repr=False)
 class GlossaryManager:
-    def __init__(self) -> None:
-        self._terms: Dict[str, Dict[str, Any]] = {}
-        self._regex: Optional[re.Pattern[str]] = None
+    # Fixed slot layout: no per-instance __dict__. Identity semantics are kept
+    # (eq=False), so instances stay hashable like before.
+    # Read-only view swapped wholesale on each load; never mutated in place.
+    _terms: Mapping[str, Dict[str, Any]] = field(
+        default_factory=lambda: _EMPTY_TERMS, init=False
+    )
+    _regex: Optional[re.Pattern[str]] = field(default=None, init=False)
+    _regex_terms: Optional[FrozenSet[str]] = field(default=None, init=False)
+    _first_chars: FrozenSet[str] = field(default_factory=frozenset, init=False)
 
     def _build_regex(self) -> None:
         if not self._terms:
             self._regex = None
+            self._regex_terms = None
+            self._first_chars = frozenset()
             return
 
-        # Longest-first avoids partial matching when terms overlap.
-        escaped_terms = sorted((re.escape(t) for t in self._terms.keys()), key=len, reverse=True)
-        self._regex = re.compile(r"\b(" + "|".join(escaped_terms) + r")\b", re.IGNORECASE)
+        terms = frozenset(self._terms)
+        if terms == self._regex_terms and self._regex is not None:
+            return
+        self._regex = _compile_glossary_regex(terms)
+        self._regex_terms = terms
+        self._first_chars = _first_chars(terms)
+
+    def maybe_has_term(self, text: str) -> bool:
+        """
+        Cheap pre-check: False when no glossary term can start anywhere in ``text``.
+
+        Callers skip the regex scan on False; True may be a false positive.
+        """
+        return bool(text) and not self._first_chars.isdisjoint(text)
 
     def load_from_json(self, path: str) -> bool:
         if not os.path.exists(path):
-            self._terms = {}
+            self._terms = _EMPTY_TERMS
             self._regex = None
+            self._regex_terms = None
+            self._first_chars = frozenset()
             return False
 
-        with open(path, "r", encoding="utf-8") as f:
-            raw = json.load(f)
+        raw = _read_json_mapped(path)
 
         terms: Dict[str, Dict[str, Any]] = {}
         if isinstance(raw, dict):
             iterable = raw.items()
         elif isinstance(raw, list):
-            iterable = ((str(item.get("term", "")), item) for item in raw if isinstance(item, dict))
+            iterable = (
+                (str(item.get("term", "")), item)
+                for item in raw
+                if isinstance(item, dict)
+            )
         else:
             iterable = ()
 
         for key, value in iterable:
-            term = str(key).strip().lower()
+            term = sys.intern(str(key).strip().lower())
             if not term:
                 continue
             if isinstance(value, dict):
@@ -53,7 +147,7 @@ class GlossaryManager:
             else:
                 terms[term] = {"definition": str(value)}
 
-        self._terms = terms
+        self._terms = MappingProxyType(terms)
         self._build_regex()
         return True
 
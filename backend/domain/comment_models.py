@@ -13,6 +13,12 @@ from sqlalchemy import Column, Text
 
 CommentStatus = Literal["pending", "approved", "rejected", "private"]
 
+_UTC = timezone.utc
+
+
+def _utc_now() -> datetime:
+    return datetime.now(_UTC)
+
 
 class Comment(SQLModel, table=True):
     """
@@ -49,8 +55,8 @@ class Comment(SQLModel, table=True):
     status: str = Field(default="pending", max_length=20, index=True)
 
     # Timestamps
-    created_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
-    updated_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
+    created_at: datetime = Field(default_factory=_utc_now)
+    updated_at: datetime = Field(default_factory=_utc_now)
 
     # Moderação
     moderated_by: Optional[str] = Field(default=None, max_length=255)
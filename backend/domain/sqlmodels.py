@@ -8,18 +8,25 @@ Cada modelo serve simultaneamente como:
 Este módulo coexiste com models.py (TypedDict) para migração gradual.
 """
 
+import sys
 from datetime import date, datetime, timezone
 from typing import ClassVar, List, Optional
 
-from sqlalchemy import Column, DateTime, Text
+from sqlalchemy import Column, DateTime, Text, event
+from sqlalchemy import inspect as sa_inspect
 from sqlalchemy.dialects.postgresql import TSVECTOR
 from sqlmodel import Field, Relationship, SQLModel
 
+from backend.utils.id_utils import generate_anchor_id
+
 TENANT_ID_FOREIGN_KEY = "tenants.id"
 
 
+_UTC = timezone.utc
+
+
 def _utc_now() -> datetime:
-    return datetime.now(timezone.utc)
+    return datetime.now(_UTC)
 
 
 # ============================================================
@@ -99,6 +106,26 @@ class Subscription(SQLModel, table=True):
     tenant: Tenant = Relationship(back_populates="subscriptions")
 
 
+def _intern_loaded_fields(*field_names: str):
+    """Interna colunas de baixa cardinalidade logo após o load do ORM."""
+
+    def listener(target, _context) -> None:
+        # __dict__ direto: não marca o atributo como alterado na sessão.
+        state = target.__dict__
+        for name in field_names:
+            value = state.get(name)
+            if isinstance(value, str):
+                state[name] = sys.intern(value)
+
+    return listener
+
+
+event.listen(Tenant, "load", _intern_loaded_fields("subscription_plan"))
+event.listen(
+    Subscription, "load", _intern_loaded_fields("status", "provider", "plan_name")
+)
+
+
 # ============================================================
 # Base Models (schemas de API sem table=True)
 # ============================================================
@@ -179,6 +206,28 @@ class Position(PositionBase, table=True):
     chapter: Optional[Chapter] = Relationship(back_populates="positions")
 
 
+def _fill_position_anchor_id(
+    _mapper, _connection, target: "Position | TipiPosition"
+) -> None:
+    # Materializa o anchor_id na escrita: leituras usam a coluna sem reformatar.
+    if not target.anchor_id and target.codigo:
+        target.anchor_id = generate_anchor_id(target.codigo)
+
+
+def _refresh_position_anchor_id(
+    _mapper, _connection, target: "Position | TipiPosition"
+) -> None:
+    # Código alterado: o anchor antigo apontaria para uma posição inexistente.
+    if sa_inspect(target).attrs.codigo.history.has_changes():
+        target.anchor_id = generate_anchor_id(target.codigo)
+    else:
+        _fill_position_anchor_id(_mapper, _connection, target)
+
+
+event.listen(Position, "before_insert", _fill_position_anchor_id)
+event.listen(Position, "before_update", _refresh_position_anchor_id)
+
+
 class ChapterNotes(SQLModel, table=True):
     """Notas e seções estruturadas de cada capítulo."""
 
@@ -230,12 +279,19 @@ class TipiPosition(SQLModel, table=True):
     nivel: Optional[int] = Field(default=None)
     parent_ncm: Optional[str] = Field(default=None, max_length=20)
     ncm_sort: Optional[str] = Field(default=None, max_length=32)
+    anchor_id: Optional[str] = Field(
+        default=None, max_length=40, description="Precomputed HTML anchor id"
+    )
 
     search_vector: Optional[str] = Field(
         default=None, sa_column=Column(TSVECTOR, nullable=True)
     )
 
 
+event.listen(TipiPosition, "before_insert", _fill_position_anchor_id)
+event.listen(TipiPosition, "before_update", _refresh_position_anchor_id)
+
+
 # ============================================================
 # Services Catalog Models (NBS / NEBS)
 # ============================================================
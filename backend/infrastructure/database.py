@@ -6,6 +6,7 @@ import asyncio
 import os
 import time
 from contextlib import asynccontextmanager
+from dataclasses import dataclass
 from typing import Any, Dict, List, Optional
 
 import aiosqlite
@@ -16,26 +17,82 @@ from ..config.settings import settings
 from .database_search import DatabaseSearchQueries
 
 
-class ConnectionPool:
-    """Thread-safe async pool for reusable SQLite connections."""
+def _connection_pragmas(read_only: bool = False) -> List[str]:
+    """PRAGMAs applied to every pooled connection (tunable via settings)."""
+    db = settings.database
+    pragmas = [
+        "PRAGMA journal_mode=WAL",
+        "PRAGMA synchronous=NORMAL",
+        f"PRAGMA temp_store={db.sqlite_temp_store}",
+        f"PRAGMA cache_size={int(db.sqlite_cache_size)}",
+        f"PRAGMA mmap_size={int(db.sqlite_mmap_size)}",
+        f"PRAGMA busy_timeout={int(db.sqlite_busy_timeout_ms)}",
+        f"PRAGMA wal_autocheckpoint={int(db.sqlite_wal_autocheckpoint)}",
+    ]
+    # Por último: journal_mode=WAL acima ainda precisa escrever no header.
+    pragmas.append(f"PRAGMA query_only={'ON' if read_only else 'OFF'}")
+    return pragmas
+
+
+_STAT1_COUNTS_SQL = (
+    "SELECT tbl, stat FROM sqlite_stat1 WHERE tbl IN ('chapters', 'positions')"
+)
+_EXACT_COUNTS_SQL = (
+    "SELECT (SELECT COUNT(*) FROM chapters), (SELECT COUNT(*) FROM positions)"
+)
+
+
+@dataclass(slots=True)
+class _IdleConnection:
+    conn: aiosqlite.Connection
+    last_used: float
 
-    def __init__(self, db_path: str, max_size: int = 5):
+
+class ConnectionPool:
+    """
+    Async pool for reusable SQLite connections.
+
+    Idle connections live in a bounded ``asyncio.LifoQueue``: checkout/return
+    are ``get_nowait``/``put_nowait`` with no global lock, and the most
+    recently used (page-cache-warm) connection is handed out first. At most
+    ``max_size`` connections exist; extra callers wait for a release.
+    Connections idle longer than ``idle_timeout`` seconds sink to the bottom
+    of the stack and are closed by an amortized sweep on release.
+    """
+
+    def __init__(
+        self,
+        db_path: str,
+        max_size: int = 5,
+        idle_timeout: float | None = None,
+        *,
+        read_only: bool = False,
+    ):
         self.db_path = db_path
         self.max_size = max_size
-        self._pool: List[aiosqlite.Connection] = []
-        self._lock = asyncio.Lock()
+        self.read_only = read_only
+        self.idle_timeout = (
+            settings.database.sqlite_pool_idle_timeout
+            if idle_timeout is None
+            else idle_timeout
+        )
+        self._idle: asyncio.LifoQueue[_IdleConnection] = asyncio.LifoQueue(max_size)
         self._created = 0
+        self._last_sweep = time.monotonic()
         logger.info(f"ConnectionPool inicializado (max={max_size})")
 
     async def _create_connection(self) -> aiosqlite.Connection:
         """Creates a configured SQLite connection."""
         try:
-            conn = await aiosqlite.connect(self.db_path)
+            # SQL estável (cacheado por schema) + cache maior: prepare só na 1ª vez.
+            conn = await aiosqlite.connect(
+                self.db_path,
+                cached_statements=settings.database.sqlite_cached_statements,
+            )
             conn.row_factory = aiosqlite.Row
-            await conn.execute("PRAGMA journal_mode=WAL")
-            await conn.execute("PRAGMA synchronous=NORMAL")
-            await conn.execute("PRAGMA cache_size=10000")
-            self._created += 1
+            # Um único round-trip pela thread do aiosqlite para todos os PRAGMAs.
+            pragmas = _connection_pragmas(self.read_only)
+            await conn.executescript(";\n".join(pragmas) + ";")
             logger.debug(f"Nova conexão criada (total: {self._created})")
             return conn
         except Exception as exc:
@@ -43,87 +100,131 @@ class ConnectionPool:
             raise DatabaseError(f"Falha ao conectar ao banco: {exc}")
 
     async def get(self) -> aiosqlite.Connection:
-        """Returns an existing connection or creates a new one."""
-        async with self._lock:
-            if self._pool:
-                conn = self._pool.pop()
-                logger.debug(
-                    f"Conexão reutilizada do pool ({len(self._pool)} restantes)"
-                )
-                return conn
-        return await self._create_connection()
+        """Returns the warmest idle connection, creates one below the cap, or waits."""
+        try:
+            idle = self._idle.get_nowait()
+            logger.debug(
+                f"Conexão reutilizada do pool ({self._idle.qsize()} restantes)"
+            )
+            return idle.conn
+        except asyncio.QueueEmpty:
+            pass
+
+        if self._created < self.max_size:
+            # Reserva a vaga antes do await: check+incremento são atômicos no loop.
+            self._created += 1
+            try:
+                return await self._create_connection()
+            except BaseException:
+                self._created -= 1
+                raise
+
+        return (await self._idle.get()).conn
 
     async def release(self, conn: aiosqlite.Connection) -> None:
         """Returns a connection to the pool or closes it when full."""
-        async with self._lock:
-            if len(self._pool) < self.max_size:
-                self._pool.append(conn)
-                logger.debug(f"Conexão devolvida ao pool ({len(self._pool)} total)")
-            else:
-                try:
-                    await conn.close()
-                except Exception as exc:
-                    logger.warning(f"Erro ao fechar conexão excedente: {exc}")
-                logger.debug("Pool cheio, conexão fechada")
+        now = time.monotonic()
+        try:
+            self._idle.put_nowait(_IdleConnection(conn, now))
+            logger.debug(f"Conexão devolvida ao pool ({self._idle.qsize()} total)")
+        except asyncio.QueueFull:
+            await self._discard(conn, "excedente")
+            logger.debug("Pool cheio, conexão fechada")
+            return
+
+        if self.idle_timeout > 0 and now - self._last_sweep >= self.idle_timeout / 2:
+            await self._close_idle(now)
+
+    async def _close_idle(self, now: float) -> None:
+        """Closes connections idle for longer than ``idle_timeout``."""
+        self._last_sweep = now
+        keep: list[_IdleConnection] = []
+        stale: list[_IdleConnection] = []
+        while True:
+            try:
+                idle = self._idle.get_nowait()
+            except asyncio.QueueEmpty:
+                break
+            (stale if now - idle.last_used > self.idle_timeout else keep).append(idle)
+        # Drenado do topo para a base: reinsere na ordem inversa para manter a pilha.
+        for idle in reversed(keep):
+            self._idle.put_nowait(idle)
+        for idle in stale:
+            await self._discard(idle.conn, "ociosa")
+        if stale:
+            logger.debug(f"{len(stale)} conexão(ões) ociosa(s) fechada(s)")
+
+    async def _discard(self, conn: aiosqlite.Connection, reason: str) -> None:
+        self._created = max(0, self._created - 1)
+        try:
+            await conn.close()
+        except Exception as exc:
+            logger.warning(f"Erro ao fechar conexão {reason}: {exc}")
 
     async def close_all(self) -> None:
-        """Closes all pooled connections."""
-        async with self._lock:
-            for conn in self._pool:
-                try:
-                    await conn.close()
-                except Exception as exc:
-                    logger.warning(f"Erro ao fechar conexão do pool: {exc}")
-            self._pool.clear()
-            logger.info("Pool de conexões fechado")
+        """Closes all idle pooled connections."""
+        while True:
+            try:
+                idle = self._idle.get_nowait()
+            except asyncio.QueueEmpty:
+                break
+            await self._discard(idle.conn, "do pool")
+        logger.info("Pool de conexões fechado")
 
 
 class DatabaseAdapter:
-    """Async SQLite adapter with shared pools and query helpers."""
+    """
+    Async SQLite adapter with shared pools and query helpers.
 
-    _pools: Dict[str, ConnectionPool] = {}
-    _pools_lock: Optional[asyncio.Lock] = None
+    WAL lets readers run alongside the single writer, so each database gets
+    two shared pools: ``pool_size`` read-only connections (``query_only=ON``)
+    and one writer connection. A slow FTS read never holds the writer slot.
+    """
 
-    @classmethod
-    def _get_pools_lock(cls) -> asyncio.Lock:
-        """Lazy initialization of the shared pool lock."""
-        if cls._pools_lock is None:
-            cls._pools_lock = asyncio.Lock()
-        return cls._pools_lock
+    _pools: Dict[tuple[str, str], ConnectionPool] = {}
 
     def __init__(self, db_path: str, pool_size: int = 5):
         self.db_path = db_path
         self.is_postgres = settings.database.is_postgres
         self.pool_size = pool_size
-        self.pool: ConnectionPool | None = None
+        self._reader_pool: ConnectionPool | None = None
+        self._writer_pool: ConnectionPool | None = None
         self._search = DatabaseSearchQueries(self)
         self._stats_cache: Optional[Dict[str, int]] = None
         self._stats_last_check_ts = 0.0
         logger.debug(f"DatabaseAdapter inicializado: {db_path}")
 
     async def _ensure_pool(self) -> None:
-        """Ensures the pool exists for this database path."""
-        if self.pool:
+        """Ensures the reader/writer pools exist for this database path."""
+        if self._reader_pool and self._writer_pool:
             return
 
         if not os.path.exists(self.db_path):
             raise DatabaseNotFoundError(self.db_path)
 
-        async with self._get_pools_lock():
-            if self.db_path not in self._pools:
-                self._pools[self.db_path] = ConnectionPool(self.db_path, self.pool_size)
-            self.pool = self._pools[self.db_path]
+        # Sem await daqui até o fim: o get-or-create é atômico no event loop,
+        # dispensando lock compartilhado.
+        reader_key = (self.db_path, "reader")
+        writer_key = (self.db_path, "writer")
+        if reader_key not in self._pools:
+            self._pools[reader_key] = ConnectionPool(
+                self.db_path, self.pool_size, read_only=True
+            )
+        if writer_key not in self._pools:
+            self._pools[writer_key] = ConnectionPool(self.db_path, 1)
+        self._reader_pool = self._pools[reader_key]
+        self._writer_pool = self._pools[writer_key]
 
     async def close(self) -> None:
         """Closes pooled connections."""
-        if self.pool:
-            await self.pool.close_all()
+        for pool in (self._reader_pool, self._writer_pool):
+            if pool:
+                await pool.close_all()
 
     @asynccontextmanager
-    async def get_connection(self):
-        """Async context manager for a pooled connection."""
+    async def _pooled_connection(self, role: str):
         await self._ensure_pool()
-        pool = self.pool
+        pool = self._reader_pool if role == "reader" else self._writer_pool
         if pool is None:
             raise DatabaseError("Pool de conexões não inicializado")
         conn = await pool.get()
@@ -140,29 +241,36 @@ class DatabaseAdapter:
         finally:
             await pool.release(conn)
 
+    def get_reader_connection(self):
+        """Async context manager for a pooled read-only connection."""
+        return self._pooled_connection("reader")
+
+    def get_writer_connection(self):
+        """Async context manager for the serialized writer connection."""
+        return self._pooled_connection("writer")
+
+    def get_connection(self):
+        """
+        Async context manager for a read/write connection (the writer).
+
+        Kept read/write for existing callers; read-only queries should use
+        ``get_reader_connection`` so they do not queue on the single writer.
+        """
+        return self.get_writer_connection()
+
     async def check_connection(self) -> Optional[Dict[str, int]]:
         """Checks the database integrity and returns basic stats."""
-        if not os.path.exists(self.db_path):
-            logger.warning(f"Banco não encontrado: {self.db_path}")
-            return None
-
+        # Sem os.path.exists aqui: _ensure_pool já faz a checagem (uma vez).
         try:
-            async with self.get_connection() as conn:
+            async with self.get_reader_connection() as conn:
                 await conn.execute("SELECT 1")
 
                 now = time.time()
                 if not self._stats_cache or (now - self._stats_last_check_ts) > 60:
-                    cursor = await conn.execute("SELECT COUNT(*) FROM chapters")
-                    chapter_row = await cursor.fetchone()
-                    if chapter_row is None:
-                        return None
-                    num_chapters = chapter_row[0]
-
-                    cursor = await conn.execute("SELECT COUNT(*) FROM positions")
-                    positions_row = await cursor.fetchone()
-                    if positions_row is None:
+                    counts = await self._table_counts(conn)
+                    if counts is None:
                         return None
-                    num_positions = positions_row[0]
+                    num_chapters, num_positions = counts
 
                     self._stats_cache = {
                         "chapters": num_chapters,
@@ -174,13 +282,41 @@ class DatabaseAdapter:
 
                 return self._stats_cache
 
+        except DatabaseNotFoundError:
+            logger.warning(f"Banco não encontrado: {self.db_path}")
+            return None
         except Exception as exc:
             logger.error(f"Erro ao verificar DB: {exc}")
             return None
 
+    @staticmethod
+    async def _table_counts(conn: aiosqlite.Connection) -> Optional[tuple[int, int]]:
+        """
+        (chapters, positions) row counts for the health check.
+
+        Reads the row estimates the build-time ANALYZE leaves in sqlite_stat1
+        (first integer of ``stat``); falls back to exact COUNT(*)s in one
+        statement when the DB was never analyzed.
+        """
+        try:
+            cursor = await conn.execute(_STAT1_COUNTS_SQL)
+            estimates = {
+                row[0]: int(row[1].split(" ", 1)[0]) for row in await cursor.fetchall()
+            }
+            if "chapters" in estimates and "positions" in estimates:
+                return estimates["chapters"], estimates["positions"]
+        except (aiosqlite.Error, ValueError, AttributeError):
+            logger.debug("sqlite_stat1 indisponível, usando COUNT(*)", exc_info=True)
+
+        cursor = await conn.execute(_EXACT_COUNTS_SQL)
+        row = await cursor.fetchone()
+        if row is None:
+            return None
+        return row[0], row[1]
+
     async def get_all_chapters_list(self) -> List[str]:
         """Returns the ordered list of chapter numbers."""
-        async with self.get_connection() as conn:
+        async with self.get_reader_connection() as conn:
             cursor = await conn.execute(
                 "SELECT chapter_num FROM chapters ORDER BY chapter_num"
             )
@@ -215,7 +351,7 @@ class DatabaseAdapter:
 
     async def fts_search_near(
         self, words: List[str], distance: int, limit: int
-    ) -> List[Dict[str, Any]]:
+    ) -> List[aiosqlite.Row]:
         return await self._search.fts_search_near(words, distance, limit)
 
     @staticmethod
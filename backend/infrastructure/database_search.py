@@ -3,33 +3,119 @@
 from __future__ import annotations
 
 import os
-from typing import Any, Dict, Optional, TYPE_CHECKING
+import re
+import time
+from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import Any, ClassVar, Dict, Optional, TYPE_CHECKING, cast
 
 import aiosqlite
+import orjson
 
 from ..config.constants import SearchConfig
 from ..config.db_schema import CHAPTER_NOTES_SECTION_COLUMNS
 from ..config.exceptions import DatabaseError
 from ..config.logging_config import db_logger as logger
-from .schema_cache import SchemaCache
+from .schema_cache import DatabaseSignature, SchemaCache
 
 if TYPE_CHECKING:
     from .database import DatabaseAdapter
 
 
+_PROBED_TABLES = ("chapter_notes", "positions", "search_index")
+# Um único os.stat por janela, compartilhado pelos caches de schema.
+_DB_SIGNATURE_TTL_SECONDS = 1.0
+_LEADING_INT_RE = re.compile(r"\s*([+-]?\d+)")
+# Posição das seções no SELECT de _build_chapter_sql (após chapter_num,
+# content, notes_content e parsed_notes_json): fatia posicional do Row.
+_CHAPTER_SECTIONS_SLICE = slice(4, 4 + len(CHAPTER_NOTES_SECTION_COLUMNS))
+
+
+def _leading_int(segment: str) -> int:
+    # Mesma semântica de CAST(... AS INTEGER) do SQLite: prefixo numérico ou 0.
+    match = _LEADING_INT_RE.match(segment)
+    return int(match.group(1)) if match else 0
+
+
+def _position_sort_key(codigo: str) -> tuple[int, int, int]:
+    """
+    Numeric (major, minor, subminor) key so 2- and 3-part HS/NCM codes order
+    deterministically ("85.9" < "85.10").
+
+    Alternative if chapters grow large: a STORED generated ``sort_key``
+    column on ``positions`` with an index, ordering in SQL instead.
+    """
+    parts = codigo.split(".", 3)
+    parts += [""] * (3 - len(parts))
+    return _leading_int(parts[0]), _leading_int(parts[1]), _leading_int(parts[2])
+
+
+@dataclass(slots=True)
+class _SchemaState:
+    """Schema probes and derived SQL shared by every query helper of one DB file."""
+
+    fts_schema_cache: SchemaCache[Dict[str, Any]] = field(default_factory=SchemaCache)
+    # Uma única sonda preenche as colunas de todas as tabelas de uma vez.
+    table_columns_cache: SchemaCache[Dict[str, frozenset[str]]] = field(
+        default_factory=SchemaCache
+    )
+    fts_sql_cache: Dict[tuple[str, bool], str] = field(default_factory=dict)
+    db_signature_cache: tuple[float, DatabaseSignature] | None = None
+
+
+@lru_cache(maxsize=8)
+def _build_chapter_sql(
+    has_sections: bool, has_parsed_notes_json: bool, has_anchor_id: bool
+) -> str:
+    """Chapter SELECT per schema shape (8 possible strings, shared by all instances)."""
+    section_select = ", ".join(f"cn.{col}" for col in CHAPTER_NOTES_SECTION_COLUMNS)
+    null_section_select = ", ".join(
+        f"NULL AS {col}" for col in CHAPTER_NOTES_SECTION_COLUMNS
+    )
+    parsed_notes_select = (
+        "cn.parsed_notes_json" if has_parsed_notes_json else "NULL AS parsed_notes_json"
+    )
+    section_projection = section_select if has_sections else null_section_select
+    notes_select = f"cn.notes_content, {parsed_notes_select}, {section_projection}"
+    anchor_value = "p.anchor_id" if has_anchor_id else "NULL"
+    # Posições agregadas em JSON na mesma query: um único prepare/step e
+    # um único hop pela thread do aiosqlite por capítulo.
+    return f"""SELECT
+                c.chapter_num,
+                c.content,
+                {notes_select},
+                (
+                    SELECT json_group_array(json_object(
+                        'codigo', p.codigo,
+                        'descricao', p.descricao,
+                        'anchor_id', {anchor_value}
+                    ))
+                    FROM positions p
+                    WHERE p.chapter_num = c.chapter_num
+                      AND p.codigo IS NOT NULL
+                ) AS positions_json
+            FROM chapters c
+            LEFT JOIN chapter_notes cn ON c.chapter_num = cn.chapter_num
+            WHERE c.chapter_num = ?"""  # nosec B608 - projection is built from fixed columns
+
+
 class DatabaseSearchQueries:
     """Encapsulates schema probes and FTS/content queries."""
 
     _FTS_RESERVED_OPERATORS = {"AND", "OR", "NOT", "NEAR"}
+    # Como DatabaseAdapter._pools: um estado por arquivo, compartilhado entre
+    # instâncias, para que novos adapters não repitam as sondas de schema.
+    _schema_states: ClassVar[Dict[str, _SchemaState]] = {}
 
     def __init__(self, adapter: "DatabaseAdapter") -> None:
         self._adapter = adapter
-        self._fts_schema_cache: SchemaCache[Dict[str, Any]] = SchemaCache()
-        self._chapter_notes_schema_cache: SchemaCache[set[str]] = SchemaCache()
-        self._positions_schema_cache: SchemaCache[set[str]] = SchemaCache()
-        self._chapter_sql_cache: Optional[str] = None
-        self._chapter_sql_has_sections: Optional[bool] = None
-        self._chapter_sql_has_parsed_notes_json: Optional[bool] = None
+        state = self._schema_states.get(adapter.db_path)
+        if state is None:
+            state = self._schema_states[adapter.db_path] = _SchemaState()
+        self._state = state
+        self._fts_schema_cache = state.fts_schema_cache
+        self._table_columns_cache = state.table_columns_cache
+        self._fts_sql_cache = state.fts_sql_cache
 
     def _get_db_signature(self) -> tuple[int, int, int, int] | None:
         try:
@@ -43,21 +129,74 @@ class DatabaseSearchQueries:
         except OSError:
             return None
 
-    async def _detect_fts_schema(self, conn: aiosqlite.Connection) -> Dict[str, Any]:
+    def _get_db_signature_cached(self) -> DatabaseSignature:
+        """``_get_db_signature`` reused for ``_DB_SIGNATURE_TTL_SECONDS``.
+
+        Sync and await-free, so it is atomic on the event loop without a lock.
+        """
+        now = time.monotonic()
+        cached = self._state.db_signature_cache
+        if cached is not None and now - cached[0] < _DB_SIGNATURE_TTL_SECONDS:
+            return cached[1]
+        signature = self._get_db_signature()
+        self._state.db_signature_cache = (now, signature)
+        return signature
+
+    async def _load_table_columns(
+        self, conn: aiosqlite.Connection
+    ) -> Dict[str, frozenset[str]]:
+        """Columns of every probed table in one statement (pragma_table_info join)."""
+        placeholders = ", ".join("?" for _ in _PROBED_TABLES)
         try:
             cursor = await conn.execute(
-                "SELECT 1 FROM sqlite_master WHERE type='table' AND name='search_index' LIMIT 1"
+                f"""
+                SELECT m.name AS table_name, p.name AS column_name
+                FROM sqlite_master AS m, pragma_table_info(m.name) AS p
+                WHERE m.type = 'table' AND m.name IN ({placeholders})
+                """,  # nosec B608 - placeholders only
+                _PROBED_TABLES,
             )
-            if not await cursor.fetchone():
+            rows = await cursor.fetchall()
+        except Exception as exc:
+            logger.warning(f"Falha ao inspecionar schema: {exc}")
+            return {}
+
+        columns: Dict[str, set[str]] = {}
+        for row in rows:
+            columns.setdefault(row["table_name"], set()).add(row["column_name"])
+        return {table: frozenset(cols) for table, cols in columns.items()}
+
+    @staticmethod
+    async def _read_schema_version(conn: aiosqlite.Connection) -> int | None:
+        # Header do arquivo: só muda com DDL, e é comparável entre conexões
+        # (ao contrário de data_version, que é por conexão e muda a cada escrita).
+        try:
+            cursor = await conn.execute("PRAGMA schema_version")
+            row = await cursor.fetchone()
+        except Exception:
+            logger.debug("PRAGMA schema_version indisponível", exc_info=True)
+            return None
+        return row[0] if row else None
+
+    async def _get_table_columns_cached(
+        self, conn: aiosqlite.Connection
+    ) -> Dict[str, frozenset[str]]:
+        return await self._table_columns_cache.get_or_load(
+            load=lambda: self._load_table_columns(conn),
+            resolve_db_signature=self._get_db_signature_cached,
+            resolve_schema_version=lambda: self._read_schema_version(conn),
+        )
+
+    async def _detect_fts_schema(self, conn: aiosqlite.Connection) -> Dict[str, Any]:
+        try:
+            table_columns = await self._get_table_columns_cached(conn)
+            cols = table_columns.get("search_index")
+            if cols is None:
                 return {
                     "available": False,
                     "reason": "Tabela FTS 'search_index' não encontrada",
                 }
 
-            cursor = await conn.execute("PRAGMA table_info(search_index)")
-            rows = await cursor.fetchall()
-            cols = {row["name"] for row in rows}
-
             if "indexed_content" in cols:
                 content_column = "indexed_content"
             elif "description" in cols:
@@ -95,52 +234,28 @@ class DatabaseSearchQueries:
     ) -> Dict[str, Any]:
         return await self._fts_schema_cache.get_or_load(
             load=lambda: self._detect_fts_schema(conn),
-            resolve_db_signature=self._get_db_signature,
+            resolve_db_signature=self._get_db_signature_cached,
+            resolve_schema_version=lambda: self._read_schema_version(conn),
         )
 
-    async def _get_chapter_notes_columns(self, conn: aiosqlite.Connection) -> set[str]:
-        try:
-            cursor = await conn.execute("PRAGMA table_info(chapter_notes)")
-            rows = await cursor.fetchall()
-            return {row["name"] for row in rows}
-        except Exception as exc:
-            logger.warning(f"Falha ao inspecionar chapter_notes: {exc}")
-            return set()
-
     async def _get_chapter_notes_columns_cached(
         self, conn: aiosqlite.Connection
-    ) -> set[str]:
-        return await self._chapter_notes_schema_cache.get_or_load(
-            load=lambda: self._get_chapter_notes_columns(conn),
-            resolve_db_signature=self._get_db_signature,
-        )
-
-    async def _get_positions_columns(self, conn: aiosqlite.Connection) -> set[str]:
-        try:
-            cursor = await conn.execute("PRAGMA table_info(positions)")
-            rows = await cursor.fetchall()
-            return {row["name"] for row in rows}
-        except Exception as exc:
-            logger.warning(f"Falha ao inspecionar positions: {exc}")
-            return set()
+    ) -> frozenset[str]:
+        table_columns = await self._get_table_columns_cached(conn)
+        return table_columns.get("chapter_notes", frozenset())
 
     async def _get_positions_columns_cached(
         self, conn: aiosqlite.Connection
-    ) -> set[str]:
-        return await self._positions_schema_cache.get_or_load(
-            load=lambda: self._get_positions_columns(conn),
-            resolve_db_signature=self._get_db_signature,
-        )
+    ) -> frozenset[str]:
+        table_columns = await self._get_table_columns_cached(conn)
+        return table_columns.get("positions", frozenset())
 
     @staticmethod
     def _has_section_content(sections: Dict[str, Optional[str]]) -> bool:
-        for value in sections.values():
-            if isinstance(value, str):
-                if value.strip():
-                    return True
-            elif value:
-                return True
-        return False
+        return any(
+            value.strip() if isinstance(value, str) else value
+            for value in sections.values()
+        )
 
     @staticmethod
     def _fts_rank_sql(schema: Dict[str, Any]) -> Dict[str, str]:
@@ -148,37 +263,22 @@ class DatabaseSearchQueries:
             return {"select": "rank", "order": "rank"}
         return {"select": "bm25(search_index) AS rank", "order": "bm25(search_index)"}
 
-    def _build_chapter_sql(
-        self, has_sections: bool, has_parsed_notes_json: bool
-    ) -> str:
-        if (
-            self._chapter_sql_cache is not None
-            and self._chapter_sql_has_sections == has_sections
-            and self._chapter_sql_has_parsed_notes_json == has_parsed_notes_json
-        ):
-            return self._chapter_sql_cache
-
-        section_select = ", ".join(f"cn.{col}" for col in CHAPTER_NOTES_SECTION_COLUMNS)
-        null_section_select = ", ".join(
-            f"NULL AS {col}" for col in CHAPTER_NOTES_SECTION_COLUMNS
-        )
-        parsed_notes_select = (
-            "cn.parsed_notes_json"
-            if has_parsed_notes_json
-            else "NULL AS parsed_notes_json"
-        )
-        section_projection = section_select if has_sections else null_section_select
-        notes_select = f"cn.notes_content, {parsed_notes_select}, {section_projection}"
-        sql = f"""SELECT
-                    c.chapter_num,
-                    c.content,
-                    {notes_select}
-                FROM chapters c
-                LEFT JOIN chapter_notes cn ON c.chapter_num = cn.chapter_num
-                WHERE c.chapter_num = ?"""  # nosec B608 - projection is built from fixed columns
-        self._chapter_sql_cache = sql
-        self._chapter_sql_has_sections = has_sections
-        self._chapter_sql_has_parsed_notes_json = has_parsed_notes_json
+    def _build_fts_sql(self, schema: Dict[str, Any]) -> str:
+        content_col = schema["content_column"]
+        cache_key = (content_col, bool(schema.get("supports_rank")))
+        sql = self._fts_sql_cache.get(cache_key)
+        if sql is not None:
+            return sql
+
+        rank_sql = self._fts_rank_sql(schema)
+        sql = f"""
+            SELECT ncm, display_text, type, description, {rank_sql["select"]}
+            FROM search_index
+            WHERE {content_col} MATCH ?
+            ORDER BY {rank_sql["order"]}
+            LIMIT ?
+        """  # nosec B608 - content_col/rank_sql come from validated schema
+        self._fts_sql_cache[cache_key] = sql
         return sql
 
     @staticmethod
@@ -216,7 +316,7 @@ class DatabaseSearchQueries:
         limit: int,
         *,
         raise_on_unavailable: bool,
-    ) -> list[Dict[str, Any]]:
+    ) -> list[aiosqlite.Row]:
         if not isinstance(limit, int) or isinstance(limit, bool) or limit < 0:
             raise ValueError("FTS limit must be a non-negative integer")
 
@@ -232,30 +332,23 @@ class DatabaseSearchQueries:
                 raise DatabaseError(msg)
             return []
 
-        content_col = schema["content_column"]
-        rank_sql = self._fts_rank_sql(schema)
-        cursor = await conn.execute(
-            f"""
-            SELECT ncm, display_text, type, description, {rank_sql["select"]}
-            FROM search_index
-            WHERE {content_col} MATCH ?
-            ORDER BY {rank_sql["order"]}
-            LIMIT ?
-        """,  # nosec B608 - content_col/rank_sql come from validated schema
-            (query, safe_limit),
-        )
-        rows = await cursor.fetchall()
-        return [dict(row) for row in rows]
+        # Mesmo objeto SQL por schema: o statement cache do sqlite3 sempre acerta.
+        cursor = await conn.execute(self._build_fts_sql(schema), (query, safe_limit))
+        # Rows crus: cada chamador materializa só o que precisa.
+        return cast(list[aiosqlite.Row], await cursor.fetchall())
 
     async def get_chapter_raw(self, chapter_num: str) -> Optional[Dict[str, Any]]:
         logger.debug(f"Buscando capítulo: {chapter_num}")
 
-        async with self._adapter.get_connection() as conn:
+        async with self._adapter.get_reader_connection() as conn:
             notes_cols = await self._get_chapter_notes_columns_cached(conn)
             expected_sections = set(CHAPTER_NOTES_SECTION_COLUMNS)
             has_sections = expected_sections.issubset(notes_cols)
             has_parsed_notes_json = "parsed_notes_json" in notes_cols
-            chapter_sql = self._build_chapter_sql(has_sections, has_parsed_notes_json)
+            position_cols = await self._get_positions_columns_cached(conn)
+            chapter_sql = _build_chapter_sql(
+                has_sections, has_parsed_notes_json, "anchor_id" in position_cols
+            )
             cursor = await conn.execute(chapter_sql, (chapter_num,))
 
             first_row = await cursor.fetchone()
@@ -263,65 +356,14 @@ class DatabaseSearchQueries:
                 logger.debug(f"Capítulo {chapter_num} não encontrado")
                 return None
 
-            position_cols = await self._get_positions_columns_cached(conn)
-            has_anchor_id = "anchor_id" in position_cols
-            anchor_projection = "anchor_id" if has_anchor_id else "NULL AS anchor_id"
+            # Ordenação numérica por segmentos em Python (ver _position_sort_key).
+            positions = orjson.loads(first_row["positions_json"] or "[]")
+            positions.sort(key=lambda pos: _position_sort_key(pos["codigo"]))
 
-            cursor = await conn.execute(
-                f"""
-                SELECT codigo, descricao, {anchor_projection}
-                FROM positions
-                WHERE chapter_num = ?
-                -- Sort code segments numerically (major.minor.subminor)
-                -- so 2-part and 3-part HS/NCM codes keep deterministic order.
-                ORDER BY
-                    CAST(COALESCE(NULLIF(SUBSTR(codigo, 1, INSTR(codigo || '.', '.') - 1), ''), '0') AS INTEGER),
-                    CAST(COALESCE(NULLIF(
-                        SUBSTR(
-                            SUBSTR(codigo, INSTR(codigo || '.', '.') + 1),
-                            1,
-                            INSTR(SUBSTR(codigo, INSTR(codigo || '.', '.') + 1) || '.', '.') - 1
-                        ),
-                        ''
-                    ), '0') AS INTEGER),
-                    CAST(COALESCE(NULLIF(
-                        SUBSTR(
-                            SUBSTR(
-                                SUBSTR(codigo, INSTR(codigo || '.', '.') + 1),
-                                INSTR(SUBSTR(codigo, INSTR(codigo || '.', '.') + 1) || '.', '.') + 1
-                            ),
-                            1,
-                            INSTR(
-                                SUBSTR(
-                                    SUBSTR(codigo, INSTR(codigo || '.', '.') + 1),
-                                    INSTR(SUBSTR(codigo, INSTR(codigo || '.', '.') + 1) || '.', '.') + 1
-                                ) || '.',
-                                '.'
-                            ) - 1
-                        ),
-                        ''
-                    ), '0') AS INTEGER)
-            """,  # nosec B608 - anchor_projection is whitelist-driven
-                (chapter_num,),
+            logger.debug(f"Capítulo {chapter_num}: {len(positions)} posições (1 query)")
+            sections_map: Dict[str, Any] = dict(
+                zip(CHAPTER_NOTES_SECTION_COLUMNS, first_row[_CHAPTER_SECTIONS_SLICE])
             )
-            pos_rows = await cursor.fetchall()
-
-            positions = [
-                {
-                    "codigo": row["codigo"],
-                    "descricao": row["descricao"],
-                    "anchor_id": row["anchor_id"],
-                }
-                for row in pos_rows
-                if row["codigo"] is not None
-            ]
-
-            logger.debug(
-                f"Capítulo {chapter_num}: {len(positions)} posições (2 queries)"
-            )
-            sections_map: Dict[str, Any] = {
-                col: first_row[col] for col in CHAPTER_NOTES_SECTION_COLUMNS
-            }
             sections: Optional[Dict[str, Any]] = sections_map
             if not self._has_section_content(sections_map):
                 sections = None
@@ -341,13 +383,14 @@ class DatabaseSearchQueries:
         logger.debug(f"FTS search: '{query}'")
         result_limit = limit if limit is not None else SearchConfig.MAX_FTS_RESULTS
 
-        async with self._adapter.get_connection() as conn:
-            return await self._execute_fts_query(
+        async with self._adapter.get_reader_connection() as conn:
+            rows = await self._execute_fts_query(
                 conn,
                 query,
                 result_limit,
                 raise_on_unavailable=True,
             )
+        return [dict(row) for row in rows]
 
     async def fts_search_scored(
         self,
@@ -367,7 +410,7 @@ class DatabaseSearchQueries:
 
         logger.debug(f"FTS scored search tier {tier}: '{query}'")
 
-        async with self._adapter.get_connection() as conn:
+        async with self._adapter.get_reader_connection() as conn:
             rows = await self._execute_fts_query(
                 conn,
                 query,
@@ -377,18 +420,26 @@ class DatabaseSearchQueries:
 
         results: list[Dict[str, Any]] = []
         for row in rows:
-            result = dict(row)
-            bm25_normalized = min(100, max(0, -result["rank"] * 10))
-            result["score"] = round(base + bm25_normalized + coverage_bonus, 1)
-            result["tier"] = tier
-            results.append(result)
+            rank = row["rank"]
+            bm25_normalized = min(100, max(0, -rank * 10))
+            results.append(
+                {
+                    "ncm": row["ncm"],
+                    "display_text": row["display_text"],
+                    "type": row["type"],
+                    "description": row["description"],
+                    "rank": rank,
+                    "score": round(base + bm25_normalized + coverage_bonus, 1),
+                    "tier": tier,
+                }
+            )
 
         logger.debug(f"FTS tier {tier} retornou {len(results)} resultados")
         return results
 
     async def fts_search_near(
         self, words: list[str], distance: int, limit: int
-    ) -> list[Dict[str, Any]]:
+    ) -> list[aiosqlite.Row]:
         if len(words) < 2:
             return []
 
@@ -402,7 +453,7 @@ class DatabaseSearchQueries:
         logger.debug(f"FTS NEAR search: '{near_query}'")
 
         try:
-            async with self._adapter.get_connection() as conn:
+            async with self._adapter.get_reader_connection() as conn:
                 results = await self._execute_fts_query(
                     conn,
                     near_query,
@@ -9,17 +9,45 @@ Este módulo fornece:
 
 from contextlib import asynccontextmanager
 from contextvars import ContextVar
-from typing import AsyncGenerator
+from typing import AsyncGenerator, Awaitable, Callable
 
-from sqlalchemy import text
+from sqlalchemy import event, text
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlmodel import SQLModel
 
+from ..config.logging_config import db_logger as logger
 from ..config.settings import settings
 
 # ContextVar para rastrear o tenant_id na requisição atual
 tenant_context: ContextVar[str] = ContextVar("tenant_context", default="")
 
+# Callbacks assíncronos registrados na sessão para rodar após o COMMIT
+_AFTER_COMMIT_KEY = "after_commit_callbacks"
+
+# set_config padrão: vale só para a transação da sessão (is_local=true)
+_SET_TENANT_LOCAL_SQL = text("SELECT set_config('app.current_tenant', :tid, true)")
+# Modo opcional postgres_tenant_session_scope: set_config de sessão, lembrado
+# na conexão DBAPI via connection.info
+_TENANT_INFO_KEY = "app.current_tenant"
+_SET_TENANT_SESSION_SQL = text("SELECT set_config('app.current_tenant', :tid, false)")
+
+
+def _forget_tenant(conn, *args) -> None:
+    """
+    Esquece o tenant lembrado a cada rollback.
+
+    Um set_config feito na transação revertida é desfeito junto; como o
+    evento não diz em qual transação ele foi aplicado, reenviamos sempre.
+    """
+    conn.info.pop(_TENANT_INFO_KEY, None)
+
+
+def _track_tenant_invalidation(engine) -> None:
+    # Cobre também o rollback implícito de Connection.close(); conexões
+    # invalidadas/recriadas pelo pool já começam com info vazio.
+    event.listen(engine.sync_engine, "rollback", _forget_tenant)
+    event.listen(engine.sync_engine, "rollback_savepoint", _forget_tenant)
+
 
 def _create_engine():
     """
@@ -31,7 +59,7 @@ def _create_engine():
     db_url = settings.database.async_url
 
     if settings.database.is_postgres:
-        return create_async_engine(
+        engine = create_async_engine(
             db_url,
             echo=settings.features.debug_mode,
             pool_pre_ping=True,
@@ -40,6 +68,9 @@ def _create_engine():
             pool_recycle=3600,  # Recicla conexões a cada 1h
             pool_timeout=30,  # Timeout de 30s para obter conexão do pool
         )
+        if settings.database.postgres_tenant_session_scope:
+            _track_tenant_invalidation(engine)
+        return engine
     else:
         # SQLite - pool limitado
         return create_async_engine(
@@ -89,6 +120,38 @@ async def close_db():
         _engine = None
 
 
+async def _apply_tenant(session: AsyncSession, tid: str) -> None:
+    conn = await session.connection()
+    if not settings.database.postgres_tenant_session_scope:
+        await conn.execute(_SET_TENANT_LOCAL_SQL, {"tid": tid})
+        return
+    if conn.info.get(_TENANT_INFO_KEY, "") == tid:
+        return
+    await conn.execute(_SET_TENANT_SESSION_SQL, {"tid": tid})
+    conn.info[_TENANT_INFO_KEY] = tid
+
+
+def run_after_commit(
+    session: AsyncSession, callback: Callable[[], Awaitable[None]]
+) -> None:
+    """
+    Agenda ``callback`` para depois do COMMIT feito por ``get_session``.
+
+    Útil para invalidar caches: invalidar antes do commit deixa uma leitura
+    concorrente recachear o estado antigo. Descartado em caso de rollback.
+    """
+    session.info.setdefault(_AFTER_COMMIT_KEY, []).append(callback)
+
+
+async def _run_after_commit_callbacks(session: AsyncSession) -> None:
+    for callback in session.info.pop(_AFTER_COMMIT_KEY, ()):
+        try:
+            await callback()
+        except Exception as exc:
+            # O commit já aconteceu: falha aqui não pode virar erro da requisição.
+            logger.warning(f"Callback pós-commit falhou: {exc}")
+
+
 @asynccontextmanager
 async def get_session() -> AsyncGenerator[AsyncSession, None]:
     """
@@ -100,21 +163,20 @@ async def get_session() -> AsyncGenerator[AsyncSession, None]:
     """
     session_maker = get_session_maker()
     async with session_maker() as session:
-        # Se estivermos em Postgres, injetamos o tenant_id na sessão para o RLS
-        tid = tenant_context.get()
-        if settings.database.is_postgres and tid:
-            # check_function_bodies=off evita overhead de validação em cada set
-            await session.execute(
-                text("SELECT set_config('app.current_tenant', :tid, true)"),
-                {"tid": tid},
-            )
+        # Se estivermos em Postgres, injetamos o tenant_id na transação para o
+        # RLS ("" equivale a sem tenant). Com postgres_tenant_session_scope o
+        # valor fica na conexão e só é reenviado quando muda.
+        if settings.database.is_postgres:
+            await _apply_tenant(session, tenant_context.get())
 
         try:
             yield session
             await session.commit()
         except Exception:
+            session.info.pop(_AFTER_COMMIT_KEY, None)
             await session.rollback()
             raise
+        await _run_after_commit_callbacks(session)
 
 
 async def get_db() -> AsyncGenerator[AsyncSession, None]:
@@ -6,6 +6,7 @@ from __future__ import annotations
 
 import asyncio
 import hashlib
+import zlib
 from dataclasses import dataclass, field
 from time import perf_counter
 from types import SimpleNamespace
@@ -18,12 +19,59 @@ try:
 
     _REDIS_AVAILABLE = True
 except ImportError:  # pragma: no cover - optional dependency
-    aioredis = SimpleNamespace(from_url=None)
+    aioredis = SimpleNamespace(Redis=None, BlockingConnectionPool=None)
     _REDIS_AVAILABLE = False
 
 from backend.config.logging_config import service_logger as logger
 from backend.config.settings import settings
 
+# Chaves não-str (ex.: int) são serializadas em Rust em vez de cair no except.
+_DUMP_OPTS = orjson.OPT_NON_STR_KEYS
+
+
+# Payloads JSON a partir deste tamanho vão comprimidos com zlib. O header zlib
+# começa com 0x78 ("x"), byte que nunca abre um JSON válido: serve de marcador.
+_COMPRESS_MIN_BYTES = 512
+_ZLIB_MAGIC = b"x"
+
+
+def _compress_payload(payload: bytes) -> bytes:
+    if len(payload) < _COMPRESS_MIN_BYTES:
+        return payload
+    compressed = zlib.compress(payload, 1)
+    return compressed if len(compressed) < len(payload) else payload
+
+
+def _decompress_payload(payload: bytes) -> bytes:
+    if payload[:1] == _ZLIB_MAGIC:
+        return zlib.decompress(payload)
+    return payload
+
+
+def _chapter_hash_key(chapter_num: str) -> str:
+    # Chave própria: alternar chapter_hash_mode nunca esbarra em WRONGTYPE.
+    return f"nesh:chapter-hash:{chapter_num}"
+
+
+def _decode_hash(fields: Dict[Any, bytes]) -> Optional[Dict[str, Any]]:
+    if not fields:
+        return None  # HGETALL de chave ausente devolve {}
+    return {
+        (name.decode() if isinstance(name, bytes) else name): orjson.loads(
+            _decompress_payload(payload)
+        )
+        for name, payload in fields.items()
+    }
+
+
+def _orjson_default(value: Any) -> Any:
+    """Fallback só para modelos Pydantic/SQLModel; o resto segue nativo no orjson."""
+    model_dump = getattr(value, "model_dump", None)
+    if model_dump is None:
+        raise TypeError(f"Type is not JSON serializable: {type(value).__name__}")
+    return model_dump(mode="json")
+
+
 REDIS_CONSUME_ONCE_SCRIPT = """
 local value = redis.call('GET', KEYS[1])
 if value then
@@ -50,6 +98,10 @@ class RedisCache:
     _inflight_lock: asyncio.Lock = field(default_factory=asyncio.Lock, repr=False)
     _cache_version_prefix: str = field(default="meta:catalog-version", repr=False)
     _default_stale_ttl: int = field(default=60, repr=False)
+    comment_anchors_ttl: int = 30
+    chapter_hash_mode: bool = False
+    max_connections: int = 50
+    pool_timeout: float = 1.0
 
     async def connect(self) -> None:
         if not self.enabled:
@@ -59,13 +111,21 @@ class RedisCache:
             return
         if self._client is not None:
             return
-        self._client = aioredis.from_url(  # type: ignore[union-attr]
+        # Pool bloqueante: sob rajada, espera até pool_timeout por uma conexão
+        # livre em vez de abrir sockets novos sem limite (backpressure).
+        pool = aioredis.BlockingConnectionPool.from_url(  # type: ignore[union-attr]
             self.url,
+            max_connections=self.max_connections,
+            timeout=self.pool_timeout,
             decode_responses=False,
             socket_connect_timeout=2,
             socket_timeout=1,
+            socket_keepalive=True,
             health_check_interval=30,
         )
+        self._client = aioredis.Redis(  # type: ignore[union-attr]
+            connection_pool=pool
+        )
         try:
             await self._client.ping()
             logger.info("Redis connected")
@@ -77,9 +137,9 @@ class RedisCache:
         if self._client is None:
             return
         try:
-            await (
-                self._client.aclose()
-            )  # aclose() is the non-deprecated path since redis 5.0.1
+            # aclose() is the non-deprecated path since redis 5.0.1; o pool foi
+            # passado explicitamente, então precisa ser fechado junto.
+            await self._client.aclose(close_connection_pool=True)
         except Exception as exc:
             logger.warning("Redis close failed: %s", exc)
         finally:
@@ -96,7 +156,7 @@ class RedisCache:
             payload = await self._client.get(key)
             if payload is None:
                 return None
-            return orjson.loads(payload)
+            return orjson.loads(_decompress_payload(payload))
         except Exception as exc:
             logger.debug("Redis get failed (%s): %s", key, exc)
             return None
@@ -105,7 +165,9 @@ class RedisCache:
         if self._client is None:
             return
         try:
-            payload = orjson.dumps(value)
+            payload = _compress_payload(
+                orjson.dumps(value, default=_orjson_default, option=_DUMP_OPTS)
+            )
             if self.max_payload_bytes > 0 and len(payload) > self.max_payload_bytes:
                 logger.debug(
                     "Redis set skipped (%s): payload too large (%s > %s bytes)",
@@ -118,6 +180,20 @@ class RedisCache:
         except Exception as exc:
             logger.debug("Redis set failed (%s): %s", key, exc)
 
+    async def mget_json(self, keys: List[str]) -> List[Any]:
+        """Batch ``get_json``: one MGET round-trip, ``None`` for misses."""
+        if self._client is None or not keys:
+            return [None] * len(keys)
+        try:
+            payloads = await self._client.mget(keys)
+            return [
+                orjson.loads(_decompress_payload(p)) if p is not None else None
+                for p in payloads
+            ]
+        except Exception as exc:
+            logger.debug("Redis mget failed (%s keys): %s", len(keys), exc)
+            return [None] * len(keys)
+
     async def delete(self, key: str) -> None:
         if self._client is None:
             return
@@ -460,11 +536,94 @@ class RedisCache:
         )
 
     async def get_chapter(self, chapter_num: str) -> Optional[Dict[str, Any]]:
+        if self.chapter_hash_mode:
+            return await self._get_hash_json(_chapter_hash_key(chapter_num))
         return await self.get_json(f"nesh:chapter:{chapter_num}")
 
     async def set_chapter(self, chapter_num: str, value: Dict[str, Any]) -> None:
+        if self.chapter_hash_mode:
+            await self.set_chapter_hash(chapter_num, value)
+            return
         await self.set_json(f"nesh:chapter:{chapter_num}", value, self.chapter_ttl)
 
+    async def get_chapters(
+        self, chapter_nums: List[str]
+    ) -> List[Optional[Dict[str, Any]]]:
+        if self.chapter_hash_mode:
+            return await self._get_hashes_json(
+                [_chapter_hash_key(num) for num in chapter_nums]
+            )
+        return await self.mget_json([f"nesh:chapter:{num}" for num in chapter_nums])
+
+    async def set_chapter_hash(self, chapter_num: str, mapping: Dict[str, Any]) -> None:
+        """Grava o capítulo como HASH (um campo JSON por chave) + EXPIRE."""
+        key = _chapter_hash_key(chapter_num)
+        if self._client is None or not mapping:
+            return
+        try:
+            fields = {
+                name: _compress_payload(
+                    orjson.dumps(value, default=_orjson_default, option=_DUMP_OPTS)
+                )
+                for name, value in mapping.items()
+            }
+            total = sum(len(payload) for payload in fields.values())
+            if self.max_payload_bytes > 0 and total > self.max_payload_bytes:
+                logger.debug(
+                    "Redis hset skipped (%s): payload too large (%s > %s bytes)",
+                    key,
+                    total,
+                    self.max_payload_bytes,
+                )
+                return
+            async with self._client.pipeline(transaction=True) as pipe:
+                pipe.delete(key)
+                pipe.hset(key, mapping=fields)
+                pipe.expire(key, self.chapter_ttl)
+                await pipe.execute()
+        except Exception as exc:
+            logger.debug("Redis hset failed (%s): %s", key, exc)
+
+    async def get_chapter_fields(
+        self, chapter_num: str, fields: List[str]
+    ) -> Optional[Dict[str, Any]]:
+        """HMGET só dos campos pedidos; ``None`` se o capítulo não está no HASH."""
+        if self._client is None or not fields:
+            return None
+        key = _chapter_hash_key(chapter_num)
+        try:
+            payloads = await self._client.hmget(key, fields)
+            if all(payload is None for payload in payloads):
+                return None
+            return {
+                name: (
+                    orjson.loads(_decompress_payload(payload))
+                    if payload is not None
+                    else None
+                )
+                for name, payload in zip(fields, payloads)
+            }
+        except Exception as exc:
+            logger.debug("Redis hmget failed (%s): %s", key, exc)
+            return None
+
+    async def _get_hash_json(self, key: str) -> Optional[Dict[str, Any]]:
+        (value,) = await self._get_hashes_json([key])
+        return value
+
+    async def _get_hashes_json(self, keys: List[str]) -> List[Optional[Dict[str, Any]]]:
+        if self._client is None or not keys:
+            return [None] * len(keys)
+        try:
+            async with self._client.pipeline(transaction=False) as pipe:
+                for key in keys:
+                    pipe.hgetall(key)
+                results = await pipe.execute()
+            return [_decode_hash(fields) for fields in results]
+        except Exception as exc:
+            logger.debug("Redis hgetall failed (%s keys): %s", len(keys), exc)
+            return [None] * len(keys)
+
     async def get_fts(self, key: str) -> Optional[List[Any]]:
         return await self.get_json(f"nesh:fts:{key}")
 
@@ -515,6 +674,17 @@ class RedisCache:
     async def set_status_snapshot(self, scope: str, value: Dict[str, Any]) -> None:
         await self.set_json(f"system:status:{scope}", value, self.status_ttl)
 
+    async def get_comment_anchors(self, tenant_id: str) -> Optional[List[str]]:
+        return await self.get_json(f"nesh:comments:anchors:{tenant_id}")
+
+    async def set_comment_anchors(self, tenant_id: str, anchors: List[str]) -> None:
+        await self.set_json(
+            f"nesh:comments:anchors:{tenant_id}", anchors, self.comment_anchors_ttl
+        )
+
+    async def invalidate_comment_anchors(self, tenant_id: str) -> None:
+        await self.delete(f"nesh:comments:anchors:{tenant_id}")
+
 
 redis_cache = RedisCache(
     url=settings.cache.redis_url,
@@ -525,4 +695,8 @@ redis_cache = RedisCache(
     services_search_ttl=settings.cache.services_search_ttl,
     services_detail_ttl=settings.cache.services_detail_ttl,
     status_ttl=settings.cache.status_cache_ttl,
+    comment_anchors_ttl=settings.cache.comment_anchors_ttl,
+    chapter_hash_mode=settings.cache.chapter_hash_mode,
+    max_connections=settings.cache.redis_max_connections,
+    pool_timeout=settings.cache.redis_pool_timeout,
 )
@@ -22,8 +22,7 @@ from ...domain.sqlmodels import (
     SearchResultItem,
 )
 from ...infrastructure.db_engine import tenant_context
-from ...utils.id_utils import generate_anchor_id
-from .postgres_fts import build_postgres_tsquery
+from .postgres_fts import build_postgres_tenant_filter, build_postgres_tsquery
 
 
 class ChapterRepository:
@@ -68,8 +67,10 @@ class ChapterRepository:
                 or_(table.tenant_id == self.tenant_id, table.tenant_id.is_(None))
             )
 
+        # positions vem por selectinload (SELECT ... IN) e notes é escalar no
+        # joinedload: o JOIN não multiplica linhas, então dispensa unique().
         result = await self.session.execute(stmt)
-        return result.unique().scalar_one_or_none()
+        return result.scalar_one_or_none()
 
     async def get_by_num_as_read(self, chapter_num: str) -> Optional[ChapterRead]:
         """
@@ -86,18 +87,20 @@ class ChapterRepository:
 
     def _to_read_model(self, chapter: Chapter) -> ChapterRead:
         """Converte Chapter ORM para ChapterRead response model."""
+        # Dados vindos do ORM já respeitam o schema: model_construct evita
+        # uma validação Pydantic por posição em capítulos grandes.
         positions = [
-            PositionRead(
+            PositionRead.model_construct(
                 codigo=p.codigo,
                 descricao=p.descricao,
-                anchor_id=p.anchor_id or generate_anchor_id(p.codigo),
+                anchor_id=p.anchor_id,
             )
             for p in chapter.positions
         ]
 
         notes = None
         if chapter.notes:
-            notes = ChapterNotesRead(
+            notes = ChapterNotesRead.model_construct(
                 notes_content=chapter.notes.notes_content,
                 titulo=chapter.notes.titulo,
                 notas=chapter.notes.notas,
@@ -105,7 +108,7 @@ class ChapterRepository:
                 definicoes=chapter.notes.definicoes,
             )
 
-        return ChapterRead(
+        return ChapterRead.model_construct(
             chapter_num=chapter.chapter_num,
             content=chapter.content,
             positions=positions,
@@ -123,7 +126,7 @@ class ChapterRepository:
             )
 
         result = await self.session.execute(stmt)
-        return list(result.scalars().all())
+        return cast(List[str], result.scalars().all())
 
     async def search_fulltext(
         self, query: str, limit: int = 50
@@ -143,57 +146,103 @@ class ChapterRepository:
         else:
             return await self._fts_sqlite(query, limit)
 
-    async def _fts_postgres(self, query: str, limit: int) -> List[SearchResultItem]:
-        """FTS usando tsvector/tsquery do PostgreSQL."""
+    async def _fts_postgres(
+        self,
+        query: str,
+        limit: int,
+        *,
+        base: float = 0.0,
+        coverage_bonus: float = 0.0,
+        tier: int = 1,
+    ) -> List[SearchResultItem]:
+        """
+        FTS usando tsvector/tsquery do PostgreSQL (score final calculado no SQL).
+
+        Posições e capítulos saem de um único UNION ALL ranqueado em conjunto,
+        como no search_index do SQLite: um round-trip e um sort, com o LIMIT
+        empurrado para dentro de cada ramo.
+        """
         tsquery = build_postgres_tsquery(query)
-        if self.tenant_id:
-            stmt = text(
-                f"""
-                SELECT
-                    p.codigo as ncm,
-                    p.descricao as display_text,
-                    'position' as type,
-                    p.descricao as description,
-                    ts_rank(p.search_vector, {tsquery.sql}) as score
-                FROM positions p
-                WHERE p.search_vector @@ {tsquery.sql}
-                  AND (p.tenant_id = :tenant_id OR p.tenant_id IS NULL)
-                ORDER BY score DESC
-                LIMIT :limit
-                """
-            )
-            params = {**tsquery.params, "limit": limit, "tenant_id": self.tenant_id}
-        else:
-            stmt = text(
-                f"""
-                SELECT
-                    p.codigo as ncm,
-                    p.descricao as display_text,
-                    'position' as type,
-                    p.descricao as description,
-                    ts_rank(p.search_vector, {tsquery.sql}) as score
-                FROM positions p
-                WHERE p.search_vector @@ {tsquery.sql}
-                ORDER BY score DESC
-                LIMIT :limit
-                """
-            )
-            params = {**tsquery.params, "limit": limit}
+        params: dict[str, Any] = {
+            **tsquery.params,
+            "limit": limit,
+            "base": base,
+            "coverage_bonus": coverage_bonus,
+            "tier": tier,
+            "tenant_id": self.tenant_id,
+        }
+        stmt = text(
+            f"""
+            SELECT
+                ncm,
+                display_text,
+                type,
+                description,
+                round(CAST(
+                    CAST(:base AS double precision)
+                    + rank * 100
+                    + CAST(:coverage_bonus AS double precision)
+                AS numeric), 1) as score,
+                CAST(:tier AS integer) as tier
+            FROM (
+                (
+                    SELECT
+                        p.codigo as ncm,
+                        p.descricao as display_text,
+                        'position' as type,
+                        p.descricao as description,
+                        ts_rank(p.search_vector, {tsquery.sql}) as rank
+                    FROM positions p
+                    WHERE p.search_vector @@ {tsquery.sql}
+                      AND {build_postgres_tenant_filter("p")}
+                    ORDER BY rank DESC
+                    LIMIT :limit
+                )
+                UNION ALL
+                (
+                    SELECT
+                        c.chapter_num as ncm,
+                        'Capítulo ' || c.chapter_num as display_text,
+                        'chapter' as type,
+                        left(c.content, 200) as description,
+                        ts_rank(c.search_vector, {tsquery.sql}) as rank
+                    FROM chapters c
+                    WHERE c.search_vector @@ {tsquery.sql}
+                      AND {build_postgres_tenant_filter("c")}
+                    ORDER BY rank DESC
+                    LIMIT :limit
+                )
+            ) hits
+            ORDER BY rank DESC
+            LIMIT :limit
+            """
+        )
 
         result = await self.session.execute(stmt, params)
+        # Desempacota por posição (ordem do SELECT): evita o lookup por nome
+        # em cada atributo do Row no caminho quente do FTS. Os tipos já vêm
+        # do SQL, então model_construct dispensa a validação por item.
         return [
-            SearchResultItem(
-                ncm=row.ncm,
-                display_text=row.display_text,
-                type=row.type,
-                description=row.description,
-                score=float(row.score) * 100,
-                tier=1,
+            SearchResultItem.model_construct(
+                ncm=ncm,
+                display_text=display_text,
+                type=type_,
+                description=description,
+                score=float(score),
+                tier=row_tier,
             )
-            for row in result
+            for ncm, display_text, type_, description, score, row_tier in result
         ]
 
-    async def _fts_sqlite(self, query: str, limit: int) -> List[SearchResultItem]:
+    async def _fts_sqlite(
+        self,
+        query: str,
+        limit: int,
+        *,
+        base: float = 0.0,
+        coverage_bonus: float = 0.0,
+        tier: int = 1,
+    ) -> List[SearchResultItem]:
         """FTS usando FTS5 do SQLite (compatibilidade)."""
         stmt = text(
             """
@@ -202,22 +251,30 @@ class ChapterRepository:
                 display_text,
                 type,
                 description,
-                rank
+                round(:base - rank * 10 + :coverage_bonus, 1) as score,
+                :tier as tier
             FROM search_index
             WHERE indexed_content MATCH :query
             ORDER BY rank
             LIMIT :limit
         """
         )
-        result = await self.session.execute(stmt, {"query": query, "limit": limit})
+        params = {
+            "query": query,
+            "limit": limit,
+            "base": base,
+            "coverage_bonus": coverage_bonus,
+            "tier": tier,
+        }
+        result = await self.session.execute(stmt, params)
         return [
-            SearchResultItem(
+            SearchResultItem.model_construct(
                 ncm=row.ncm,
                 display_text=row.display_text,
                 type=row.type,
                 description=row.description,
-                score=float(-row.rank) * 10,
-                tier=1,
+                score=float(row.score),
+                tier=row.tier,
             )
             for row in result
         ]
@@ -247,10 +304,7 @@ class ChapterRepository:
         base = tier_bases.get(tier, 0)
         coverage_bonus = (words_matched / total_words * 100) if total_words > 0 else 0
 
-        results = await self.search_fulltext(query, limit)
-
-        for r in results:
-            r.score = round(base + r.score + coverage_bonus, 1)
-            r.tier = tier
-
-        return results
+        fts = self._fts_postgres if self.is_postgres else self._fts_sqlite
+        return await fts(
+            query, limit, base=base, coverage_bonus=coverage_bonus, tier=tier
+        )
@@ -7,7 +7,8 @@ para facilitar testes e troca de banco de dados.
 
 import logging
 from datetime import datetime, timezone
-from typing import Optional
+from typing import Optional, cast
+from sqlalchemy import update
 from sqlmodel import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
@@ -24,8 +25,9 @@ class CommentRepository:
 
     async def create(self, comment: Comment) -> Comment:
         self.session.add(comment)
-        await self.session.flush()  # Garante id antes do commit
-        await self.session.refresh(comment)
+        # flush já preenche o id (RETURNING/lastrowid) e todos os defaults são
+        # do lado Python: refresh seria só um SELECT extra por escrita.
+        await self.session.flush()
         return comment
 
     async def get_by_id(self, comment_id: int) -> Optional[Comment]:
@@ -68,7 +70,8 @@ class CommentRepository:
             .limit(min(max(1, limit), 500))
         )
         result = await self.session.execute(stmt)
-        return list(result.scalars().all())
+        # ScalarResult.all() já devolve list: evita a cópia O(N) de list(...)
+        return cast(list[Comment], result.scalars().all())
 
     async def list_pending(
         self, tenant_id: str, *, limit: int = 200, offset: int = 0
@@ -83,7 +86,7 @@ class CommentRepository:
             .limit(min(max(1, limit), 500))
         )
         result = await self.session.execute(stmt)
-        return list(result.scalars().all())
+        return cast(list[Comment], result.scalars().all())
 
     async def list_anchors_with_comments(
         self, tenant_id: str, *, limit: int = 500, offset: int = 0
@@ -92,17 +95,19 @@ class CommentRepository:
         Retorna lista de anchor_keys que possuem comentários aprovados,
         usada pelo renderer para injetar <mark class='has-comment'>.
         """
-        from sqlalchemy import distinct
-
+        # GROUP BY + ORDER BY na mesma ordem do índice parcial
+        # ix_comments_approved_anchor: varredura só no índice, sem sort extra.
         stmt = (
-            select(distinct(Comment.anchor_key))
+            select(Comment.anchor_key)
             .where(Comment.tenant_id == tenant_id)
             .where(Comment.status == "approved")
+            .group_by(Comment.anchor_key)
+            .order_by(Comment.anchor_key)
             .offset(max(0, offset))
             .limit(min(max(1, limit), 1000))
         )
         result = await self.session.execute(stmt)
-        return list(result.scalars().all())
+        return cast(list[str], result.scalars().all())
 
     async def update_status(
         self,
@@ -111,17 +116,51 @@ class CommentRepository:
         moderated_by: str,
         note: Optional[str] = None,
     ) -> Comment:
+        now = datetime.now(timezone.utc)  # mesmo instante nos dois campos
         comment.status = status
         comment.moderated_by = moderated_by
-        comment.moderated_at = datetime.now(timezone.utc)
-        comment.updated_at = datetime.now(timezone.utc)
+        comment.moderated_at = now
+        comment.updated_at = now
         if note:
             comment.moderation_note = note
         self.session.add(comment)
         await self.session.flush()
-        await self.session.refresh(comment)
         return comment
 
+    async def bulk_update_status(
+        self,
+        tenant_id: str,
+        comment_ids: list[int],
+        status: str,
+        moderated_by: str,
+        note: Optional[str] = None,
+    ) -> int:
+        """
+        Modera vários comentários do tenant com um único UPDATE.
+
+        Não carrega as instâncias: retorna quantas linhas foram alteradas.
+        """
+        if not comment_ids:
+            return 0
+        now = datetime.now(timezone.utc)
+        values: dict[str, object] = {
+            "status": status,
+            "moderated_by": moderated_by,
+            "moderated_at": now,
+            "updated_at": now,
+        }
+        if note:
+            values["moderation_note"] = note
+        stmt = (
+            update(Comment)
+            .where(Comment.tenant_id == tenant_id)
+            .where(Comment.id.in_(comment_ids))  # type: ignore[union-attr]
+            .values(**values)
+            .execution_options(synchronize_session=False)
+        )
+        result = await self.session.execute(stmt)
+        return cast(int, getattr(result, "rowcount", 0))
+
     async def update_body(self, comment: Comment, body: str) -> Comment:
         """Atualiza o corpo do comentário (edição pelo autor)."""
         comment.body = body
@@ -131,7 +170,6 @@ class CommentRepository:
             comment.status = "pending"
         self.session.add(comment)
         await self.session.flush()
-        await self.session.refresh(comment)
         return comment
 
     async def delete(self, comment: Comment) -> None:
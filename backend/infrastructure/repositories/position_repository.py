@@ -6,14 +6,34 @@ from typing import Any, List, Optional, cast
 
 from sqlalchemy import Integer
 from sqlalchemy import cast as sa_cast
-from sqlalchemy import func, or_, select, text
+from sqlalchemy import bindparam, func, or_, select, text
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from ...config.settings import settings
 from ...domain.sqlmodels import Position, PositionRead, SearchResultItem
 from ...infrastructure.db_engine import tenant_context
-from ...utils.id_utils import generate_anchor_id
-from .postgres_fts import build_postgres_tsquery
+from .postgres_fts import build_postgres_tenant_filter, build_postgres_tsquery
+
+# Colunas resolvidas uma vez no import; os SELECTs fixos usam bindparam e são
+# montados aqui, então o cache de compilação do SQLAlchemy os reaproveita.
+_COLUMNS = cast(Any, Position).__table__.c
+_TENANT_FILTER = or_(
+    _COLUMNS.tenant_id == bindparam("tenant_id"), _COLUMNS.tenant_id.is_(None)
+)
+
+_SELECT_BY_CODIGO = select(Position).where(_COLUMNS.codigo == bindparam("codigo"))
+_SELECT_BY_CODIGO_TENANT = _SELECT_BY_CODIGO.where(_TENANT_FILTER)
+
+# Numeric sort: split "XX.XX" into major/minor parts for correct HS Code ordering
+_SELECT_BY_CHAPTER = (
+    select(Position)
+    .where(_COLUMNS.chapter_num == bindparam("chapter_num"))
+    .order_by(
+        sa_cast(func.substr(_COLUMNS.codigo, 1, 2), Integer),
+        sa_cast(func.substr(_COLUMNS.codigo, 4, 2), Integer),
+    )
+)
+_SELECT_BY_CHAPTER_TENANT = _SELECT_BY_CHAPTER.where(_TENANT_FILTER)
 
 
 class PositionRepository:
@@ -40,13 +60,12 @@ class PositionRepository:
         Returns:
             Position ou None
         """
-        table = cast(Any, Position).__table__.c
-        stmt = select(Position).where(table.codigo == codigo)
+        params: dict[str, Any] = {"codigo": codigo}
+        stmt = _SELECT_BY_CODIGO
         if self.tenant_id:
-            stmt = stmt.where(
-                or_(table.tenant_id == self.tenant_id, table.tenant_id.is_(None))
-            )
-        result = await self.session.execute(stmt)
+            stmt = _SELECT_BY_CODIGO_TENANT
+            params["tenant_id"] = self.tenant_id
+        result = await self.session.execute(stmt, params)
         return result.scalar_one_or_none()
 
     async def get_by_chapter(self, chapter_num: str) -> List[PositionRead]:
@@ -59,34 +78,26 @@ class PositionRepository:
         Returns:
             List[PositionRead]: PositionRead objects containing codigo, descricao, and anchor_id ordered by HS code.
         """
-        table = cast(Any, Position).__table__.c
-        # Numeric sort: split "XX.XX" into major/minor parts for correct HS Code ordering
-        stmt = (
-            select(Position)
-            .where(table.chapter_num == chapter_num)
-            .order_by(
-                sa_cast(func.substr(table.codigo, 1, 2), Integer),
-                sa_cast(func.substr(table.codigo, 4, 2), Integer),
-            )
-        )
+        params: dict[str, Any] = {"chapter_num": chapter_num}
+        stmt = _SELECT_BY_CHAPTER
         if self.tenant_id:
-            stmt = stmt.where(
-                or_(table.tenant_id == self.tenant_id, table.tenant_id.is_(None))
-            )
-        result = await self.session.execute(stmt)
+            stmt = _SELECT_BY_CHAPTER_TENANT
+            params["tenant_id"] = self.tenant_id
+        result = await self.session.execute(stmt, params)
         positions = result.scalars().all()
 
+        # Linhas vêm do ORM já tipadas: model_construct pula a validação por item.
         return [
-            PositionRead(
+            PositionRead.model_construct(
                 codigo=p.codigo,
                 descricao=p.descricao,
-                anchor_id=generate_anchor_id(p.codigo),
+                anchor_id=p.anchor_id,
             )
             for p in positions
         ]
 
     async def search_by_prefix(
-        self, prefix: str, limit: int = 50
+        self, prefix: str, limit: int = 50, after: Optional[str] = None
     ) -> List[PositionRead]:
         """
         Busca posições por prefixo NCM.
@@ -94,32 +105,39 @@ class PositionRepository:
         Args:
             prefix: Prefixo NCM (ex: "8517" para buscar 8517.*)
             limit: Máximo de resultados
+            after: Último código da página anterior (paginação por keyset)
 
         Returns:
             Lista de PositionRead
         """
         # Normaliza prefixo (remove pontos)
         clean_prefix = prefix.replace(".", "")
-        table = cast(Any, Position).__table__.c
-
-        stmt = (
-            select(Position)
-            .where(func.replace(table.codigo, ".", "").like(f"{clean_prefix}%"))
-            .order_by(table.codigo)
-            .limit(limit)
-        )
+        # Mesma expressão do índice ix_positions_codigo_plain (migration 017).
+        codigo_plain = func.replace(_COLUMNS.codigo, ".", "")
+
+        stmt = select(Position).order_by(_COLUMNS.codigo).limit(limit)
+        if clean_prefix:
+            # Faixa [prefixo, prefixo+1) em vez de LIKE: usa o B-tree de expressão
+            # com qualquer collation e não interpreta % ou _ vindos do usuário.
+            upper = clean_prefix[:-1] + chr(ord(clean_prefix[-1]) + 1)
+            stmt = stmt.where(codigo_plain >= clean_prefix, codigo_plain < upper)
+        if after:
+            stmt = stmt.where(_COLUMNS.codigo > after)
         if self.tenant_id:
             stmt = stmt.where(
-                or_(table.tenant_id == self.tenant_id, table.tenant_id.is_(None))
+                or_(
+                    _COLUMNS.tenant_id == self.tenant_id,
+                    _COLUMNS.tenant_id.is_(None),
+                )
             )
         result = await self.session.execute(stmt)
         positions = result.scalars().all()
 
         return [
-            PositionRead(
+            PositionRead.model_construct(
                 codigo=p.codigo,
                 descricao=p.descricao,
-                anchor_id=generate_anchor_id(p.codigo),
+                anchor_id=p.anchor_id,
             )
             for p in positions
         ]
@@ -145,50 +163,35 @@ class PositionRepository:
     async def _fts_postgres(self, query: str, limit: int) -> List[SearchResultItem]:
         """FTS usando tsvector do PostgreSQL."""
         tsquery = build_postgres_tsquery(query)
-        if self.tenant_id:
-            stmt = text(
-                f"""
-                SELECT
-                    codigo as ncm,
-                    descricao as display_text,
-                    'position' as type,
-                    descricao as description,
-                    ts_rank(search_vector, {tsquery.sql}) as score
-                FROM positions
-                WHERE search_vector @@ {tsquery.sql}
-                  AND (tenant_id = :tenant_id OR tenant_id IS NULL)
-                ORDER BY score DESC
-                LIMIT :limit
-                """
-            )
-            params = {**tsquery.params, "limit": limit, "tenant_id": self.tenant_id}
-        else:
-            stmt = text(
-                f"""
-                SELECT
-                    codigo as ncm,
-                    descricao as display_text,
-                    'position' as type,
-                    descricao as description,
-                    ts_rank(search_vector, {tsquery.sql}) as score
-                FROM positions
-                WHERE search_vector @@ {tsquery.sql}
-                ORDER BY score DESC
-                LIMIT :limit
-                """
-            )
-            params = {**tsquery.params, "limit": limit}
+        stmt = text(
+            f"""
+            SELECT
+                codigo as ncm,
+                descricao as display_text,
+                'position' as type,
+                descricao as description,
+                ts_rank(search_vector, {tsquery.sql}) as score
+            FROM positions
+            WHERE search_vector @@ {tsquery.sql}
+              AND {build_postgres_tenant_filter("positions")}
+            ORDER BY score DESC
+            LIMIT :limit
+            """
+        )
+        params = {**tsquery.params, "limit": limit, "tenant_id": self.tenant_id}
         result = await self.session.execute(stmt, params)
+        # Desempacota por posição (ordem do SELECT): evita o lookup por nome
+        # em cada atributo do Row no caminho quente do FTS.
         return [
-            SearchResultItem(
-                ncm=row.ncm,
-                display_text=row.display_text,
-                type=row.type,
-                description=row.description,
-                score=float(row.score) * 100,
+            SearchResultItem.model_construct(
+                ncm=ncm,
+                display_text=display_text,
+                type=type_,
+                description=description,
+                score=float(score) * 100,
                 tier=1,
             )
-            for row in result
+            for ncm, display_text, type_, description, score in result
         ]
 
     async def _fts_sqlite(self, query: str, limit: int) -> List[SearchResultItem]:
@@ -210,7 +213,7 @@ class PositionRepository:
         )
         result = await self.session.execute(stmt, {"query": query, "limit": limit})
         return [
-            SearchResultItem(
+            SearchResultItem.model_construct(
                 ncm=row.ncm,
                 display_text=row.display_text,
                 type=row.type,
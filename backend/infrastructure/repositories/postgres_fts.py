@@ -9,6 +9,16 @@ class PostgresTsQuerySpec:
     params: dict[str, str]
 
 
+def build_postgres_tenant_filter(alias: str) -> str:
+    # Always present in the SQL text (tenant_id NULL disables it), so queries
+    # with and without a tenant share one statement. The CAST gives asyncpg a
+    # type for the bare parameter.
+    return (
+        "(CAST(:tenant_id AS varchar) IS NULL"
+        f" OR {alias}.tenant_id = :tenant_id OR {alias}.tenant_id IS NULL)"
+    )
+
+
 def _normalize_prefix_token(token: str) -> str:
     cleaned = token.strip().strip('"').strip("'")
     if not cleaned:
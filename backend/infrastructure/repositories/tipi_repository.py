@@ -5,17 +5,98 @@ Suporta multi-tenant via tenant_id filtering.
 Suporta dual SQLite/PostgreSQL similar ao ChapterRepository.
 """
 
+from functools import lru_cache
 from typing import Any, Dict, List, Optional, Set, cast
 
-from sqlalchemy import select, text
+from sqlalchemy import bindparam, select, text
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.sql.elements import TextClause
 
 from ...config.settings import settings
 from ...domain.sqlmodels import TipiPosition
 from ...infrastructure.db_engine import tenant_context
-from ...utils.id_utils import generate_anchor_id
 from .postgres_fts import build_postgres_tsquery
 
+# SQL fixo por dialeto (ancestrais num único parâmetro de lista): o texto não
+# varia com a quantidade de ancestrais, então o cache de statements acerta.
+_FAMILY_SQL_POSTGRES = text(
+    """
+    SELECT codigo, chapter_num, descricao, aliquota, nivel, parent_ncm, ncm_sort,
+           anchor_id
+    FROM tipi_positions
+    WHERE chapter_num = :chapter_num
+      AND (
+        (REPLACE(codigo, '.', '') >= :prefix
+         AND REPLACE(codigo, '.', '') < :prefix_upper)
+        OR REPLACE(codigo, '.', '') = ANY(:ancestors)
+      )
+    ORDER BY ncm_sort, codigo
+    """
+)
+# SQLite: o bundle offline usa ncm/capitulo e não tem a coluna anchor_id, então
+# a mesma regra de generate_anchor_id sai na projeção SQL.
+_FAMILY_SQL_SQLITE = text(
+    """
+    SELECT ncm AS codigo, capitulo AS chapter_num, descricao, aliquota, nivel,
+           parent_ncm, ncm_sort,
+           'pos-' || REPLACE(REPLACE(ncm, '.', '-'), ' ', '') AS anchor_id
+    FROM tipi_positions
+    WHERE capitulo = :chapter_num
+      AND (
+        (REPLACE(ncm, '.', '') >= :prefix AND REPLACE(ncm, '.', '') < :prefix_upper)
+        OR REPLACE(ncm, '.', '') IN :ancestors
+      )
+    ORDER BY ncm_sort, ncm
+    """
+).bindparams(bindparam("ancestors", expanding=True))
+
+_FTS_SQLITE_SQL = text(
+    """
+    SELECT ncm, capitulo, descricao, aliquota
+    FROM tipi_fts
+    WHERE tipi_fts MATCH :query
+    ORDER BY rank
+    LIMIT :limit
+    """
+)
+_CHAPTERS_SQL_POSTGRES = text(
+    """
+    SELECT DISTINCT chapter_num as codigo, chapter_num as titulo
+    FROM tipi_positions
+    ORDER BY chapter_num
+    """
+)
+_CHAPTERS_SQL_SQLITE = text(
+    """
+    SELECT codigo, titulo, secao
+    FROM tipi_chapters
+    ORDER BY codigo
+    """
+)
+
+
+@lru_cache(maxsize=8)
+def _fts_postgres_statement(tsquery_sql: str) -> TextClause:
+    # build_postgres_tsquery só gera poucas variantes de fragmento: um
+    # TextClause por variante, em vez de reparsear o SQL a cada busca.
+    # A tsquery sai de um CTE de uma linha e é referenciada no ts_rank e no @@
+    # (índice GIN idx_tipi_positions_fts) sem repetir a expressão.
+    return text(
+        f"""
+        WITH q AS (SELECT {tsquery_sql} AS tsq)
+        SELECT
+            codigo as ncm,
+            chapter_num as capitulo,
+            descricao,
+            aliquota,
+            ts_rank(search_vector, q.tsq) as score
+        FROM tipi_positions, q
+        WHERE search_vector @@ q.tsq
+        ORDER BY score DESC
+        LIMIT :limit
+        """  # nosec B608
+    )
+
 
 class TipiRepository:
     """
@@ -42,6 +123,7 @@ class TipiRepository:
         Returns:
             TipiPosition ou None
         """
+
         table = cast(Any, TipiPosition).__table__.c
         stmt = select(TipiPosition).where(table.codigo == codigo)
         result = await self.session.execute(stmt)
@@ -59,26 +141,43 @@ class TipiRepository:
         """
         table = cast(Any, TipiPosition).__table__.c
         order_primary = table.ncm_sort if hasattr(table, "ncm_sort") else table.codigo
+        # Colunas via Core: o resultado vira dict logo abaixo, então hidratar
+        # entidades ORM (identity map + estado por instância) seria desperdício.
         stmt = (
-            select(TipiPosition)
+            select(
+                table.codigo,
+                table.chapter_num,
+                table.descricao,
+                table.aliquota,
+                table.nivel,
+                table.parent_ncm,
+                table.anchor_id,
+            )
             .where(table.chapter_num == chapter_num)
             .order_by(order_primary, table.codigo)
         )
         result = await self.session.execute(stmt)
-        positions = result.scalars().all()
 
         return [
             {
-                "ncm": p.codigo,
-                "codigo": p.codigo,
-                "capitulo": p.chapter_num,
-                "descricao": p.descricao,
-                "aliquota": p.aliquota or "0",
-                "nivel": p.nivel or 0,
-                "parent_ncm": p.parent_ncm,
-                "anchor_id": generate_anchor_id(p.codigo),
+                "ncm": codigo,
+                "codigo": codigo,
+                "capitulo": chapter,
+                "descricao": descricao,
+                "aliquota": aliquota or "0",
+                "nivel": nivel or 0,
+                "parent_ncm": parent_ncm,
+                "anchor_id": anchor_id,
             }
-            for p in positions
+            for (
+                codigo,
+                chapter,
+                descricao,
+                aliquota,
+                nivel,
+                parent_ncm,
+                anchor_id,
+            ) in result
         ]
 
     async def get_family_positions(
@@ -92,43 +191,19 @@ class TipiRepository:
             prefix: Prefixo NCM para filtrar descendentes
             ancestor_prefixes: Set de prefixos ancestrais
         """
-        if self.is_postgres:
-            # PostgreSQL: usar REPLACE e LIKE
-            conditions = ["REPLACE(codigo, '.', '') LIKE :prefix || '%'"]
-            params: Dict[str, Any] = {"chapter_num": chapter_num, "prefix": prefix}
-
-            for i, ancestor in enumerate(ancestor_prefixes):
-                conditions.append(f"REPLACE(codigo, '.', '') = :ancestor{i}")
-                params[f"ancestor{i}"] = ancestor
-
-            where_clause = " OR ".join(conditions)
-            sql = f"""
-                SELECT codigo, chapter_num, descricao, aliquota, nivel, parent_ncm, ncm_sort
-                FROM tipi_positions
-                WHERE chapter_num = :chapter_num AND ({where_clause})
-                ORDER BY ncm_sort, codigo
-            """  # nosec B608
-            stmt = text(sql)
-            result = await self.session.execute(stmt, params)
-        else:
-            # SQLite: mesma lógica
-            conditions = ["REPLACE(ncm, '.', '') LIKE ? || '%'"]
-            params_list = [chapter_num, prefix]
-
-            for ancestor in ancestor_prefixes:
-                conditions.append("REPLACE(ncm, '.', '') = ?")
-                params_list.append(ancestor)
-
-            where_clause = " OR ".join(conditions)
-            sql = f"""
-                SELECT ncm as codigo, capitulo as chapter_num, descricao, aliquota, nivel, parent_ncm, ncm_sort
-                FROM tipi_positions
-                WHERE capitulo = ? AND ({where_clause})
-                ORDER BY ncm_sort, ncm
-            """  # nosec B608
-            stmt = text(sql)
-            params_tuple = tuple(params_list)
-            result = await self.session.execute(stmt, params_tuple)  # pyright: ignore[reportCallIssue,reportArgumentType]
+        if not prefix:
+            # Prefixo vazio casa o capítulo inteiro.
+            return await self.get_by_chapter(chapter_num)
+
+        params: Dict[str, Any] = {
+            "chapter_num": chapter_num,
+            "prefix": prefix,
+            # Faixa [prefixo, prefixo+1) em vez de LIKE: usa o B-tree de expressão
+            "prefix_upper": prefix[:-1] + chr(ord(prefix[-1]) + 1),
+            "ancestors": sorted(ancestor_prefixes),
+        }
+        stmt = _FAMILY_SQL_POSTGRES if self.is_postgres else _FAMILY_SQL_SQLITE
+        result = await self.session.execute(stmt, params)
 
         return [
             {
@@ -139,7 +214,7 @@ class TipiRepository:
                 "aliquota": row.aliquota or "0",
                 "nivel": getattr(row, "nivel", 0) or 0,
                 "parent_ncm": getattr(row, "parent_ncm", None),
-                "anchor_id": generate_anchor_id(row.codigo),
+                "anchor_id": row.anchor_id,
             }
             for row in result
         ]
@@ -165,18 +240,7 @@ class TipiRepository:
     async def _fts_postgres(self, query: str, limit: int) -> List[Dict[str, Any]]:
         """FTS usando tsvector do PostgreSQL."""
         tsquery = build_postgres_tsquery(query)
-        stmt = text(f"""
-            SELECT
-                codigo as ncm,
-                chapter_num as capitulo,
-                descricao,
-                aliquota,
-                ts_rank(search_vector, {tsquery.sql}) as score
-            FROM tipi_positions
-            WHERE search_vector @@ {tsquery.sql}
-            ORDER BY score DESC
-            LIMIT :limit
-        """)
+        stmt = _fts_postgres_statement(tsquery.sql)
         result = await self.session.execute(stmt, {**tsquery.params, "limit": limit})
         return [
             {
@@ -190,14 +254,8 @@ class TipiRepository:
 
     async def _fts_sqlite(self, query: str, limit: int) -> List[Dict[str, Any]]:
         """FTS usando FTS5 do SQLite."""
-        stmt = text("""
-            SELECT ncm, capitulo, descricao, aliquota
-            FROM tipi_fts
-            WHERE tipi_fts MATCH :query
-            LIMIT :limit
-        """)
         result = await self.session.execute(
-            stmt, {"query": f'"{query}"', "limit": limit}
+            _FTS_SQLITE_SQL, {"query": f'"{query}"', "limit": limit}
         )
         return [
             {
@@ -211,18 +269,6 @@ class TipiRepository:
 
     async def get_all_chapters(self) -> List[Dict[str, str]]:
         """Lista todos os capítulos TIPI."""
-        if self.is_postgres:
-            stmt = text("""
-                SELECT DISTINCT chapter_num as codigo, chapter_num as titulo
-                FROM tipi_positions
-                ORDER BY chapter_num
-            """)
-        else:
-            stmt = text("""
-                SELECT codigo, titulo, secao
-                FROM tipi_chapters
-                ORDER BY codigo
-            """)
-
+        stmt = _CHAPTERS_SQL_POSTGRES if self.is_postgres else _CHAPTERS_SQL_SQLITE
         result = await self.session.execute(stmt)
         return [dict(row._mapping) for row in result]
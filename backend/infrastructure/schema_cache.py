@@ -15,6 +15,12 @@ class _SchemaCacheEntry[T]:
     db_signature: DatabaseSignature
     value: T
     checked_at: float
+    schema_version: int | None = None
+
+
+def _same_file(a: DatabaseSignature, b: DatabaseSignature) -> bool:
+    """Same (st_dev, st_ino): the file was written to, not replaced."""
+    return a is not None and b is not None and a[:2] == b[:2]
 
 
 class SchemaCache[T]:
@@ -38,9 +44,14 @@ class SchemaCache[T]:
         *,
         load: Callable[[], Awaitable[T]],
         resolve_db_signature: Callable[[], DatabaseSignature],
+        resolve_schema_version: Callable[[], Awaitable[int | None]] | None = None,
     ) -> T:
         """Returns the cached value or loads a fresh one when the DB changes.
 
+        A changed signature on the same file (any write, WAL checkpoint) only
+        triggers ``load`` when ``resolve_schema_version`` (SQLite's
+        ``PRAGMA schema_version``) also changed; a replaced file always reloads.
+
         Example:
             schema = await cache.get_or_load(
                 load=lambda: detect_schema(conn),
@@ -56,10 +67,25 @@ class SchemaCache[T]:
                 self._entry.checked_at = now
                 return self._entry.value
 
+            schema_version = (
+                await resolve_schema_version() if resolve_schema_version else None
+            )
+            entry = self._entry
+            if (
+                entry is not None
+                and schema_version is not None
+                and entry.schema_version == schema_version
+                and _same_file(entry.db_signature, signature)
+            ):
+                entry.db_signature = signature
+                entry.checked_at = now
+                return entry.value
+
             value = await load()
             self._entry = _SchemaCacheEntry(
                 db_signature=signature,
                 value=value,
                 checked_at=now,
+                schema_version=schema_version,
             )
             return value
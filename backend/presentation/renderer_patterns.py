@@ -178,12 +178,14 @@ class _UnitHighlighter(HTMLParser):
         self,
         pattern: re.Pattern[str],
         replacer_func: Callable[[re.Match[str]], str],
+        prefilter: re.Pattern[str] | None = None,
     ) -> None:
         super().__init__(convert_charrefs=False)
         self.out: list[str] = []
         self._skip_depth = 0
         self._pattern = pattern
         self._replacer = replacer_func
+        self._prefilter = prefilter
 
     def handle_starttag(self, tag: str, attrs: list[tuple[str, str | None]]) -> None:
         raw_tag = self.get_starttag_text() or ""
@@ -204,7 +206,9 @@ class _UnitHighlighter(HTMLParser):
     def handle_data(self, data: str) -> None:
         if not data:
             return
-        if self._skip_depth > 0:
+        if self._skip_depth > 0 or (
+            self._prefilter is not None and self._prefilter.search(data) is None
+        ):
             self.out.append(data)
             return
         self.out.append(self._pattern.sub(self._replacer, data))
@@ -6,6 +6,7 @@ from collections.abc import Callable
 from html.parser import HTMLParser
 from typing import Protocol
 
+from ..config.constants import MEASUREMENT_UNITS_PREFILTER_RE
 from .renderer_patterns import (
     _MultiTransformParser,
     _RendererRegexProtocol,
@@ -352,10 +353,15 @@ def _inject_unit_highlights(renderer: _RendererRegexProtocol, text: str) -> str:
             return f'{leading}<span class="highlight-unit">{stripped}</span>'
         return f'<span class="highlight-unit">{raw}</span>'
 
+    if MEASUREMENT_UNITS_PREFILTER_RE.search(text) is None:
+        return text
+
     if "<" not in text and ">" not in text:
         return renderer.RE_UNIT.sub(replacer, text)
 
-    parser = _UnitHighlighter(renderer.RE_UNIT, replacer)
+    parser = _UnitHighlighter(
+        renderer.RE_UNIT, replacer, prefilter=MEASUREMENT_UNITS_PREFILTER_RE
+    )
     try:
         parser.feed(text)
         parser.close()
@@ -365,11 +371,17 @@ def _inject_unit_highlights(renderer: _RendererRegexProtocol, text: str) -> str:
         return renderer.RE_UNIT.sub(replacer, text)
 
 
+def _may_contain_glossary_term(glossary_manager_obj: object, text: str) -> bool:
+    # Managers without the first-char pre-check always fall through to the regex.
+    maybe_has_term = getattr(glossary_manager_obj, "maybe_has_term", None)
+    return maybe_has_term is None or maybe_has_term(text)
+
+
 def _inject_glossary_highlights(
     text: str, glossary_manager_obj: _GlossaryManagerProtocol | None
 ) -> str:
     regex = glossary_manager_obj.get_regex_pattern() if glossary_manager_obj else None
-    if not regex:
+    if not regex or not _may_contain_glossary_term(glossary_manager_obj, text):
         return text
 
     def replacer(match: re.Match[str]) -> str:
@@ -457,7 +469,7 @@ def _apply_post_transforms(
     glossary_regex = (
         glossary_manager_obj.get_regex_pattern() if glossary_manager_obj else None
     )
-    if glossary_regex:
+    if glossary_regex and _may_contain_glossary_term(glossary_manager_obj, text):
 
         def glossary_replacer(match: re.Match[str]) -> str:
             term = match.group(0)
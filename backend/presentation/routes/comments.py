@@ -14,6 +14,8 @@ from backend.infrastructure.db_engine import get_db
 from backend.presentation.schemas.comment_schemas import (
     ANCHOR_KEY_PATTERN,
     CommentApproveIn,
+    CommentBulkApproveIn,
+    CommentBulkModerationOut,
     CommentCreate,
     CommentOut,
     CommentUpdate,
@@ -378,6 +380,45 @@ async def list_pending(
     return [CommentOut.model_validate(c) for c in comments]
 
 
+@router.patch(
+    "/admin/bulk",
+    response_model=CommentBulkModerationOut,
+    responses={
+        400: {"description": "Bad Request"},
+        401: {"description": "Unauthorized"},
+        403: {"description": "Forbidden"},
+        **RATE_LIMIT_RESPONSE,
+        500: {"description": "Internal Server Error"},
+    },
+)
+async def moderate_comments_bulk(
+    payload: CommentBulkApproveIn,
+    request: Request,
+    service: Annotated[CommentService, Depends(_get_service)],
+):
+    """[Admin] Aprova ou rejeita vários comentários em um único UPDATE."""
+    # Declarada antes de /admin/{comment_id} para "bulk" não cair no path int.
+    admin_info = await _require_admin_payload(request)
+    tenant_id = _tenant_from_auth_payload(admin_info)
+    admin_user_id: str = admin_info.get("sub", "")
+    await _consume_rate_limit(
+        limiter=comment_admin_rate_limiter,
+        key=f"{tenant_id}:{admin_user_id}",
+        limit=COMMENT_ADMIN_LIMIT_PER_MINUTE,
+        detail="Limite de moderação excedido",
+    )
+    try:
+        updated = await service.moderate_bulk(
+            payload.ids, payload, tenant_id, admin_user_id
+        )
+        return CommentBulkModerationOut(updated=updated)
+    except Exception as e:
+        logger.error("Erro ao moderar comentários em lote: %s", e)
+        raise HTTPException(
+            status_code=500, detail="Erro interno ao moderar"
+        ) from e  # NOSONAR
+
+
 @router.patch(
     "/admin/{comment_id}",
     response_model=CommentOut,
@@ -477,6 +477,12 @@ handleGlobalFiscalSearchRequest = handle_global_fiscal_search_request
 search = handle_global_fiscal_search_request
 
 
+def _chapter_json_response(payload: Mapping[str, Any]) -> Response:
+    # Payload de capítulo já é JSON puro (dict/str vindos do cache ou do banco):
+    # orjson direto evita o jsonable_encoder do FastAPI percorrer o conteúdo.
+    return Response(content=_orjson.dumps(payload), media_type=JSON_MEDIA_TYPE)
+
+
 @router.get("/chapters")
 async def list_nesh_chapters(request: Request):
     """
@@ -527,20 +533,22 @@ async def fetch_nesh_chapter_notes(
     """
     logger.info("Buscando notas do capítulo: %s", chapter)
 
-    # Usa o método existente de fetch com cache
-    data = await service.fetchNeshChapterData(chapter)
+    # Só os campos de notas: com chapter_hash_mode vira um HMGET parcial
+    data = await service.fetchNeshChapterFields(chapter, ["parsed_notes", "notes"])
 
     if not data:
         raise HTTPException(
             status_code=404, detail=f"Capítulo {chapter} não encontrado"
         )
 
-    return {
-        "success": True,
-        "capitulo": chapter,
-        "notas_parseadas": data.get("parsed_notes", {}),
-        "notas_gerais": data.get("notes", None),
-    }
+    return _chapter_json_response(
+        {
+            "success": True,
+            "capitulo": chapter,
+            "notas_parseadas": data.get("parsed_notes") or {},
+            "notas_gerais": data.get("notes", None),
+        }
+    )
 
 
 @router.get(
@@ -564,14 +572,16 @@ async def fetch_nesh_chapter_body(
         service.stripNeshChapterPreamble(raw_content) if has_sections else raw_content
     )
 
-    return {
-        "success": True,
-        "capitulo": chapter,
-        "conteudo": content,
-        "notas_parseadas": data.get("parsed_notes", {}),
-        "notas_gerais": data.get("notes", None),
-        "secoes": sections if has_sections else None,
-    }
+    return _chapter_json_response(
+        {
+            "success": True,
+            "capitulo": chapter,
+            "conteudo": content,
+            "notas_parseadas": data.get("parsed_notes") or {},
+            "notas_gerais": data.get("notes", None),
+            "secoes": sections if has_sections else None,
+        }
+    )
 
 
 @router.get("/glossary")
@@ -130,3 +130,15 @@ class CommentApproveIn(BaseModel):
         return _clean_plain_text(v, field_name="note")
 
     model_config = {"extra": "forbid"}
+
+
+class CommentBulkApproveIn(CommentApproveIn):
+    """Payload para moderação em lote (PATCH /api/comments/admin/bulk)."""
+
+    ids: list[int] = Field(min_length=1, max_length=200)
+
+
+class CommentBulkModerationOut(BaseModel):
+    """Resultado da moderação em lote: quantos comentários do tenant mudaram."""
+
+    updated: int
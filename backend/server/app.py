@@ -92,7 +92,7 @@ from backend.services.tipi_service import TipiService
 from backend.server.observability import configure_observability
 from backend.utils.frontend_check import verify_frontend_build
 
-setup_logging()
+setup_logging(buffer_capacity=settings.logging.buffer_capacity)
 logger = logging.getLogger("server")
 
 
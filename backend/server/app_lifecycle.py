@@ -222,7 +222,7 @@ async def _init_primary_database(app: FastAPI) -> None:
         app.state.db = None
         return
 
-    app.state.db = DatabaseAdapter(CONFIG.db_path)
+    app.state.db = DatabaseAdapter(CONFIG.database.path)
     await app.state.db._ensure_pool()
 
 
@@ -9,6 +9,8 @@ import logging
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from backend.domain.comment_models import Comment
+from backend.infrastructure.db_engine import run_after_commit
+from backend.infrastructure.redis_client import redis_cache
 from backend.infrastructure.repositories.comment_repository import CommentRepository
 from backend.presentation.schemas.comment_schemas import (
     CommentCreate,
@@ -27,8 +29,16 @@ class CommentNotEditableError(ValueError):
 
 class CommentService:
     def __init__(self, session: AsyncSession):
+        self.session = session
         self.repo = CommentRepository(session)
 
+    def _invalidate_anchors_after_commit(self, tenant_id: str) -> None:
+        # Após o flush os anchors novos ainda não são visíveis para outras
+        # conexões: invalidar já deixaria uma leitura recachear os antigos.
+        run_after_commit(
+            self.session, lambda: redis_cache.invalidate_comment_anchors(tenant_id)
+        )
+
     async def create_comment(
         self,
         data: CommentCreate,
@@ -107,9 +117,46 @@ class CommentService:
             moderated_by=admin_user_id,
             note=data.note,
         )
+        self._invalidate_anchors_after_commit(tenant_id)
         logger.info("Comentário %s → %s por %s", comment_id, new_status, admin_user_id)
         return updated
 
+    async def moderate_bulk(
+        self,
+        comment_ids: list[int],
+        data: CommentApproveIn,
+        tenant_id: str,
+        admin_user_id: str,
+    ) -> int:
+        """
+        Aprova ou rejeita vários comentários do tenant de uma vez.
+
+        Retorna quantos comentários foram moderados; ids de outro tenant
+        ou inexistentes são ignorados.
+        """
+        unique_ids = list(dict.fromkeys(comment_ids))
+        if not unique_ids:
+            return 0
+
+        new_status = "approved" if data.action == "approve" else "rejected"
+        updated = await self.repo.bulk_update_status(
+            tenant_id,
+            unique_ids,
+            status=new_status,
+            moderated_by=admin_user_id,
+            note=data.note,
+        )
+        if updated:
+            self._invalidate_anchors_after_commit(tenant_id)
+        logger.info(
+            "%s comentários → %s por %s (tenant=%s)",
+            updated,
+            new_status,
+            admin_user_id,
+            tenant_id,
+        )
+        return updated
+
     async def update_comment(
         self,
         comment_id: int,
@@ -129,7 +176,10 @@ class CommentService:
         if comment.status == "rejected":
             raise CommentNotEditableError(COMMENT_NOT_EDITABLE)
 
+        was_approved = comment.status == "approved"
         updated = await self.repo.update_body(comment, data.body)
+        if was_approved:
+            self._invalidate_anchors_after_commit(tenant_id)
         logger.info("Comentário %s editado por %s", comment_id, user_id)
         return updated
 
@@ -149,9 +199,17 @@ class CommentService:
         if comment.user_id != user_id:
             raise PermissionError("Somente o autor pode deletar")
 
+        was_approved = comment.status == "approved"
         await self.repo.delete(comment)
+        if was_approved:
+            self._invalidate_anchors_after_commit(tenant_id)
         logger.info("Comentário %s deletado por %s", comment_id, user_id)
 
     async def get_commented_anchors(self, tenant_id: str) -> list[str]:
         """Lista de anchor_keys com comentários aprovados (para o renderer)."""
-        return await self.repo.list_anchors_with_comments(tenant_id)
+        cached = await redis_cache.get_comment_anchors(tenant_id)
+        if cached is not None:
+            return cached
+        anchors = await self.repo.list_anchors_with_comments(tenant_id)
+        await redis_cache.set_comment_anchors(tenant_id, anchors)
+        return anchors
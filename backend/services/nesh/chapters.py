@@ -7,7 +7,7 @@ from typing import TYPE_CHECKING, Any
 
 import orjson
 
-from ...config.constants import CacheConfig, RegexPatterns
+from ...config.constants import NOTE_HEADER_RE, CacheConfig
 from ...config.logging_config import service_logger as logger
 from ...infrastructure.redis_client import redis_cache
 from ...utils import ncm_utils
@@ -23,7 +23,7 @@ if TYPE_CHECKING:
     from ..nesh_service import NeshService
 
 
-NESH_RE_NOTE_HEADER = re.compile(RegexPatterns.NOTE_HEADER)
+NESH_RE_NOTE_HEADER = NOTE_HEADER_RE
 NESH_RE_FIRST_POSITION = re.compile(
     r"^\s*(?:\*\*|\*)?\d{2}\.\d{2}(?:\*\*|\*)?\s*[-\u2013\u2014:]",
     re.MULTILINE,
@@ -112,6 +112,21 @@ async def read_nesh_chapter_cache_from_redis(
     return cached
 
 
+async def prefetch_nesh_chapters_from_redis(
+    service: "NeshService", chapter_nums: list[str]
+) -> None:
+    """Fill L1 with every Redis hit for the L1 misses in one MGET round-trip."""
+    if len(chapter_nums) < 2 or not redis_cache.available:
+        return
+    async with service._get_cache_lock():
+        missing = [num for num in chapter_nums if num not in service._chapter_cache]
+    if not missing:
+        return
+    for chapter_num, cached in zip(missing, await redis_cache.get_chapters(missing)):
+        if cached:
+            await write_nesh_chapter_cache(service, chapter_num, cached)
+
+
 async def load_nesh_chapter_raw_data(
     service: "NeshService", chapter_num: str
 ) -> NeshChapterRawPayload | None:
@@ -207,6 +222,25 @@ async def fetch_nesh_chapter_payload(
     return hydrated
 
 
+async def fetch_nesh_chapter_fields(
+    service: "NeshService", chapter_num: str, fields: list[str]
+) -> dict[str, Any] | None:
+    """Campos avulsos do capítulo; com chapter_hash_mode usa HMGET parcial."""
+    if redis_cache.available and redis_cache.chapter_hash_mode:
+        cached = await read_nesh_chapter_cache(service, chapter_num)
+        if cached is None:
+            partial = await redis_cache.get_chapter_fields(chapter_num, fields)
+            if partial is not None:
+                return partial
+        else:
+            return {field: cached.get(field) for field in fields}
+
+    data = await service.fetchNeshChapterData(chapter_num)
+    if not data:
+        return None
+    return {field: data.get(field) for field in fields}
+
+
 def extract_nesh_chapter_targets(
     ncms: list[str],
 ) -> OrderedDict[str, tuple[str, str | None]]:
@@ -299,6 +333,7 @@ async def search_nesh_chapters_by_ncm_code(
         }
 
     ordered_chapters = list(chapter_targets.keys())
+    await prefetch_nesh_chapters_from_redis(service, ordered_chapters)
     chapter_payloads = await asyncio.gather(
         *(service.fetchNeshChapterData(chapter_num) for chapter_num in ordered_chapters)
     )
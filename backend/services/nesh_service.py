@@ -6,7 +6,7 @@ Contém a fachada do domínio NESH e delega responsabilidades pesadas a módulos
 import asyncio
 from collections import OrderedDict
 from contextlib import asynccontextmanager
-from typing import AsyncGenerator, Callable, Optional
+from typing import Any, AsyncGenerator, Callable, Optional
 
 from ..config import CONFIG
 from ..config.constants import CacheConfig
@@ -18,6 +18,7 @@ from ..utils import ncm_utils
 from ..utils.payload_cache_metrics import PayloadCacheMetrics
 from ..utils.text_processor import NeshTextProcessor
 from .nesh.chapters import (
+    fetch_nesh_chapter_fields,
     fetch_nesh_chapter_payload,
     parse_nesh_chapter_notes,
     prewarm_nesh_chapter_cache,
@@ -71,7 +72,7 @@ class NeshService:
         self._repository_factory = repository_factory
         self._use_repository = repository is not None or repository_factory is not None
 
-        self.processor = NeshTextProcessor(list(CONFIG.stopwords))
+        self.processor = NeshTextProcessor(CONFIG.search.stopwords_set)
         self._fts_cache: OrderedDict[NeshFtsCacheKey, list[NeshFtsScoredRow]] = (
             OrderedDict()
         )
@@ -159,6 +160,17 @@ class NeshService:
         """
         return await fetch_nesh_chapter_payload(self, chapter_num)
 
+    async def fetchNeshChapterFields(
+        self, chapter_num: str, fields: list[str]
+    ) -> dict[str, Any] | None:
+        """
+        Recupera apenas alguns campos do capítulo hidratado.
+
+        Exemplo:
+            notes = await service.fetchNeshChapterFields("85", ["notes"])
+        """
+        return await fetch_nesh_chapter_fields(self, chapter_num, fields)
+
     def normalizeNeshQuery(self, text: str) -> str:
         """
         Normaliza uma consulta textual para FTS.
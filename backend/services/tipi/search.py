@@ -177,9 +177,12 @@ async def get_family_positions(
         conditions = ["REPLACE(ncm, '.', '') LIKE ? || '%'"]
         params: list[str] = [prefix]
 
-        for ancestor in ancestor_prefixes:
-            conditions.append("REPLACE(ncm, '.', '') = ?")
-            params.append(ancestor)
+        # Ancestrais num único IN (...) em vez de uma igualdade por OR.
+        ancestors = sorted(ancestor_prefixes)
+        if ancestors:
+            placeholders = ", ".join("?" for _ in ancestors)
+            conditions.append(f"REPLACE(ncm, '.', '') IN ({placeholders})")
+            params.extend(ancestors)
 
         where_clause = " OR ".join(conditions)
         sql = f"""
@@ -403,6 +406,7 @@ async def search_tipi_by_text_query(
             SELECT ncm, capitulo, descricao, aliquota
             FROM tipi_fts
             WHERE tipi_fts MATCH ?
+            ORDER BY rank
             LIMIT ?
             """,
             (fts_query, limit),
@@ -420,6 +424,7 @@ async def search_tipi_by_text_query(
                     SELECT ncm, capitulo, descricao, aliquota
                     FROM tipi_fts
                     WHERE tipi_fts MATCH ?
+                    ORDER BY rank
                     LIMIT ?
                     """,
                     (and_query, limit),
@@ -1,6 +1,14 @@
 import re
 from typing import List, Optional, Tuple
 
+# Padrões aplicados a queries do usuário: só classes de caracteres e
+# quantificadores simples (sem aninhamento), logo tempo linear no `re`.
+_RE_NON_DIGIT = re.compile(r"[^0-9]")
+_RE_WHITESPACE = re.compile(r"\s+")
+_RE_SHORT_SUBPOSITION = re.compile(r"\d{4}\.\d{1,2}")
+_RE_CODE_QUERY = re.compile(r"[0-9\.,\-\s]+")
+_RE_QUERY_SEPARATORS = re.compile(r"[;,\s]+")
+
 
 def clean_ncm(ncm: str) -> str:
     """
@@ -12,7 +20,7 @@ def clean_ncm(ncm: str) -> str:
     Returns:
         String contendo apenas dígitos (ex: "851710")
     """
-    return re.sub(r"[^0-9]", "", (ncm or "").strip())
+    return _RE_NON_DIGIT.sub("", (ncm or "").strip())
 
 
 def extract_chapter_from_ncm(ncm: str) -> Tuple[Optional[str], Optional[str]]:
@@ -34,9 +42,9 @@ def extract_chapter_from_ncm(ncm: str) -> Tuple[Optional[str], Optional[str]]:
           - None quando não há dígitos suficientes.
     """
     raw = (ncm or "").strip()
-    compact = re.sub(r"\s+", "", raw)
+    compact = _RE_WHITESPACE.sub("", raw)
     # Preserve short subposition like 8419.8 or 8419.80 if user typed it explicitly
-    if re.fullmatch(r"\d{4}\.\d{1,2}", compact):
+    if _RE_SHORT_SUBPOSITION.fullmatch(compact):
         chapter = compact[:2].zfill(2)
         return chapter, compact
 
@@ -100,7 +108,7 @@ def is_code_query(query: str) -> bool:
     if not q:
         return False
     # Aceita: dígitos, ponto, traço, vírgula e espaços.
-    return re.fullmatch(r"[0-9\.,\-\s]+", q) is not None
+    return _RE_CODE_QUERY.fullmatch(q) is not None
 
 
 def split_ncm_query(query: str) -> List[str]:
@@ -109,5 +117,5 @@ def split_ncm_query(query: str) -> List[str]:
     Ex: "8517, 8518" -> ["8517", "8518"]
     Ex: "4903.90.00 8417" -> ["4903.90.00", "8417"]
     """
-    parts = [p.strip() for p in re.split(r"[;,\s]+", (query or ""))]
+    parts = [p.strip() for p in _RE_QUERY_SEPARATORS.split(query or "")]
     return [p for p in parts if p]
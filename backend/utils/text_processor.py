@@ -1,7 +1,7 @@
 import re
 import unicodedata
 from functools import lru_cache
-from typing import List
+from typing import Iterable
 
 # Pre-compiled regex for word extraction (performance optimization)
 _RE_WORD = re.compile(r"\b\w+\b")
@@ -94,9 +94,9 @@ def _cached_stem(word: str) -> str:
 class NeshTextProcessor:
     """Fachada para processamento de texto no Nesh."""
 
-    def __init__(self, stopwords: List[str] = None):
+    def __init__(self, stopwords: Iterable[str] | None = None):
         self.stemmer = _SHARED_STEMMER
-        self.stopwords = set(stopwords) if stopwords else set()
+        self.stopwords = frozenset(stopwords) if stopwords else frozenset()
 
     def normalize(self, text: str) -> str:
         """Remove acentos e minúsculas."""
@@ -0,0 +1,45 @@
+"""Index the dot-less position code used by prefix search.
+
+Revision ID: 017_positions_codigo_plain_index
+Revises: 016_search_events_dashboard_indexes
+"""
+
+from alembic import op
+
+revision = "017_positions_codigo_plain_index"
+down_revision = "016_search_events_dashboard_indexes"
+branch_labels = None
+depends_on = None
+
+
+def _execute_concurrently(statements: list[str]) -> None:
+    context = op.get_context()
+    with context.autocommit_block():
+        for statement in statements:
+            op.execute(statement)
+
+
+def upgrade() -> None:
+    conn = op.get_bind()
+    if conn.dialect.name != "postgresql":
+        return
+
+    # Same expression as PositionRepository.search_by_prefix; tenant_id covers
+    # the tenant filter without a heap lookup.
+    _execute_concurrently(
+        [
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_positions_codigo_plain "
+            "ON positions ((replace(codigo, '.', '')), tenant_id)",
+        ]
+    )
+    op.execute("ANALYZE positions")
+
+
+def downgrade() -> None:
+    conn = op.get_bind()
+    if conn.dialect.name != "postgresql":
+        return
+
+    _execute_concurrently(
+        ["DROP INDEX CONCURRENTLY IF EXISTS ix_positions_codigo_plain"]
+    )
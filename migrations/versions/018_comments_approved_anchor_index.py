@@ -0,0 +1,48 @@
+"""Add partial index for approved comment anchors.
+
+Revision ID: 018_comments_approved_anchor_index
+Revises: 017_positions_codigo_plain_index
+"""
+
+import sqlalchemy as sa
+from alembic import op
+
+revision = "018_comments_approved_anchor_index"
+down_revision = "017_positions_codigo_plain_index"
+branch_labels = None
+depends_on = None
+
+_APPROVED = sa.text("status = 'approved'")
+
+
+def upgrade() -> None:
+    inspector = sa.inspect(op.get_bind())
+    if "comments" not in inspector.get_table_names():
+        return
+
+    existing_indexes = {
+        index_name
+        for index in inspector.get_indexes("comments")
+        if isinstance(index_name := index["name"], str)
+    }
+    if "ix_comments_approved_anchor" not in existing_indexes:
+        op.create_index(
+            "ix_comments_approved_anchor",
+            "comments",
+            ["tenant_id", "anchor_key"],
+            postgresql_where=_APPROVED,
+            sqlite_where=_APPROVED,
+        )
+
+
+def downgrade() -> None:
+    inspector = sa.inspect(op.get_bind())
+    if "comments" not in inspector.get_table_names():
+        return
+
+    has_approved_anchor_index = any(
+        index["name"] == "ix_comments_approved_anchor"
+        for index in inspector.get_indexes("comments")
+    )
+    if has_approved_anchor_index:
+        op.drop_index("ix_comments_approved_anchor", table_name="comments")
@@ -0,0 +1,32 @@
+"""Backfill positions.anchor_id left empty by bulk loads.
+
+Revision ID: 019_backfill_position_anchor_ids
+Revises: 018_comments_approved_anchor_index
+
+Read paths now return the stored anchor_id as-is. Rows bulk-loaded with core
+INSERTs after 006 skipped the ORM before_insert hook, so they are filled here
+with the same rule as backend.utils.id_utils.generate_anchor_id (dots become
+dashes, spaces are dropped). Anchors 006 derived without dropping spaces are
+rewritten too.
+"""
+
+from alembic import op
+
+revision = "019_backfill_position_anchor_ids"
+down_revision = "018_comments_approved_anchor_index"
+branch_labels = None
+depends_on = None
+
+
+_ANCHOR_SQL = "'pos-' || REPLACE(REPLACE(codigo, '.', '-'), ' ', '')"
+
+
+def upgrade() -> None:
+    op.execute(
+        f"UPDATE positions SET anchor_id = {_ANCHOR_SQL} "  # nosec B608
+        f"WHERE anchor_id IS NULL OR anchor_id <> {_ANCHOR_SQL}"
+    )
+
+
+def downgrade() -> None:
+    """Data-only backfill; the column itself belongs to 006."""
@@ -0,0 +1,32 @@
+"""Add precomputed tipi_positions.anchor_id
+
+Revision ID: 020_tipi_positions_anchor_id
+Revises: 019_backfill_position_anchor_ids
+
+Same approach as positions.anchor_id (006): plain nullable column, backfilled
+with the generate_anchor_id rule and kept filled by the ORM write hook, so
+TipiRepository reads it instead of formatting one per row.
+"""
+
+import sqlalchemy as sa
+from alembic import op
+
+revision = "020_tipi_positions_anchor_id"
+down_revision = "019_backfill_position_anchor_ids"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "tipi_positions", sa.Column("anchor_id", sa.String(40), nullable=True)
+    )
+    op.execute(
+        "UPDATE tipi_positions "
+        "SET anchor_id = 'pos-' || REPLACE(REPLACE(codigo, '.', '-'), ' ', '') "
+        "WHERE anchor_id IS NULL"
+    )
+
+
+def downgrade() -> None:
+    op.drop_column("tipi_positions", "anchor_id")
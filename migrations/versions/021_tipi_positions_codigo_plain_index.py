@@ -0,0 +1,45 @@
+"""Index the dot-less TIPI code used by family lookups.
+
+Revision ID: 021_tipi_positions_codigo_plain_index
+Revises: 020_tipi_positions_anchor_id
+"""
+
+from alembic import op
+
+revision = "021_tipi_positions_codigo_plain_index"
+down_revision = "020_tipi_positions_anchor_id"
+branch_labels = None
+depends_on = None
+
+
+def _execute_concurrently(statements: list[str]) -> None:
+    context = op.get_context()
+    with context.autocommit_block():
+        for statement in statements:
+            op.execute(statement)
+
+
+def upgrade() -> None:
+    conn = op.get_bind()
+    if conn.dialect.name != "postgresql":
+        return
+
+    # Same expression as TipiRepository.get_family_positions; chapter_num leads
+    # because every family lookup is scoped to one chapter.
+    _execute_concurrently(
+        [
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_tipi_positions_codigo_plain "
+            "ON tipi_positions (chapter_num, (replace(codigo, '.', '')))",
+        ]
+    )
+    op.execute("ANALYZE tipi_positions")
+
+
+def downgrade() -> None:
+    conn = op.get_bind()
+    if conn.dialect.name != "postgresql":
+        return
+
+    _execute_concurrently(
+        ["DROP INDEX CONCURRENTLY IF EXISTS ix_tipi_positions_codigo_plain"]
+    )
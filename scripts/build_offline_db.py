@@ -223,6 +223,9 @@ def _create_db_metadata(cursor: sqlite3.Cursor, source: str) -> tuple[str, str]:
 
 def _finalize_output_db(conn: sqlite3.Connection, output_path: Path) -> None:
     cursor = conn.cursor()
+    # sqlite_stat1: estatísticas do planner e contagens do health check.
+    _log("Running ANALYZE...")
+    cursor.execute("ANALYZE")
     _log("Running VACUUM...")
     cursor.execute("PRAGMA journal_mode=DELETE")
     cursor.execute("PRAGMA synchronous=FULL")
@@ -538,9 +541,11 @@ def _consolidate_databases(output_path: Path) -> None:
 
     cursor.execute("""
         CREATE VIRTUAL TABLE tipi_fts USING fts5(
-            ncm, descricao, aliquota,
+            ncm, descricao, aliquota UNINDEXED,
             content='tipi_positions',
-            content_rowid='rowid'
+            content_rowid='rowid',
+            tokenize='unicode61 remove_diacritics 2',
+            prefix='2 3 4'
         )
     """)
     cursor.execute("""
@@ -572,6 +577,9 @@ def _consolidate_databases(output_path: Path) -> None:
     conn.commit()
 
     # === Final compaction ===
+    # sqlite_stat1: estatísticas do planner e contagens do health check.
+    _log("Running ANALYZE...")
+    cursor.execute("ANALYZE")
     _log("Running VACUUM...")
     cursor.execute("PRAGMA journal_mode=DELETE")
     cursor.execute("PRAGMA synchronous=FULL")
@@ -758,9 +766,11 @@ def _consolidate_tipi_database(output_path: Path) -> None:
 
     cursor.execute("""
         CREATE VIRTUAL TABLE tipi_fts USING fts5(
-            ncm, descricao, aliquota,
+            ncm, descricao, aliquota UNINDEXED,
             content='tipi_positions',
-            content_rowid='rowid'
+            content_rowid='rowid',
+            tokenize='unicode61 remove_diacritics 2',
+            prefix='2 3 4'
         )
     """)
     cursor.execute("INSERT INTO tipi_fts(tipi_fts) VALUES('rebuild')")
@@ -41,6 +41,7 @@ from backend.domain.sqlmodels import (  # noqa: E402
 )
 from backend.infrastructure.db_engine import get_session  # noqa: E402
 from backend.utils.hash_util import calculate_file_sha256  # noqa: E402
+from backend.utils.id_utils import generate_anchor_id  # noqa: E402
 from backend.utils.nbs_parser import build_nbs_items, iter_nbs_rows  # noqa: E402
 
 DATA_DIR = PROJECT_ROOT / "data"
@@ -301,7 +302,9 @@ async def migrate_positions(sqlite_path: str, pg_session: AsyncSession) -> int:
                     "codigo": row["codigo"],
                     "descricao": row["descricao"],
                     "chapter_num": row["chapter_num"],
-                    "anchor_id": row["anchor_id"] if has_anchor else None,
+                    # Core INSERT não dispara o before_insert do ORM: calcula aqui.
+                    "anchor_id": (row["anchor_id"] if has_anchor else None)
+                    or generate_anchor_id(row["codigo"]),
                     "tenant_id": None,
                 }
                 unique_positions[candidate["codigo"]] = _choose_preferred_position(
@@ -468,6 +471,8 @@ async def migrate_tipi_positions(
                         "nivel": row["nivel"],
                         "parent_ncm": row["parent_ncm"],
                         "ncm_sort": row["ncm_sort"],
+                        # Core INSERT não dispara o before_insert do ORM.
+                        "anchor_id": generate_anchor_id(row["ncm"]),
                     }
                 )
                 count += 1
@@ -482,6 +487,7 @@ async def migrate_tipi_positions(
                             "nivel": stmt.excluded.nivel,
                             "parent_ncm": stmt.excluded.parent_ncm,
                             "ncm_sort": stmt.excluded.ncm_sort,
+                            "anchor_id": stmt.excluded.anchor_id,
                         },
                     )
                     await pg_session.execute(stmt)
@@ -498,6 +504,7 @@ async def migrate_tipi_positions(
                     "nivel": stmt.excluded.nivel,
                     "parent_ncm": stmt.excluded.parent_ncm,
                     "ncm_sort": stmt.excluded.ncm_sort,
+                    "anchor_id": stmt.excluded.anchor_id,
                 },
             )
             await pg_session.execute(stmt)
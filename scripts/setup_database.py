@@ -531,6 +531,10 @@ def create_database(chapters: dict, content_hash: str):
 
     conn.commit()
 
+    # sqlite_stat1: estatísticas do planner e contagens do health check.
+    cursor.execute("ANALYZE")
+    conn.commit()
+
     # Estatísticas finais
     cursor.execute("SELECT COUNT(*) FROM chapters")
     num_chapters = cursor.fetchone()[0]
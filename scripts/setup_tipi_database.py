@@ -66,9 +66,11 @@ def create_database():
     cursor.execute("""
         CREATE VIRTUAL TABLE tipi_fts USING fts5(
             ncm,
-            capitulo,
+            capitulo UNINDEXED,
             descricao,
-            aliquota
+            aliquota UNINDEXED,
+            tokenize='unicode61 remove_diacritics 2',
+            prefix='2 3 4'
         )
     """)
 
@@ -667,7 +667,7 @@ def _seed_nesh_db(db_path: Path) -> None:
     if not db_path.exists():
         db_path.touch()
 
-    processor = NeshTextProcessor(list(CONFIG.stopwords))
+    processor = NeshTextProcessor(list(CONFIG.search.stopwords_set))
     chapter_rows, note_rows, position_rows = _build_nesh_seed_rows()
 
     conn = sqlite3.connect(db_path)
@@ -10,6 +10,9 @@ pytestmark = pytest.mark.integration
 
 
 class _FakeCommentService:
+    def __init__(self) -> None:
+        self.bulk_calls: list[tuple] = []
+
     async def create_comment(
         self,
         payload,
@@ -61,6 +64,13 @@ class _FakeCommentService:
             user_image_url=user_image_url,
         )
 
+    async def moderate_bulk(
+        self, comment_ids, payload, tenant_id: str, admin_user_id: str
+    ):  # NOSONAR
+        await asyncio.sleep(0)
+        self.bulk_calls.append((comment_ids, payload.action, tenant_id, admin_user_id))
+        return len(set(comment_ids))
+
     async def get_commented_anchors(self, tenant_id: str):  # NOSONAR
         """
         Return a list of commented anchor keys for the given tenant.
@@ -250,3 +260,48 @@ def test_list_commented_anchors_uses_org_id_claim_when_tenant_context_is_missing
 
     assert response.status_code == 200
     assert response.json() == ["auto-anchor-1"]
+
+
+def test_bulk_moderation_updates_tenant_comments_in_one_call(client, monkeypatch):
+    async def _mock_decode(_t):  # NOSONAR
+        return {"sub": "admin_1", "org_id": "org_bulk"}
+
+    service = _FakeCommentService()
+    monkeypatch.setattr(comments, "decode_clerk_jwt", _mock_decode)
+    monkeypatch.setattr(comments, "get_current_tenant", lambda: None)
+    monkeypatch.setattr(comments, "is_admin_payload", lambda _payload: True)
+    app.dependency_overrides[comments._get_service] = lambda: service
+
+    response = client.patch(
+        "/api/comments/admin/bulk",
+        json={"ids": [3, 5, 3], "action": "approve"},
+        headers={"Authorization": "Bearer mock-auth-header"},
+    )
+
+    assert response.status_code == 200
+    assert response.json() == {"updated": 2}
+    assert service.bulk_calls == [([3, 5, 3], "approve", "org_bulk", "admin_1")]
+
+
+def test_bulk_moderation_requires_admin_and_ids(client, monkeypatch):
+    async def _mock_decode(_t):  # NOSONAR
+        return {"sub": "user_1", "org_id": "org_bulk"}
+
+    monkeypatch.setattr(comments, "decode_clerk_jwt", _mock_decode)
+    app.dependency_overrides[comments._get_service] = lambda: _FakeCommentService()
+    headers = {"Authorization": "Bearer mock-auth-header"}
+
+    forbidden = client.patch(
+        "/api/comments/admin/bulk",
+        json={"ids": [1], "action": "reject"},
+        headers=headers,
+    )
+    assert forbidden.status_code == 403
+
+    monkeypatch.setattr(comments, "is_admin_payload", lambda _payload: True)
+    empty = client.patch(
+        "/api/comments/admin/bulk",
+        json={"ids": [], "action": "reject"},
+        headers=headers,
+    )
+    assert empty.status_code == 422
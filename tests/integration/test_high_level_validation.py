@@ -10,7 +10,7 @@ pytestmark = pytest.mark.integration
 
 def test_database_integrity():
     """Validação de integridade do banco de dados (anteriormente debug_nesh.py)"""
-    db_path = CONFIG.db_path
+    db_path = CONFIG.database.path
     assert os.path.exists(db_path), f"Banco de dados NESH não encontrado em {db_path}"
 
     conn = sqlite3.connect(db_path)
@@ -208,6 +208,7 @@ def test_search_chapter_body_allows_anonymous_access(client, monkeypatch):
 
     response = client.get("/api/search/chapter/84/body")
     assert response.status_code == 200
+    assert response.headers["content-type"] == "application/json"
     payload = response.json()
 
     assert payload["success"] is True
@@ -217,6 +218,21 @@ def test_search_chapter_body_allows_anonymous_access(client, monkeypatch):
     assert payload["notas_gerais"] == "Notas gerais"
 
 
+def test_search_chapter_body_defaults_null_parsed_notes(client, monkeypatch):
+    monkeypatch.setattr(
+        NeshService,
+        "fetchNeshChapterData",
+        AsyncMock(
+            return_value={"content": "Conteudo", "parsed_notes": None, "notes": None}
+        ),
+    )
+
+    response = client.get("/api/search/chapter/84/body")
+
+    assert response.status_code == 200
+    assert response.json()["notas_parseadas"] == {}
+
+
 def test_search_chapters_endpoint_returns_available_chapters(client, monkeypatch):
     expected_chapters = ["01", "02", "84"]
     monkeypatch.setattr(
@@ -274,9 +290,11 @@ def test_nesh_chapter_notes_endpoint_returns_404_when_chapter_missing(
 
 def test_glossary_endpoint_returns_found_and_not_found_contracts(client, monkeypatch):
     monkeypatch.setattr(
-        search_route.glossary_manager,
+        type(search_route.glossary_manager),
         "get_definition",
-        lambda term: {"definicao": f"def-{term}"} if term == "drawback" else None,
+        lambda _self, term: (
+            {"definicao": f"def-{term}"} if term == "drawback" else None
+        ),
     )
 
     found = client.get("/api/glossary?term=drawback")
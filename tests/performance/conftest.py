@@ -59,7 +59,7 @@ def nesh_service(_performance_environment):
     project_root = os.getcwd()
     init_glossary(project_root)
 
-    db = DatabaseAdapter(CONFIG.db_path)
+    db = DatabaseAdapter(CONFIG.database.path)
     svc = NeshService(db)
     try:
         yield svc
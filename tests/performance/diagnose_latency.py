@@ -55,7 +55,7 @@ def main():
     # 1) Raw SQLite
     import sqlite3
 
-    conn = sqlite3.connect(CONFIG.db_path)
+    conn = sqlite3.connect(CONFIG.database.path)
 
     def raw_sql():
         c = conn.cursor()
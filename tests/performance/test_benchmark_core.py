@@ -81,7 +81,7 @@ def test_bench_raw_sqlite_query(benchmark):
     """
     Benchmark raw SQLite performance to measure API overhead.
     """
-    conn = sqlite3.connect(CONFIG.db_path)
+    conn = sqlite3.connect(CONFIG.database.path)
 
     def run_query():
         cursor = conn.cursor()
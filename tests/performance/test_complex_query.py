@@ -14,7 +14,7 @@ async def test_complex_query_performance():
     """
     Tests performance of complex/edge-case queries.
     """
-    db = DatabaseAdapter(CONFIG.db_path)
+    db = DatabaseAdapter(CONFIG.database.path)
     await db._ensure_pool()
     service = NeshService(db)
 
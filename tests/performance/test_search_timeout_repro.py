@@ -23,7 +23,7 @@ async def test_search_performance_repro():
     """
 
     # Initialize DB and Service directly to avoid API overhead for this specific perf test
-    db = DatabaseAdapter(CONFIG.db_path)
+    db = DatabaseAdapter(CONFIG.database.path)
     await db._ensure_pool()
     service = NeshService(db)
 
@@ -1,6 +1,8 @@
 from types import SimpleNamespace
 
 import pytest
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+from backend.domain.sqlmodels import PositionRead
 from backend.infrastructure.repositories.chapter_repository import ChapterRepository
 
 pytestmark = pytest.mark.unit
@@ -56,7 +58,11 @@ async def test_get_by_num_returns_loaded_chapter_and_applies_tenant_filter(monke
     got = await repo.get_by_num("85")
     assert got is chapter
     stmt, _ = session.calls[0]
-    assert "tenant_id" in str(stmt)
+    sql = str(stmt)
+    assert "tenant_id" in sql
+    # notes entra no JOIN; positions fica para o selectinload separado.
+    assert "JOIN chapter_notes" in sql
+    assert "JOIN positions" not in sql
 
 
 @pytest.mark.asyncio
@@ -72,7 +78,7 @@ async def test_get_by_num_as_read_returns_none_when_missing(monkeypatch):
     assert got is None
 
 
-def test_to_read_model_maps_positions_and_notes_with_anchor_fallback(monkeypatch):
+def test_to_read_model_maps_positions_and_notes_with_stored_anchors(monkeypatch):
     monkeypatch.setattr(
         "backend.infrastructure.repositories.chapter_repository.settings.database.engine",
         "sqlite",
@@ -83,7 +89,9 @@ def test_to_read_model_maps_positions_and_notes_with_anchor_fallback(monkeypatch
         chapter_num="85",
         content="Conteudo",
         positions=[
-            SimpleNamespace(codigo="85.17", descricao="Telefone", anchor_id=None),
+            SimpleNamespace(
+                codigo="85.17", descricao="Telefone", anchor_id="pos-85-17"
+            ),
             SimpleNamespace(
                 codigo="85.18", descricao="Audio", anchor_id="custom-anchor"
             ),
@@ -105,6 +113,31 @@ def test_to_read_model_maps_positions_and_notes_with_anchor_fallback(monkeypatch
     assert out.notes and out.notes.titulo == "Titulo"
 
 
+def test_to_read_model_builds_models_without_validation(monkeypatch):
+    monkeypatch.setattr(
+        "backend.infrastructure.repositories.chapter_repository.settings.database.engine",
+        "sqlite",
+    )
+    repo = ChapterRepository(_FakeSession([]))
+    chapter = SimpleNamespace(
+        chapter_num="85",
+        content="Conteudo",
+        positions=[
+            SimpleNamespace(codigo="85.17", descricao="Telefone", anchor_id=None)
+        ],
+        notes=None,
+    )
+
+    model = repo._to_read_model(chapter)
+    assert isinstance(model.positions[0], PositionRead)
+    assert model.model_dump() == {
+        "chapter_num": "85",
+        "content": "Conteudo",
+        "positions": [{"codigo": "85.17", "descricao": "Telefone", "anchor_id": None}],
+        "notes": None,
+    }
+
+
 @pytest.mark.asyncio
 async def test_get_all_nums_returns_scalar_list(monkeypatch):
     monkeypatch.setattr(
@@ -158,15 +191,8 @@ async def test_fts_postgres_maps_rows_and_tenant_params(monkeypatch):
         "backend.infrastructure.repositories.chapter_repository.settings.database.engine",
         "postgresql",
     )
-    rows = [
-        SimpleNamespace(
-            ncm="85.17",
-            display_text="Tel",
-            type="position",
-            description="Desc",
-            score=0.5,
-        )
-    ]
+    # Rows em ordem posicional do SELECT (ncm, display_text, type, ...).
+    rows = [("85.17", "Tel", "position", "Desc", 50.0, 1)]
     session = _FakeSession([_FakeResult(rows=rows)])
     repo = ChapterRepository(session, tenant_id="org_pg")
 
@@ -174,8 +200,20 @@ async def test_fts_postgres_maps_rows_and_tenant_params(monkeypatch):
     assert len(out) == 1
     assert out[0].score == pytest.approx(50.0)
     stmt, params = session.calls[0]
-    assert "tenant_id" in str(stmt)
-    assert params == {"query": "telefone", "limit": 3, "tenant_id": "org_pg"}
+    stmt_text = str(stmt)
+    # Posições e capítulos numa única query, com filtro de tenant nos dois ramos.
+    assert "UNION ALL" in stmt_text
+    assert "FROM positions p" in stmt_text and "FROM chapters c" in stmt_text
+    assert "p.tenant_id = :tenant_id" in stmt_text
+    assert "c.tenant_id = :tenant_id" in stmt_text
+    assert params == {
+        "query": "telefone",
+        "limit": 3,
+        "base": 0.0,
+        "coverage_bonus": 0.0,
+        "tier": 1,
+        "tenant_id": "org_pg",
+    }
 
 
 @pytest.mark.asyncio
@@ -192,7 +230,8 @@ async def test_fts_postgres_uses_phrase_query_for_exact_search(monkeypatch):
     stmt, params = session.calls[0]
     stmt_text = str(stmt)
     assert "phraseto_tsquery('portuguese', :query)" in stmt_text
-    assert params == {"query": "motor centrif", "limit": 4}
+    assert params["query"] == "motor centrif"
+    assert params["limit"] == 4
 
 
 @pytest.mark.asyncio
@@ -207,7 +246,8 @@ async def test_fts_sqlite_maps_rank(monkeypatch):
             display_text="Tel",
             type="position",
             description="Desc",
-            rank=-1.2,
+            score=12.0,
+            tier=1,
         )
     ]
     session = _FakeSession([_FakeResult(rows=rows)])
@@ -216,27 +256,42 @@ async def test_fts_sqlite_maps_rank(monkeypatch):
     out = await repo._fts_sqlite("telefone", 9)
     assert len(out) == 1
     assert out[0].score == pytest.approx(12.0)
-    _stmt, params = session.calls[0]
-    assert params == {"query": "telefone", "limit": 9}
+    stmt, params = session.calls[0]
+    assert "- rank * 10" in str(stmt)
+    assert params == {
+        "query": "telefone",
+        "limit": 9,
+        "base": 0.0,
+        "coverage_bonus": 0.0,
+        "tier": 1,
+    }
 
 
 @pytest.mark.asyncio
-async def test_search_scored_applies_tier_base_and_coverage_bonus(monkeypatch):
-    monkeypatch.setattr(
-        "backend.infrastructure.repositories.chapter_repository.settings.database.engine",
-        "sqlite",
-    )
-    repo = ChapterRepository(_FakeSession([]))
-
-    async def _fake_search(_q, _limit):
-        return [SimpleNamespace(score=10.0, tier=0), SimpleNamespace(score=1.0, tier=0)]
-
-    monkeypatch.setattr(repo, "search_fulltext", _fake_search)
-    out = await repo.search_scored(
-        "abc", tier=2, limit=20, words_matched=2, total_words=4
-    )
-
-    # Base tier=2 -> 500, coverage bonus=50
-    assert out[0].score == pytest.approx(560.0)
-    assert out[1].score == pytest.approx(551.0)
-    assert all(item.tier == 2 for item in out)
+async def test_search_scored_applies_tier_base_and_coverage_bonus(tmp_path):
+    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'fts.db'}")
+    try:
+        async with engine.begin() as conn:
+            await conn.exec_driver_sql(
+                "CREATE VIRTUAL TABLE search_index USING fts5("
+                "ncm, display_text, type, description, indexed_content)"
+            )
+            await conn.exec_driver_sql(
+                "INSERT INTO search_index VALUES "
+                "('85.17', 'Tel', 'position', 'Desc', 'telefone celular'), "
+                "('85.18', 'Mic', 'position', 'Desc', 'microfone')"
+            )
+        async with AsyncSession(engine) as session:
+            repo = ChapterRepository(session)
+            repo.is_postgres = False
+            out = await repo.search_scored(
+                "telefone", tier=2, limit=20, words_matched=2, total_words=4
+            )
+    finally:
+        await engine.dispose()
+
+    # Base tier=2 -> 500, coverage bonus=50, mais o bm25 normalizado
+    assert [item.ncm for item in out] == ["85.17"]
+    assert out[0].tier == 2
+    assert 550.0 <= out[0].score < 650.0
+    assert out[0].score == round(out[0].score, 1)
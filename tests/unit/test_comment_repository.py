@@ -0,0 +1,96 @@
+import pytest
+from sqlalchemy import event, text
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+
+from backend.domain.comment_models import Comment
+from backend.infrastructure.repositories.comment_repository import CommentRepository
+
+pytestmark = pytest.mark.unit
+
+
+@pytest.mark.asyncio
+async def test_writes_populate_comment_without_refresh_select():
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+    statements: list[str] = []
+    try:
+        async with engine.begin() as conn:
+            await conn.run_sync(Comment.__table__.create)  # type: ignore[attr-defined]
+
+        @event.listens_for(engine.sync_engine, "before_cursor_execute")
+        def _capture(_conn, _cursor, statement, *_args):
+            statements.append(statement.lstrip().split(None, 1)[0].upper())
+
+        async with AsyncSession(engine) as session:
+            repo = CommentRepository(session)
+            comment = await repo.create(
+                Comment(
+                    tenant_id="t1",
+                    user_id="u1",
+                    anchor_key="pos-85-17",
+                    selected_text="Telefone",
+                    body="Texto",
+                )
+            )
+            assert comment.id is not None
+            assert comment.status == "pending"
+
+            await repo.update_status(comment, "approved", "admin", note="ok")
+            assert comment.moderated_at == comment.updated_at
+            await repo.update_body(comment, "Texto revisado")
+
+            assert comment.status == "pending"
+            assert comment.moderation_note == "ok"
+            assert comment.body == "Texto revisado"
+            assert "SELECT" not in statements
+            assert statements.count("UPDATE") == 2
+    finally:
+        await engine.dispose()
+
+
+@pytest.mark.asyncio
+async def test_bulk_update_status_moderates_only_tenant_rows_in_one_update():
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+    statements: list[str] = []
+    try:
+        async with engine.begin() as conn:
+            await conn.run_sync(Comment.__table__.create)  # type: ignore[attr-defined]
+
+        async with AsyncSession(engine) as session:
+            repo = CommentRepository(session)
+            created = [
+                await repo.create(
+                    Comment(
+                        tenant_id=tenant_id,
+                        user_id="u1",
+                        anchor_key="pos-85-17",
+                        selected_text="Telefone",
+                        body="Texto",
+                    )
+                )
+                for tenant_id in ("t1", "t1", "t2")
+            ]
+            ids = [c.id for c in created]
+
+            @event.listens_for(engine.sync_engine, "before_cursor_execute")
+            def _capture(_conn, _cursor, statement, *_args):
+                statements.append(statement.lstrip().split(None, 1)[0].upper())
+
+            updated = await repo.bulk_update_status(
+                "t1", ids, "approved", "admin", note="lote"
+            )
+            assert updated == 2
+            assert statements == ["UPDATE"]
+
+            rows = (
+                await session.execute(
+                    text("SELECT tenant_id, status, moderation_note FROM comments")
+                )
+            ).all()
+            assert sorted(rows) == [
+                ("t1", "approved", "lote"),
+                ("t1", "approved", "lote"),
+                ("t2", "pending", None),
+            ]
+            assert await repo.bulk_update_status("t1", [], "approved", "admin") == 0
+    finally:
+        await engine.dispose()
@@ -4,14 +4,16 @@ from unittest.mock import AsyncMock
 import pytest
 from pydantic import ValidationError
 
+from backend.infrastructure import db_engine
 from backend.presentation.schemas.comment_schemas import CommentCreate, CommentUpdate
+from backend.services import comment_service as comment_service_mod
 from backend.services.comment_service import CommentNotEditableError, CommentService
 
 pytestmark = pytest.mark.unit
 
 
 def _make_service_with_repo(repo) -> CommentService:
-    service = CommentService(session=object())
+    service = CommentService(session=SimpleNamespace(info={}))
     service.repo = repo
     return service
 
@@ -107,18 +109,52 @@ async def test_delete_comment_raises_when_user_is_not_author():
 
 
 @pytest.mark.asyncio
-async def test_delete_comment_deletes_comment_when_authorized():
-    comment = SimpleNamespace(tenant_id="tenant-1", user_id="user-1")
+async def test_delete_comment_deletes_comment_when_authorized(monkeypatch):
+    comment = SimpleNamespace(tenant_id="tenant-1", user_id="user-1", status="approved")
     repo = SimpleNamespace(
         get_by_id_and_tenant=AsyncMock(return_value=comment),
         delete=AsyncMock(),
     )
     service = _make_service_with_repo(repo)
+    invalidate = AsyncMock()
+    monkeypatch.setattr(
+        comment_service_mod.redis_cache, "invalidate_comment_anchors", invalidate
+    )
 
     await service.delete_comment(7, "tenant-1", "user-1")
 
     repo.get_by_id_and_tenant.assert_awaited_once_with(7, "tenant-1")
     repo.delete.assert_awaited_once_with(comment)
+    # Só após o COMMIT da sessão (get_session roda os callbacks).
+    invalidate.assert_not_awaited()
+    await db_engine._run_after_commit_callbacks(service.session)
+    invalidate.assert_awaited_once_with("tenant-1")
+
+
+@pytest.mark.asyncio
+async def test_get_commented_anchors_reads_through_redis(monkeypatch):
+    repo = SimpleNamespace(
+        list_anchors_with_comments=AsyncMock(return_value=["pos-84-13"])
+    )
+    service = _make_service_with_repo(repo)
+    cached: dict[str, list[str]] = {}
+
+    async def fake_get(tenant_id):
+        return cached.get(tenant_id)
+
+    async def fake_set(tenant_id, anchors):
+        cached[tenant_id] = anchors
+
+    monkeypatch.setattr(
+        comment_service_mod.redis_cache, "get_comment_anchors", fake_get
+    )
+    monkeypatch.setattr(
+        comment_service_mod.redis_cache, "set_comment_anchors", fake_set
+    )
+
+    assert await service.get_commented_anchors("tenant-1") == ["pos-84-13"]
+    assert await service.get_commented_anchors("tenant-1") == ["pos-84-13"]
+    repo.list_anchors_with_comments.assert_awaited_once_with("tenant-1")
 
 
 def test_comment_create_rejects_html_body():
@@ -181,3 +217,28 @@ def test_comment_create_rejects_legacy_identity_fields():
             is_private=False,
             user_name="Spoofed",
         )
+
+
+@pytest.mark.asyncio
+async def test_moderate_bulk_dedupes_ids_and_invalidates_anchor_cache(monkeypatch):
+    repo = SimpleNamespace(bulk_update_status=AsyncMock(return_value=2))
+    service = _make_service_with_repo(repo)
+    invalidate = AsyncMock()
+    monkeypatch.setattr(
+        comment_service_mod.redis_cache, "invalidate_comment_anchors", invalidate
+    )
+    payload = SimpleNamespace(action="approve", note=None)
+
+    updated = await service.moderate_bulk([3, 5, 3], payload, "tenant-1", "admin-1")
+
+    assert updated == 2
+    repo.bulk_update_status.assert_awaited_once_with(
+        "tenant-1", [3, 5], status="approved", moderated_by="admin-1", note=None
+    )
+    invalidate.assert_not_awaited()
+    await db_engine._run_after_commit_callbacks(service.session)
+    invalidate.assert_awaited_once_with("tenant-1")
+
+    repo.bulk_update_status.reset_mock()
+    assert await service.moderate_bulk([], payload, "tenant-1", "admin-1") == 0
+    repo.bulk_update_status.assert_not_awaited()
@@ -0,0 +1,40 @@
+import subprocess
+import sys
+
+import backend.config as config
+import pytest
+
+pytestmark = pytest.mark.unit
+
+
+def test_lazy_exports_resolve_to_submodule_objects():
+    from backend.config.constants import RegexPatterns
+    from backend.config.loader import CONFIG
+
+    assert config.RegexPatterns is RegexPatterns
+    assert config.CONFIG is CONFIG
+    assert set(config.__all__) <= set(dir(config))
+
+
+def test_baseline_route_and_header_namespaces_stay_exported():
+    assert config.ApiRoutes.SEARCH == "/api/search"
+    assert config.ApiRoutes.CHAPTERS == "/api/chapters"
+    assert config.HttpHeaders.CONTENT_TYPE_JSON == "application/json; charset=utf-8"
+    assert config.HttpHeaders.CORS_ALLOW_ALL == "*"
+    assert {"ApiRoutes", "HttpHeaders"} <= set(config.__all__)
+
+
+def test_unknown_export_raises_attribute_error():
+    with pytest.raises(AttributeError):
+        getattr(config, "DOES_NOT_EXIST")
+
+
+def test_importing_constants_does_not_load_settings():
+    code = (
+        "import sys, backend.config.constants; "
+        "print('backend.config.settings' in sys.modules)"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    )
+    assert result.stdout.strip() == "False"
@@ -0,0 +1,276 @@
+import asyncio
+import os
+import sqlite3
+
+import pytest
+
+from backend.config.exceptions import DatabaseError
+from backend.config.settings import settings
+from backend.infrastructure.database import ConnectionPool
+
+pytestmark = pytest.mark.unit
+
+
+@pytest.fixture
+def db_file(tmp_path):
+    path = tmp_path / "pool.db"
+    sqlite3.connect(path).close()
+    return str(path)
+
+
+@pytest.mark.asyncio
+async def test_new_connections_apply_configured_pragmas(db_file, monkeypatch):
+    monkeypatch.setattr(settings.database, "sqlite_cache_size", -2048)
+    monkeypatch.setattr(settings.database, "sqlite_busy_timeout_ms", 1234)
+    pool = ConnectionPool(db_file, max_size=1)
+
+    conn = await pool.get()
+    try:
+        pragmas = {}
+        for name in (
+            "journal_mode",
+            "synchronous",
+            "temp_store",
+            "cache_size",
+            "busy_timeout",
+            "wal_autocheckpoint",
+        ):
+            cursor = await conn.execute(f"PRAGMA {name}")
+            pragmas[name] = (await cursor.fetchone())[0]
+    finally:
+        await pool.release(conn)
+        await pool.close_all()
+
+    assert pragmas == {
+        "journal_mode": "wal",
+        "synchronous": 1,  # NORMAL
+        "temp_store": 2,  # MEMORY
+        "cache_size": -2048,
+        "busy_timeout": 1234,
+        "wal_autocheckpoint": 1000,
+    }
+
+
+@pytest.mark.asyncio
+async def test_pragmas_are_sent_in_a_single_script(monkeypatch):
+    class _RecordingConn:
+        row_factory = None
+
+        def __init__(self):
+            self.scripts = []
+            self.executed = []
+
+        async def executescript(self, script):
+            self.scripts.append(script)
+
+        async def execute(self, sql, *args):
+            self.executed.append(sql)
+
+    conn = _RecordingConn()
+    connect_kwargs = {}
+
+    async def _fake_connect(_path, **kwargs):
+        connect_kwargs.update(kwargs)
+        return conn
+
+    monkeypatch.setattr(
+        "backend.infrastructure.database.aiosqlite.connect", _fake_connect
+    )
+
+    assert await ConnectionPool("unused.db").get() is conn
+    assert conn.executed == []
+    assert len(conn.scripts) == 1
+    assert "PRAGMA journal_mode=WAL" in conn.scripts[0]
+    assert "PRAGMA mmap_size=" in conn.scripts[0]
+    assert connect_kwargs == {
+        "cached_statements": settings.database.sqlite_cached_statements
+    }
+
+
+@pytest.mark.asyncio
+async def test_pool_caps_connections_and_hands_released_ones_to_waiters(db_file):
+    pool = ConnectionPool(db_file, max_size=2)
+    first = await pool.get()
+    second = await pool.get()
+
+    waiter = asyncio.create_task(pool.get())
+    await asyncio.sleep(0)
+    assert not waiter.done()
+    assert pool._created == 2
+
+    await pool.release(first)
+    assert await asyncio.wait_for(waiter, timeout=1) is first
+
+    await pool.release(first)
+    await pool.release(second)
+    assert await pool.get() is second  # LIFO: a mais quente primeiro
+    await pool.release(second)
+    await pool.close_all()
+    assert pool._created == 0
+
+
+@pytest.mark.asyncio
+async def test_failed_connection_does_not_consume_a_slot(monkeypatch):
+    async def _broken_connect(_path, **_kwargs):
+        raise sqlite3.OperationalError("boom")
+
+    monkeypatch.setattr(
+        "backend.infrastructure.database.aiosqlite.connect", _broken_connect
+    )
+    pool = ConnectionPool("unused.db", max_size=1)
+
+    with pytest.raises(DatabaseError):
+        await pool.get()
+    assert pool._created == 0
+
+
+@pytest.mark.asyncio
+async def test_release_sweeps_connections_idle_past_timeout(db_file, monkeypatch):
+    clock = [1000.0]
+    monkeypatch.setattr(
+        "backend.infrastructure.database.time.monotonic", lambda: clock[0]
+    )
+    pool = ConnectionPool(db_file, max_size=3, idle_timeout=10)
+    cold = await pool.get()
+    warm = await pool.get()
+
+    await pool.release(cold)
+    clock[0] += 20
+    await pool.release(warm)  # varredura: "cold" ficou ociosa > 10s
+
+    assert pool._created == 1
+    assert pool._idle.qsize() == 1
+    assert await pool.get() is warm
+    await pool.release(warm)
+    await pool.close_all()
+
+
+@pytest.mark.asyncio
+async def test_adapter_splits_read_only_readers_from_single_writer(db_file):
+    from backend.infrastructure.database import DatabaseAdapter
+
+    adapter = DatabaseAdapter(db_file, pool_size=3)
+    try:
+        async with adapter.get_reader_connection() as reader:
+            cursor = await reader.execute("PRAGMA query_only")
+            assert (await cursor.fetchone())[0] == 1
+            with pytest.raises(DatabaseError):
+                async with adapter.get_reader_connection() as other_reader:
+                    await other_reader.execute("CREATE TABLE t (x INTEGER)")
+
+        async with adapter.get_writer_connection() as writer:
+            await writer.execute("CREATE TABLE t (x INTEGER)")
+            await writer.commit()
+
+        # get_connection continua leitura/escrita (vai para o writer).
+        async with adapter.get_connection() as conn:
+            await conn.execute("INSERT INTO t VALUES (1)")
+            await conn.commit()
+
+        assert adapter._reader_pool.max_size == 3
+        assert adapter._writer_pool.max_size == 1
+    finally:
+        await adapter.close()
+        DatabaseAdapter._pools.pop((db_file, "reader"), None)
+        DatabaseAdapter._pools.pop((db_file, "writer"), None)
+
+
+@pytest.mark.asyncio
+async def test_concurrent_adapters_share_one_pool_pair(db_file):
+    from backend.infrastructure.database import DatabaseAdapter
+
+    adapters = [DatabaseAdapter(db_file, pool_size=2) for _ in range(5)]
+    try:
+        await asyncio.gather(*(adapter._ensure_pool() for adapter in adapters))
+        assert len({id(adapter._reader_pool) for adapter in adapters}) == 1
+        assert len({id(adapter._writer_pool) for adapter in adapters}) == 1
+    finally:
+        DatabaseAdapter._pools.pop((db_file, "reader"), None)
+        DatabaseAdapter._pools.pop((db_file, "writer"), None)
+
+
+@pytest.mark.asyncio
+async def test_check_connection_reports_missing_db_without_extra_stat(
+    tmp_path, monkeypatch
+):
+    from backend.infrastructure import database
+    from backend.infrastructure.database import DatabaseAdapter
+
+    stats: list[str] = []
+    real_exists = database.os.path.exists
+    monkeypatch.setattr(
+        database.os.path, "exists", lambda p: stats.append(p) or real_exists(p)
+    )
+
+    missing = DatabaseAdapter(str(tmp_path / "missing.db"))
+    assert await missing.check_connection() is None
+    assert len(stats) == 1
+
+
+@pytest.mark.asyncio
+async def test_check_connection_prefers_sqlite_stat1_estimates(tmp_path):
+    from backend.infrastructure.database import DatabaseAdapter
+
+    db_path = str(tmp_path / "stats.db")
+    with sqlite3.connect(db_path) as setup:
+        setup.executescript(
+            """
+            CREATE TABLE chapters (chapter_num TEXT PRIMARY KEY);
+            CREATE TABLE positions (codigo TEXT PRIMARY KEY);
+            INSERT INTO chapters VALUES ('84'), ('85');
+            INSERT INTO positions VALUES ('84.13'), ('84.14'), ('85.17');
+            """
+        )
+
+    adapter = DatabaseAdapter(db_path)
+    try:
+        assert await adapter.check_connection() == {
+            "chapters": 2,
+            "positions": 3,
+            "size": os.path.getsize(db_path),
+        }
+
+        with sqlite3.connect(db_path) as setup:
+            setup.execute("ANALYZE")
+            setup.execute(
+                "UPDATE sqlite_stat1 SET stat = '900 1' WHERE tbl = 'positions'"
+            )
+        adapter._stats_cache = None
+
+        stats = await adapter.check_connection()
+        assert (stats["chapters"], stats["positions"]) == (2, 900)
+    finally:
+        await adapter.close()
+        DatabaseAdapter._pools.pop((db_path, "reader"), None)
+        DatabaseAdapter._pools.pop((db_path, "writer"), None)
+
+
+@pytest.mark.asyncio
+async def test_adapter_read_path_never_opens_the_writer(tmp_path):
+    from backend.infrastructure.database import DatabaseAdapter
+
+    db_path = str(tmp_path / "shipped.db")
+    with sqlite3.connect(db_path) as setup:
+        setup.executescript(
+            """
+            CREATE TABLE chapters (chapter_num TEXT PRIMARY KEY);
+            INSERT INTO chapters VALUES ('84');
+            """
+        )
+
+    adapter = DatabaseAdapter(db_path)
+    try:
+        assert await adapter.get_all_chapters_list() == ["84"]
+        # Artefato somente leitura: nada de ANALYZE/optimize em runtime.
+        assert adapter._writer_pool._created == 0
+        with sqlite3.connect(db_path) as check:
+            assert (
+                check.execute(
+                    "SELECT 1 FROM sqlite_master WHERE name = 'sqlite_stat1'"
+                ).fetchone()
+                is None
+            )
+    finally:
+        await adapter.close()
+        DatabaseAdapter._pools.pop((db_path, "reader"), None)
+        DatabaseAdapter._pools.pop((db_path, "writer"), None)
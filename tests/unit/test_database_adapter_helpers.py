@@ -8,6 +8,11 @@ from backend.infrastructure.database import DatabaseAdapter
 from backend.infrastructure.database_search import DatabaseSearchQueries
 
 
+@pytest.fixture(autouse=True)
+def _isolated_schema_states(monkeypatch):
+    monkeypatch.setattr(DatabaseSearchQueries, "_schema_states", {})
+
+
 @pytest.mark.unit
 def test_sanitize_fts_token_quotes_normal_token() -> None:
     assert DatabaseAdapter._sanitize_fts_token("motor") == '"motor"'
@@ -91,3 +96,264 @@ async def test_execute_fts_query_caps_limit_to_max(monkeypatch):
     )
 
     assert fake_conn.calls[0][1][1] == SearchConfig.MAX_FTS_RESULTS
+
+
+@pytest.mark.asyncio
+async def test_execute_fts_query_reuses_sql_per_schema_shape(monkeypatch):
+    queries = DatabaseSearchQueries(SimpleNamespace(db_path="db.sqlite"))
+    fake_conn = _FakeConn()
+    schema = {"available": True, "content_column": "indexed_content"}
+    monkeypatch.setattr(
+        queries, "_get_fts_schema_cached", AsyncMock(return_value=schema)
+    )
+
+    await queries._execute_fts_query(fake_conn, "motor", 5, raise_on_unavailable=True)
+    await queries._execute_fts_query(fake_conn, "bomba", 5, raise_on_unavailable=True)
+
+    first_sql, second_sql = (call[0] for call in fake_conn.calls)
+    assert first_sql is second_sql
+    assert "indexed_content MATCH ?" in first_sql
+    assert "bm25(search_index)" in first_sql
+
+    schema["supports_rank"] = True
+    await queries._execute_fts_query(fake_conn, "motor", 5, raise_on_unavailable=True)
+    assert fake_conn.calls[2][0] is not first_sql
+    assert "ORDER BY rank" in fake_conn.calls[2][0]
+
+
+@pytest.mark.asyncio
+async def test_schema_probe_loads_all_tables_in_one_query(tmp_path):
+    import sqlite3
+
+    import aiosqlite
+
+    db_path = tmp_path / "schema.db"
+    with sqlite3.connect(db_path) as setup:
+        setup.executescript(
+            """
+            CREATE TABLE positions (codigo TEXT, descricao TEXT, anchor_id TEXT);
+            CREATE TABLE chapter_notes (chapter_num TEXT, notes_content TEXT);
+            CREATE VIRTUAL TABLE search_index USING fts5(ncm, indexed_content);
+            """
+        )
+
+    queries = DatabaseSearchQueries(SimpleNamespace(db_path=str(db_path)))
+    async with aiosqlite.connect(db_path) as conn:
+        conn.row_factory = aiosqlite.Row
+        statements = []
+        await conn.set_trace_callback(statements.append)
+
+        positions = await queries._get_positions_columns_cached(conn)
+        notes = await queries._get_chapter_notes_columns_cached(conn)
+        schema = await queries._get_fts_schema_cached(conn)
+
+    assert positions == {"codigo", "descricao", "anchor_id"}
+    assert notes == {"chapter_num", "notes_content"}
+    assert schema["available"] is True
+    assert schema["content_column"] == "indexed_content"
+    assert sum("pragma_table_info" in sql for sql in statements) == 1
+
+
+@pytest.mark.asyncio
+async def test_schema_probe_is_shared_across_instances_of_the_same_db(tmp_path):
+    import sqlite3
+
+    import aiosqlite
+
+    db_path = tmp_path / "shared.db"
+    with sqlite3.connect(db_path) as setup:
+        setup.execute("CREATE TABLE positions (codigo TEXT, anchor_id TEXT)")
+
+    first = DatabaseSearchQueries(SimpleNamespace(db_path=str(db_path)))
+    second = DatabaseSearchQueries(SimpleNamespace(db_path=str(db_path)))
+    other = DatabaseSearchQueries(SimpleNamespace(db_path=str(tmp_path / "x.db")))
+    assert first._fts_schema_cache is second._fts_schema_cache
+    assert first._fts_schema_cache is not other._fts_schema_cache
+
+    async with aiosqlite.connect(db_path) as conn:
+        conn.row_factory = aiosqlite.Row
+        statements = []
+        await conn.set_trace_callback(statements.append)
+
+        assert await first._get_positions_columns_cached(conn) == {
+            "codigo",
+            "anchor_id",
+        }
+        assert await second._get_positions_columns_cached(conn) == {
+            "codigo",
+            "anchor_id",
+        }
+
+    assert sum("pragma_table_info" in sql for sql in statements) == 1
+
+
+def test_db_signature_is_statted_once_per_ttl_window(monkeypatch):
+    queries = DatabaseSearchQueries(SimpleNamespace(db_path="db.sqlite"))
+    clock = [100.0]
+    stats = []
+    monkeypatch.setattr(
+        "backend.infrastructure.database_search.time.monotonic", lambda: clock[0]
+    )
+    monkeypatch.setattr(
+        queries, "_get_db_signature", lambda: stats.append(clock[0]) or (1, 2, 3, 4)
+    )
+
+    for _ in range(3):
+        assert queries._get_db_signature_cached() == (1, 2, 3, 4)
+    assert stats == [100.0]
+
+    clock[0] += 1.5
+    queries._get_db_signature_cached()
+    assert stats == [100.0, 101.5]
+
+
+def test_position_sort_key_orders_segments_numerically():
+    from backend.infrastructure.database_search import _position_sort_key
+
+    codes = ["85.17", "8517.10.00", "85.9", "85.10", "8517.9", "85", "abc", "85..1"]
+    assert sorted(codes, key=_position_sort_key) == [
+        "abc",
+        "85",
+        "85..1",
+        "85.9",
+        "85.10",
+        "85.17",
+        "8517.9",
+        "8517.10.00",
+    ]
+    assert _position_sort_key("85.17a") == (85, 17, 0)
+
+
+@pytest.mark.asyncio
+async def test_get_chapter_raw_fetches_positions_in_the_chapter_query(tmp_path):
+    import sqlite3
+    from contextlib import asynccontextmanager
+
+    import aiosqlite
+
+    db_path = tmp_path / "chapter.db"
+    with sqlite3.connect(db_path) as setup:
+        setup.executescript(
+            """
+            CREATE TABLE chapters (chapter_num TEXT PRIMARY KEY, content TEXT);
+            CREATE TABLE chapter_notes (chapter_num TEXT, notes_content TEXT);
+            CREATE TABLE positions (
+                codigo TEXT, chapter_num TEXT, descricao TEXT, anchor_id TEXT
+            );
+            INSERT INTO chapters VALUES ('85', 'Capítulo 85'), ('86', 'Capítulo 86');
+            INSERT INTO positions VALUES
+                ('85.10', '85', 'Dez', 'pos-85-10'),
+                ('85.9', '85', 'Nove', 'pos-85-9'),
+                (NULL, '85', 'Sem código', NULL);
+            """
+        )
+
+    statements: list[str] = []
+
+    @asynccontextmanager
+    async def reader():
+        async with aiosqlite.connect(db_path) as conn:
+            conn.row_factory = aiosqlite.Row
+            await conn.set_trace_callback(statements.append)
+            yield conn
+
+    queries = DatabaseSearchQueries(
+        SimpleNamespace(db_path=str(db_path), get_reader_connection=reader)
+    )
+    chapter = await queries.get_chapter_raw("85")
+    empty = await queries.get_chapter_raw("86")
+
+    assert chapter is not None
+    assert chapter["positions"] == [
+        {"codigo": "85.9", "descricao": "Nove", "anchor_id": "pos-85-9"},
+        {"codigo": "85.10", "descricao": "Dez", "anchor_id": "pos-85-10"},
+    ]
+    assert empty is not None and empty["positions"] == []
+    assert sum("FROM chapters" in sql for sql in statements) == 2
+    assert not any(sql.lstrip().startswith("SELECT codigo") for sql in statements)
+
+
+def test_has_section_content_ignores_blank_strings():
+    has_content = DatabaseSearchQueries._has_section_content
+
+    assert has_content({"a": None, "b": "  \n"}) is False
+    assert has_content({}) is False
+    assert has_content({"a": None, "b": " texto "}) is True
+    assert has_content({"a": b"bytes"}) is True
+
+
+@pytest.mark.asyncio
+async def test_fts_scored_builds_one_dict_per_row_and_near_returns_rows(tmp_path):
+    import sqlite3
+    from contextlib import asynccontextmanager
+
+    import aiosqlite
+
+    db_path = tmp_path / "fts.db"
+    with sqlite3.connect(db_path) as setup:
+        setup.executescript(
+            """
+            CREATE VIRTUAL TABLE search_index USING fts5(
+                ncm, display_text, type, description, indexed_content
+            );
+            INSERT INTO search_index VALUES
+                ('84.13', '84.13', 'position', 'Bombas', 'bomba submersivel');
+            """
+        )
+
+    @asynccontextmanager
+    async def reader():
+        async with aiosqlite.connect(db_path) as conn:
+            conn.row_factory = aiosqlite.Row
+            yield conn
+
+    queries = DatabaseSearchQueries(
+        SimpleNamespace(db_path=str(db_path), get_reader_connection=reader)
+    )
+
+    (scored,) = await queries.fts_search_scored("bomba", tier=1, limit=5)
+    assert set(scored) == {
+        "ncm",
+        "display_text",
+        "type",
+        "description",
+        "rank",
+        "score",
+        "tier",
+    }
+    assert scored["tier"] == 1
+    assert scored["score"] >= SearchConfig.TIER1_BASE_SCORE
+
+    near = await queries.fts_search_near(["bomba", "submersivel"], 5, 5)
+    assert isinstance(near[0], aiosqlite.Row)
+    assert near[0]["ncm"] == "84.13"
+
+
+@pytest.mark.parametrize("has_sections", [True, False])
+def test_chapter_sections_slice_matches_select_order(has_sections):
+    import sqlite3
+
+    from backend.config.db_schema import CHAPTER_NOTES_SECTION_COLUMNS
+    from backend.infrastructure.database_search import (
+        _CHAPTER_SECTIONS_SLICE,
+        _build_chapter_sql,
+    )
+
+    sql = _build_chapter_sql(has_sections, True, True)
+    assert _build_chapter_sql(has_sections, True, True) is sql
+    sections = ", ".join(f"{col} TEXT" for col in CHAPTER_NOTES_SECTION_COLUMNS)
+    conn = sqlite3.connect(":memory:")
+    conn.executescript(
+        f"""
+        CREATE TABLE chapters (chapter_num TEXT, content TEXT);
+        CREATE TABLE chapter_notes (
+            chapter_num TEXT, notes_content TEXT, parsed_notes_json TEXT, {sections}
+        );
+        CREATE TABLE positions (
+            codigo TEXT, chapter_num TEXT, descricao TEXT, anchor_id TEXT
+        );
+        """
+    )
+
+    names = [col[0] for col in conn.execute(sql, ("01",)).description]
+    assert tuple(names[_CHAPTER_SECTIONS_SLICE]) == CHAPTER_NOTES_SECTION_COLUMNS
@@ -49,7 +49,9 @@ def test_create_engine_uses_postgres_pool_settings(monkeypatch) -> None:
         calls.append((db_url, kwargs))
         return object()
 
+    tracked: list[object] = []
     monkeypatch.setattr(db_engine, "create_async_engine", fake_create_async_engine)
+    monkeypatch.setattr(db_engine, "_track_tenant_invalidation", tracked.append)
 
     try:
         settings.database.engine = "postgresql"
@@ -65,6 +67,12 @@ def test_create_engine_uses_postgres_pool_settings(monkeypatch) -> None:
         assert calls[0][1]["pool_recycle"] == 3600
         assert calls[0][1]["pool_timeout"] == 30
         assert calls[0][1]["echo"] is True
+        # is_local=true por padrão: nada a rastrear na conexão.
+        assert tracked == []
+
+        monkeypatch.setattr(settings.database, "postgres_tenant_session_scope", True)
+        engine = db_engine._create_engine()
+        assert tracked == [engine]
     finally:
         settings.database.engine = original_engine
         settings.database.postgres_url = original_url
@@ -97,6 +105,11 @@ async def test_get_session_and_get_db_use_tenant_context(monkeypatch) -> None:
             self.executed = []
             self.commits = 0
             self.rollbacks = 0
+            self.info = {}
+
+        async def connection(self):
+            await asyncio.sleep(0)
+            return self
 
         async def execute(self, statement, params):
             await asyncio.sleep(0)
@@ -149,6 +162,21 @@ async def test_get_session_and_get_db_use_tenant_context(monkeypatch) -> None:
             yielded_sessions.append(session)
 
         assert yielded_sessions == [fake_session]
+        # Padrão is_local=true: set_config em toda sessão (seguro com pooler).
+        assert len(fake_session.executed) == 2
+        assert all(
+            params == {"tid": "tenant-123"} and "true" in str(statement)
+            for statement, params in fake_session.executed
+        )
+
+        monkeypatch.setattr(settings.database, "postgres_tenant_session_scope", True)
+        async with db_engine.get_session():
+            pass
+        async with db_engine.get_session():
+            pass
+        # Modo de sessão: mesma conexão, mesmo tenant, um único set_config.
+        assert len(fake_session.executed) == 3
+        assert "false" in str(fake_session.executed[-1][0])
     finally:
         settings.database.engine = original_engine_mode
         db_engine.get_session_maker = original_session_maker
@@ -164,3 +192,108 @@ async def test_close_db_disposes_cached_engine() -> None:
 
     assert db_engine._engine is None
     fake_engine.dispose.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_tenant_is_set_once_per_connection_until_rollback(
+    tmp_path, monkeypatch
+) -> None:
+    from sqlalchemy import event
+    from sqlalchemy.ext.asyncio import create_async_engine
+
+    monkeypatch.setattr(settings.database, "postgres_tenant_session_scope", True)
+
+    engine = create_async_engine(
+        f"sqlite+aiosqlite:///{tmp_path / 'tenant.db'}", pool_size=1, max_overflow=0
+    )
+    calls: list[str] = []
+
+    @event.listens_for(engine.sync_engine, "connect")
+    def _register_set_config(dbapi_connection, _record):
+        def set_config(_name, value, _is_local):
+            calls.append(value)
+            return value
+
+        dbapi_connection.run_async(
+            lambda conn: conn.create_function("set_config", 3, set_config)
+        )
+
+    db_engine._track_tenant_invalidation(engine)
+    maker = db_engine.async_sessionmaker(engine, expire_on_commit=False)
+
+    async def checkout(tid: str, *, fail: bool = False) -> None:
+        async with maker() as session:
+            await db_engine._apply_tenant(session, tid)
+            if fail:
+                await session.rollback()
+            else:
+                await session.commit()
+
+    try:
+        await checkout("")
+        await checkout("tenant-a")
+        await checkout("tenant-a")
+        assert calls == ["tenant-a"]
+
+        await checkout("tenant-b", fail=True)
+        await checkout("tenant-b")
+        assert calls == ["tenant-a", "tenant-b", "tenant-b"]
+
+        async with maker() as session:  # fechada sem commit
+            await db_engine._apply_tenant(session, "tenant-c")
+        await checkout("tenant-c")
+        assert calls[-2:] == ["tenant-c", "tenant-c"]
+    finally:
+        await engine.dispose()
+
+
+@pytest.mark.asyncio
+async def test_get_session_runs_after_commit_callbacks_only_on_success(
+    monkeypatch,
+) -> None:
+    events: list[str] = []
+
+    class _FakeSession:
+        def __init__(self) -> None:
+            self.info: dict = {}
+
+        async def commit(self):
+            events.append("commit")
+
+        async def rollback(self):
+            events.append("rollback")
+
+    class _SessionContext:
+        def __init__(self, session) -> None:
+            self.session = session
+
+        async def __aenter__(self):
+            return self.session
+
+        async def __aexit__(self, *_exc):
+            return False
+
+    sessions = [_FakeSession(), _FakeSession()]
+    monkeypatch.setattr(settings.database, "engine", "sqlite")
+    monkeypatch.setattr(
+        db_engine, "get_session_maker", lambda: lambda: _SessionContext(sessions.pop(0))
+    )
+
+    async def _callback() -> None:
+        events.append("callback")
+
+    async def _failing_callback() -> None:
+        raise RuntimeError("redis fora")
+
+    async with db_engine.get_session() as session:
+        db_engine.run_after_commit(session, _failing_callback)
+        db_engine.run_after_commit(session, _callback)
+    assert events == ["commit", "callback"]
+    assert session.info == {}
+
+    events.clear()
+    with pytest.raises(ValueError):
+        async with db_engine.get_session() as session:
+            db_engine.run_after_commit(session, _callback)
+            raise ValueError("boom")
+    assert events == ["rollback"]
@@ -7,7 +7,7 @@ import pytest
 
 from backend.data.glossary_manager import (
     GlossaryManager,
-    glossary_manager,
+    _compile_glossary_regex,
     init_glossary,
 )
 
@@ -95,14 +95,15 @@ def test_load_from_json_accepts_list_payload_and_ignores_invalid_entries(
 def test_init_glossary_tries_backend_then_data_locations(monkeypatch) -> None:
     calls: list[str] = []
 
-    def fake_load_from_json(path: str) -> bool:
+    def fake_load_from_json(self, path: str) -> bool:
         calls.append(path)
         return (
             path.endswith(os.path.join("data", "glossary_db.json"))
             and "backend" not in path
         )
 
-    monkeypatch.setattr(glossary_manager, "load_from_json", fake_load_from_json)
+    # Slotted instances reject attribute patches; patch the class instead.
+    monkeypatch.setattr(GlossaryManager, "load_from_json", fake_load_from_json)
 
     init_glossary(r"C:\project-root")
 
@@ -110,3 +111,117 @@ def test_init_glossary_tries_backend_then_data_locations(monkeypatch) -> None:
         os.path.join(r"C:\project-root", "backend", "data", "glossary_db.json"),
         os.path.join(r"C:\project-root", "data", "glossary_db.json"),
     ]
+
+
+def test_reloading_identical_terms_reuses_compiled_regex(tmp_path) -> None:
+    path = tmp_path / "glossary.json"
+    path.write_text(json.dumps({"bomba": "a", "válvula": "b"}), encoding="utf-8")
+    other_path = tmp_path / "glossary_other_order.json"
+    other_path.write_text(json.dumps({"válvula": "x", "bomba": "y"}), encoding="utf-8")
+
+    manager = GlossaryManager()
+    assert manager.load_from_json(str(path)) is True
+    first = manager.get_regex_pattern()
+
+    assert manager.load_from_json(str(path)) is True
+    assert manager.get_regex_pattern() is first
+
+    other_manager = GlossaryManager()
+    assert other_manager.load_from_json(str(other_path)) is True
+    assert other_manager.get_regex_pattern() is first
+
+
+def test_load_from_json_parses_raw_utf8_bytes(tmp_path) -> None:
+    path = tmp_path / "glossary_utf8.json"
+    payload = {"  Válvula  ": "peça", "ação": {"definition": "ato"}}
+    path.write_bytes(json.dumps(payload, ensure_ascii=False).encode("utf-8"))
+
+    manager = GlossaryManager()
+    assert manager.load_from_json(str(path)) is True
+    assert manager.get_definition("válvula") == {"definition": "peça"}
+    assert manager.get_definition("AÇÃO") == {"definition": "ato"}
+
+
+def test_get_definition_normalizes_raw_user_input(tmp_path) -> None:
+    path = tmp_path / "glossary.json"
+    path.write_text(json.dumps({"Motor": "dispositivo"}), encoding="utf-8")
+
+    manager = GlossaryManager()
+    assert manager.load_from_json(str(path)) is True
+    assert manager.get_definition(" Motor ") == {"definition": "dispositivo"}
+    assert manager.get_definition("   ") is None
+
+
+def test_maybe_has_term_prefilters_on_first_characters(tmp_path) -> None:
+    path = tmp_path / "glossary.json"
+    path.write_text(json.dumps({"motor": "a", "válvula": "b"}), encoding="utf-8")
+
+    manager = GlossaryManager()
+    assert manager.maybe_has_term("MOTOR") is False  # sem termos carregados
+    assert manager.load_from_json(str(path)) is True
+
+    assert manager.maybe_has_term("Motor elétrico") is True
+    assert manager.maybe_has_term("VÁLVULA") is True
+    assert manager.maybe_has_term("123 -- xyz") is False
+    assert manager.maybe_has_term("") is False
+
+
+def test_glossary_regex_falls_back_to_shorter_term_at_word_boundary(tmp_path) -> None:
+    path = tmp_path / "glossary.json"
+    path.write_text(json.dumps({"motor": "a", "motor elétrico": "b"}), encoding="utf-8")
+
+    manager = GlossaryManager()
+    assert manager.load_from_json(str(path)) is True
+    pattern = manager.get_regex_pattern()
+    assert pattern is not None
+
+    match = pattern.search("motor elétricos")
+    assert match is not None
+    assert match.group(1) == "motor"
+    assert [m.group(1) for m in pattern.finditer("motores, MOTOR elétrico")] == [
+        "MOTOR elétrico"
+    ]
+
+
+def test_load_from_json_rejects_empty_file_with_json_error(tmp_path) -> None:
+    path = tmp_path / "empty.json"
+    path.write_bytes(b"")
+
+    with pytest.raises(ValueError):
+        GlossaryManager().load_from_json(str(path))
+
+
+def test_glossary_manager_uses_slots() -> None:
+    manager = GlossaryManager()
+    assert not hasattr(manager, "__dict__")
+    with pytest.raises(AttributeError):
+        manager.unexpected = True  # type: ignore[attr-defined]
+
+
+def test_glossary_regex_factors_shared_prefixes_into_trie() -> None:
+    terms = frozenset({"import", "importado", "importador", "importação", "motor"})
+    pattern = _compile_glossary_regex(terms)
+
+    assert pattern.pattern.count("import") == 1
+    text = "Importador, importados e IMPORT de motor; importação."
+    assert [m.group(1) for m in pattern.finditer(text)] == [
+        "Importador",
+        "IMPORT",
+        "motor",
+        "importação",
+    ]
+
+
+def test_loaded_terms_are_read_only_and_interned(tmp_path) -> None:
+    import sys
+
+    path = tmp_path / "glossary.json"
+    path.write_text(json.dumps({"Drawback": "regime"}), encoding="utf-8")
+
+    manager = GlossaryManager()
+    assert manager.load_from_json(str(path)) is True
+
+    with pytest.raises(TypeError):
+        manager._terms["novo"] = {}  # type: ignore[index]
+    (key,) = manager._terms
+    assert key is sys.intern("drawback")
@@ -1,4 +1,5 @@
 import logging
+import logging.handlers
 
 import pytest
 from backend.config import logging_config
@@ -150,3 +151,73 @@ def test_remove_managed_handlers_keeps_user_handlers(monkeypatch):
 
     logger.removeHandler(user_handler)
     user_handler.close()
+
+
+def test_setup_logging_buffers_console_records_when_capacity_is_set(
+    monkeypatch, capsys
+):
+    _clear_nesh_handlers()
+    monkeypatch.setattr(logging_config.sys, "platform", "linux", raising=False)
+    for flag in ("logThreads", "logProcesses", "logMultiprocessing"):
+        monkeypatch.setattr(logging, flag, True)
+
+    try:
+        logging_config.setup_logging(level="INFO", buffer_capacity=10)
+        assert logging.logThreads is False
+        assert logging.logProcesses is False
+        assert logging.logMultiprocessing is False
+        logger = logging.getLogger("nesh")
+        assert any(
+            isinstance(handler, logging.handlers.MemoryHandler)
+            for handler in logger.handlers
+        )
+
+        logger.info("buffered line")
+        assert "buffered line" not in capsys.readouterr().out
+
+        logger.warning("flush now")
+        captured = capsys.readouterr().out
+        assert "buffered line" in captured
+        assert "flush now" in captured
+    finally:
+        _clear_nesh_handlers()
+
+
+def test_setup_logging_keeps_record_attributes_without_buffering(monkeypatch):
+    _clear_nesh_handlers()
+    monkeypatch.setattr(logging_config.sys, "platform", "linux", raising=False)
+    for flag in ("logThreads", "logProcesses", "logMultiprocessing"):
+        monkeypatch.setattr(logging, flag, True)
+
+    try:
+        logging_config.setup_logging(level="INFO")
+        assert logging.logThreads is True
+        assert logging.logProcesses is True
+        assert logging.logMultiprocessing is True
+    finally:
+        _clear_nesh_handlers()
+
+
+def test_setup_logging_reconfigures_windows_stdout_only_once(monkeypatch):
+    class _Stdout:
+        calls = 0
+
+        def reconfigure(self, **_kwargs):
+            type(self).calls += 1
+
+        def write(self, _data):
+            return 0
+
+        def flush(self):
+            return None
+
+    _clear_nesh_handlers()
+    monkeypatch.setattr(logging_config.sys, "platform", "win32", raising=False)
+    monkeypatch.setattr(logging_config.sys, "stdout", _Stdout(), raising=False)
+
+    try:
+        logging_config.setup_logging()
+        logging_config.setup_logging()
+        assert _Stdout.calls == 1
+    finally:
+        _clear_nesh_handlers()
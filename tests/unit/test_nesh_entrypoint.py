@@ -1,9 +1,11 @@
 import os
 import sys
+import types
 from pathlib import Path
 
 import Nesh
 import pytest
+import uvicorn
 
 pytestmark = pytest.mark.unit
 
@@ -18,7 +20,7 @@ def test_main_runs_uvicorn_with_app_instance_when_reload_disabled(monkeypatch):
     monkeypatch.delenv("NESH_RELOAD", raising=False)
     monkeypatch.setenv("SERVER__HOST", "0.0.0.0")  # nosec B104
     monkeypatch.setenv("SERVER__PORT", "10000")
-    monkeypatch.setattr(Nesh.uvicorn, "run", _fake_run)
+    monkeypatch.setattr(uvicorn, "run", _fake_run)
 
     Nesh.main()
 
@@ -38,7 +40,9 @@ def test_main_runs_uvicorn_with_import_string_when_reload_enabled(monkeypatch):
         captured["kwargs"] = kwargs
 
     monkeypatch.setenv("NESH_RELOAD", "1")
-    monkeypatch.setattr(Nesh.uvicorn, "run", _fake_run)
+    monkeypatch.delenv("NESH_RELOAD_DELAY", raising=False)
+    monkeypatch.setitem(sys.modules, "watchfiles", types.ModuleType("watchfiles"))
+    monkeypatch.setattr(uvicorn, "run", _fake_run)
 
     Nesh.main()
 
@@ -48,5 +52,48 @@ def test_main_runs_uvicorn_with_import_string_when_reload_enabled(monkeypatch):
     assert captured["app_target"] == "backend.server.app:app"
     assert kwargs["reload"] is True
     assert kwargs["reload_dirs"] == [backend_dir]
+    assert kwargs["reload_includes"] == ["*.py"]
+    assert kwargs["reload_delay"] == 0.1
     assert "client/node_modules/*" in kwargs["reload_excludes"]
     assert project_root in sys.path
+
+
+def test_main_disables_reload_when_watchfiles_is_missing(monkeypatch, capsys):
+    captured: dict[str, object] = {}
+
+    def _fake_run(app_target, **kwargs):
+        captured["app_target"] = app_target
+        captured["kwargs"] = kwargs
+
+    monkeypatch.setenv("NESH_RELOAD", "1")
+    monkeypatch.setitem(sys.modules, "watchfiles", None)
+    monkeypatch.setattr(uvicorn, "run", _fake_run)
+
+    Nesh.main()
+
+    kwargs = captured["kwargs"]
+    assert not isinstance(captured["app_target"], str)
+    assert kwargs["reload"] is False
+    assert "watchfiles" in capsys.readouterr().out
+
+
+def test_main_enables_reload_with_cli_flag(monkeypatch):
+    captured: dict[str, object] = {}
+
+    def _fake_run(app_target, **kwargs):
+        captured["app_target"] = app_target
+        captured["kwargs"] = kwargs
+
+    monkeypatch.delenv("NESH_RELOAD", raising=False)
+    monkeypatch.setitem(sys.modules, "watchfiles", types.ModuleType("watchfiles"))
+    monkeypatch.setattr(uvicorn, "run", _fake_run)
+
+    Nesh.main(["--reload"])
+
+    assert captured["app_target"] == "backend.server.app:app"
+    assert captured["kwargs"]["reload"] is True
+
+
+def test_importing_entrypoint_does_not_import_uvicorn():
+    assert not hasattr(Nesh, "uvicorn")
+    assert not hasattr(Nesh, "load_dotenv")
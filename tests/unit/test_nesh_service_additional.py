@@ -451,3 +451,108 @@ async def test_get_internal_cache_metrics_returns_current_snapshots():
     assert payload["chapter_cache"]["hits"] >= 1
     assert payload["fts_cache"]["current_size"] == 1
     assert payload["fts_cache"]["misses"] >= 1
+
+
+@pytest.mark.asyncio
+async def test_code_search_prefetches_redis_chapters_in_one_batch(monkeypatch):
+    cached_84 = {
+        "chapter_num": "84",
+        "content": "84.13 - Bombas",
+        "notes": "",
+        "parsed_notes": {},
+        "positions": [],
+        "sections": None,
+    }
+    batches: list[list[str]] = []
+
+    async def _get_chapters(nums):
+        batches.append(list(nums))
+        return [cached_84 if num == "84" else None for num in nums]
+
+    single_gets: list[str] = []
+
+    async def _get_chapter(num):
+        single_gets.append(num)
+        return None
+
+    async def _set_chapter(_num, _value):
+        return None
+
+    cache = nesh_service_module.redis_cache
+    monkeypatch.setattr(cache, "_client", object())
+    monkeypatch.setattr(cache, "get_chapters", _get_chapters)
+    monkeypatch.setattr(cache, "get_chapter", _get_chapter)
+    monkeypatch.setattr(cache, "set_chapter", _set_chapter)
+    db = _FakeDb(
+        chapters={
+            "85": {
+                "chapter_num": "85",
+                "content": "85.17 - Conteúdo",
+                "notes": "",
+                "parsed_notes_json": None,
+                "positions": [],
+                "sections": None,
+            }
+        }
+    )
+    service = NeshService(db=db)
+
+    payload = await service.searchNeshByNcmCode("84.13, 85.17")
+
+    assert batches == [["84", "85"]]
+    assert single_gets == ["85"]  # só o miss real ainda passa pelo caminho unitário
+    assert db.chapter_calls == 1
+    assert payload["results"]["84"]["conteudo"] == "84.13 - Bombas"
+    assert payload["results"]["85"]["real_content_found"] is True
+
+
+@pytest.mark.asyncio
+async def test_fetch_chapter_fields_uses_partial_hash_read(monkeypatch):
+    requested: list[tuple[str, list[str]]] = []
+
+    async def _get_chapter_fields(num, fields):
+        requested.append((num, list(fields)))
+        if num != "84":
+            return None
+        return {"parsed_notes": {"1": "Nota"}, "notes": "Notas"}
+
+    async def _get_chapter(_num):
+        return None
+
+    async def _set_chapter(_num, _value):
+        return None
+
+    cache = nesh_service_module.redis_cache
+    monkeypatch.setattr(cache, "_client", object())
+    monkeypatch.setattr(cache, "chapter_hash_mode", True)
+    monkeypatch.setattr(cache, "get_chapter_fields", _get_chapter_fields)
+    monkeypatch.setattr(cache, "get_chapter", _get_chapter)
+    monkeypatch.setattr(cache, "set_chapter", _set_chapter)
+    db = _FakeDb(
+        chapters={
+            "85": {
+                "chapter_num": "85",
+                "content": "85.17 - Conteúdo",
+                "notes": "Notas 85",
+                "parsed_notes_json": None,
+                "positions": [],
+                "sections": None,
+            }
+        }
+    )
+    service = NeshService(db=db)
+    fields = ["parsed_notes", "notes"]
+
+    assert await service.fetchNeshChapterFields("84", fields) == {
+        "parsed_notes": {"1": "Nota"},
+        "notes": "Notas",
+    }
+    assert db.chapter_calls == 0
+
+    # Miss no HASH cai no fetch completo; depois o L1 local responde.
+    first = await service.fetchNeshChapterFields("85", fields)
+    second = await service.fetchNeshChapterFields("85", fields)
+    assert first == second
+    assert first is not None and first["notes"] == "Notas 85"
+    assert db.chapter_calls == 1
+    assert requested == [("84", fields), ("85", fields)]
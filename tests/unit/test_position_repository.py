@@ -67,8 +67,30 @@ async def test_get_by_codigo_returns_scalar_and_applies_tenant_filter(monkeypatc
     got = await repo.get_by_codigo("8517.12.31")
     assert got is obj
     assert len(session.calls) == 1
-    stmt, _ = session.calls[0]
+    stmt, params = session.calls[0]
     assert "tenant_id" in str(stmt)
+    assert params == {"codigo": "8517.12.31", "tenant_id": "org_x"}
+
+
+@pytest.mark.asyncio
+async def test_fixed_lookups_reuse_prebuilt_statements(monkeypatch):
+    monkeypatch.setattr(
+        "backend.infrastructure.repositories.position_repository.settings.database.engine",
+        "sqlite",
+    )
+    session = _FakeSession([_FakeResult() for _ in range(4)])
+    repo = PositionRepository(session)
+
+    await repo.get_by_codigo("8517.12.31")
+    await repo.get_by_codigo("8518.10.00")
+    await repo.get_by_chapter("85")
+    await repo.get_by_chapter("84")
+
+    (first, _), (second, _), (third, p3), (fourth, p4) = session.calls
+    assert first is second
+    assert third is fourth
+    assert ":tenant_id" not in str(first)
+    assert (p3, p4) == ({"chapter_num": "85"}, {"chapter_num": "84"})
 
 
 @pytest.mark.asyncio
@@ -78,15 +100,17 @@ async def test_get_by_chapter_maps_to_position_read(monkeypatch):
         "sqlite",
     )
     positions = [
-        SimpleNamespace(codigo="85.17", descricao="Telefone"),
-        SimpleNamespace(codigo="85.18", descricao="Microfone"),
+        SimpleNamespace(codigo="85.17", descricao="Telefone", anchor_id="pos-85-17"),
+        SimpleNamespace(codigo="85.18", descricao="Microfone", anchor_id="custom"),
     ]
     session = _FakeSession([_FakeResult(scalars=positions)])
     repo = PositionRepository(session)
 
     items = await repo.get_by_chapter("85")
     assert [i.codigo for i in items] == ["85.17", "85.18"]
+    # anchor_id vem gravado na linha; a leitura não recalcula.
     assert items[0].anchor_id == "pos-85-17"
+    assert items[1].anchor_id == "custom"
     stmt, _ = session.calls[0]
     assert "positions.chapter_num" in str(stmt)
 
@@ -98,7 +122,17 @@ async def test_search_by_prefix_normalizes_prefix_and_respects_limit(monkeypatch
         "sqlite",
     )
     session = _FakeSession(
-        [_FakeResult(scalars=[SimpleNamespace(codigo="8517.10.00", descricao="Desc")])]
+        [
+            _FakeResult(
+                scalars=[
+                    SimpleNamespace(
+                        codigo="8517.10.00",
+                        descricao="Desc",
+                        anchor_id="pos-8517-10-00",
+                    )
+                ]
+            )
+        ]
     )
     repo = PositionRepository(session, tenant_id="org_x")
 
@@ -107,9 +141,27 @@ async def test_search_by_prefix_normalizes_prefix_and_respects_limit(monkeypatch
     assert items[0].anchor_id == "pos-8517-10-00"
     stmt, _ = session.calls[0]
     stmt_text = str(stmt)
-    assert "LIKE" in stmt_text
+    assert "replace(positions.codigo" in stmt_text
     assert "LIMIT" in stmt_text
     assert "tenant_id" in stmt_text
+    params = stmt.compile().params
+    assert "8517" in params.values()
+    assert "8518" in params.values()
+
+
+@pytest.mark.asyncio
+async def test_search_by_prefix_supports_keyset_pagination(monkeypatch):
+    monkeypatch.setattr(
+        "backend.infrastructure.repositories.position_repository.settings.database.engine",
+        "sqlite",
+    )
+    session = _FakeSession([_FakeResult(scalars=[])])
+    repo = PositionRepository(session)
+
+    assert await repo.search_by_prefix("85", after="8517.10.00") == []
+    stmt, _ = session.calls[0]
+    assert "positions.codigo >" in str(stmt)
+    assert "8517.10.00" in stmt.compile().params.values()
 
 
 @pytest.mark.asyncio
@@ -153,15 +205,8 @@ async def test_fts_postgres_maps_score_and_sends_tenant_param(monkeypatch):
         "backend.infrastructure.repositories.position_repository.settings.database.engine",
         "postgresql",
     )
-    rows = [
-        SimpleNamespace(
-            ncm="8517",
-            display_text="Display",
-            type="position",
-            description="Desc",
-            score=0.42,
-        )
-    ]
+    # Rows em ordem posicional do SELECT (ncm, display_text, type, ...).
+    rows = [("8517", "Display", "position", "Desc", 0.42)]
     session = _FakeSession([_FakeResult(rows=rows)])
     repo = PositionRepository(session, tenant_id="org_pg")
 
@@ -189,7 +234,7 @@ async def test_fts_postgres_uses_to_tsquery_for_prefix_or_queries(monkeypatch):
     stmt, params = session.calls[0]
     stmt_text = str(stmt)
     assert "to_tsquery('portuguese', :tsquery)" in stmt_text
-    assert params == {"tsquery": "motor:* | centrif:*", "limit": 5}
+    assert params == {"tsquery": "motor:* | centrif:*", "limit": 5, "tenant_id": None}
 
     await repo._fts_postgres("*", 7)
 
@@ -197,7 +242,7 @@ async def test_fts_postgres_uses_to_tsquery_for_prefix_or_queries(monkeypatch):
     stmt_text = str(stmt)
     assert "NULL::tsquery" in stmt_text
     assert "to_tsquery('portuguese', :tsquery)" not in stmt_text
-    assert params == {"limit": 7}
+    assert params == {"limit": 7, "tenant_id": None}
 
     await repo._fts_postgres("* OR *", 9)
 
@@ -205,7 +250,14 @@ async def test_fts_postgres_uses_to_tsquery_for_prefix_or_queries(monkeypatch):
     stmt_text = str(stmt)
     assert "NULL::tsquery" in stmt_text
     assert "to_tsquery('portuguese', :tsquery)" not in stmt_text
-    assert params == {"limit": 9}
+    assert params == {"limit": 9, "tenant_id": None}
+
+    # Mesmo texto SQL com ou sem tenant: só o parâmetro muda.
+    tenant_session = _FakeSession([_FakeResult(rows=[])])
+    await PositionRepository(tenant_session, tenant_id="org_x")._fts_postgres("*", 7)
+    tenant_stmt, tenant_params = tenant_session.calls[0]
+    assert str(tenant_stmt) == str(session.calls[1][0])
+    assert tenant_params == {"limit": 7, "tenant_id": "org_x"}
 
 
 @pytest.mark.asyncio
@@ -231,3 +283,35 @@ async def test_fts_sqlite_maps_rank_to_positive_score(monkeypatch):
     assert items[0].score == pytest.approx(25.0)
     _stmt, params = session.calls[0]
     assert params == {"query": "motor", "limit": 3}
+
+
+@pytest.mark.asyncio
+async def test_get_by_codigo_reuses_compiled_statement():
+    from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+    try:
+        async with engine.begin() as conn:
+            await conn.exec_driver_sql(
+                "CREATE TABLE positions (codigo TEXT PRIMARY KEY, descricao TEXT, "
+                "chapter_num TEXT, tenant_id TEXT, anchor_id TEXT, "
+                "search_vector TEXT)"
+            )
+            await conn.exec_driver_sql(
+                "INSERT INTO positions VALUES "
+                "('85.17', 'Telefone', '85', NULL, NULL, NULL)"
+            )
+        async with AsyncSession(engine) as session:
+            repo = PositionRepository(session)
+            repo.tenant_id = None
+            found = await repo.get_by_codigo("85.17")
+            compiled = len(engine.sync_engine._compiled_cache)
+            missing = await repo.get_by_codigo("85.18")
+
+            assert found is not None and found.descricao == "Telefone"
+            assert missing is None
+            # Segunda chamada reaproveita o SQL compilado da primeira.
+            assert compiled >= 1
+            assert len(engine.sync_engine._compiled_cache) == compiled
+    finally:
+        await engine.dispose()
@@ -1,3 +1,4 @@
+import orjson
 import pytest
 
 from backend.infrastructure import redis_client as redis_mod
@@ -14,12 +15,15 @@ class _FakeRedis:
         self.fail_set = False
         self.fail_ping = False
         self.fail_close = False
+        self.mget_calls = []
+        self.pipelines = []
+        self.expires = {}
 
     async def ping(self):
         if self.fail_ping:
             raise RuntimeError("ping failed")
 
-    async def aclose(self):
+    async def aclose(self, close_connection_pool=None):
         if self.fail_close:
             raise RuntimeError("close failed")
         self.closed = True
@@ -41,6 +45,21 @@ class _FakeRedis:
     async def delete(self, key):
         self.store.pop(key, None)
 
+    async def mget(self, keys):
+        if self.fail_get:
+            raise RuntimeError("mget failed")
+        self.mget_calls.append(list(keys))
+        return [self.store.get(key) for key in keys]
+
+    async def hmget(self, key, fields):
+        if self.fail_get:
+            raise RuntimeError("hmget failed")
+        fields_map = self.store.get(key) or {}
+        return [fields_map.get(field.encode()) for field in fields]
+
+    def pipeline(self, transaction=True):
+        return _FakePipeline(self, transaction)
+
     async def incr(self, key):
         current = int(self.store.get(key, b"0"))
         current += 1
@@ -48,6 +67,44 @@ class _FakeRedis:
         return current
 
 
+class _FakePipeline:
+    def __init__(self, redis, transaction):
+        self.redis = redis
+        self.transaction = transaction
+        self.commands = []
+        self.ops = []
+        redis.pipelines.append(self)
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *_exc):
+        return False
+
+    def set(self, key, value, ex=None):
+        self.commands.append((key, value, ex))
+        self.ops.append(lambda: self.redis.store.__setitem__(key, value))
+
+    def delete(self, key):
+        self.ops.append(lambda: self.redis.store.pop(key, None))
+
+    def hset(self, key, mapping):
+        self.ops.append(
+            lambda: self.redis.store.setdefault(key, {}).update(
+                {name.encode(): value for name, value in mapping.items()}
+            )
+        )
+
+    def expire(self, key, ttl):
+        self.ops.append(lambda: self.redis.expires.__setitem__(key, ttl))
+
+    def hgetall(self, key):
+        self.ops.append(lambda: dict(self.redis.store.get(key) or {}))
+
+    async def execute(self):
+        return [op() for op in self.ops]
+
+
 def _cache() -> redis_mod.RedisCache:
     return redis_mod.RedisCache(
         url="redis://localhost:6379/0",
@@ -61,6 +118,25 @@ def _cache() -> redis_mod.RedisCache:
     )
 
 
+def _patch_redis_pool(monkeypatch, fake):
+    pool_kwargs = []
+    pool = object()
+
+    def _from_url(_url, **kwargs):
+        pool_kwargs.append(kwargs)
+        return pool
+
+    def _redis(*, connection_pool):
+        assert connection_pool is pool
+        return fake
+
+    monkeypatch.setattr(
+        redis_mod.aioredis.BlockingConnectionPool, "from_url", _from_url
+    )
+    monkeypatch.setattr(redis_mod.aioredis, "Redis", _redis)
+    return pool_kwargs
+
+
 @pytest.mark.asyncio
 async def test_connect_skips_when_disabled():
     cache = redis_mod.RedisCache(
@@ -94,13 +170,17 @@ async def test_connect_success_and_idempotent(monkeypatch):
     cache = _cache()
     fake = _FakeRedis()
     monkeypatch.setattr(redis_mod, "_REDIS_AVAILABLE", True)
-    monkeypatch.setattr(redis_mod.aioredis, "from_url", lambda *_args, **_kwargs: fake)
+    pool_kwargs = _patch_redis_pool(monkeypatch, fake)
     monkeypatch.setattr(redis_mod.logger, "info", lambda _msg: None)
 
     await cache.connect()
     assert cache.available is True
     await cache.connect()
     assert cache.available is True
+    assert len(pool_kwargs) == 1
+    assert pool_kwargs[0]["max_connections"] == cache.max_connections
+    assert pool_kwargs[0]["timeout"] == cache.pool_timeout
+    assert pool_kwargs[0]["socket_keepalive"] is True
 
 
 @pytest.mark.asyncio
@@ -109,7 +189,7 @@ async def test_connect_resets_client_on_ping_failure(monkeypatch):
     fake = _FakeRedis()
     fake.fail_ping = True
     monkeypatch.setattr(redis_mod, "_REDIS_AVAILABLE", True)
-    monkeypatch.setattr(redis_mod.aioredis, "from_url", lambda *_args, **_kwargs: fake)
+    _patch_redis_pool(monkeypatch, fake)
     monkeypatch.setattr(redis_mod.logger, "warning", lambda *_args, **_kwargs: None)
 
     await cache.connect()
@@ -338,3 +418,99 @@ async def test_cached_json_uses_fill_retry_and_stale_paths():
     assert stale_value == {"value": 7}
     assert stale_stats["cache_status"] == "stale"
     assert stale_stats["stale_served"] is True
+
+
+@pytest.mark.asyncio
+async def test_mget_json_batches_reads_in_one_round_trip():
+    cache = _cache()
+    fake = _FakeRedis()
+    cache._client = fake
+    await cache.set_json("a", {"x": 1}, 30)
+    await cache.set_json("b", [2], 30)
+
+    assert await cache.mget_json(["a", "missing", "b"]) == [{"x": 1}, None, [2]]
+    assert fake.mget_calls == [["a", "missing", "b"]]
+
+    fake.fail_get = True
+    assert await cache.mget_json(["a", "b"]) == [None, None]
+    cache._client = None
+    assert await cache.mget_json(["a"]) == [None]
+
+
+@pytest.mark.asyncio
+async def test_get_chapters_uses_chapter_keys_in_one_mget():
+    cache = _cache()
+    fake = _FakeRedis()
+    cache._client = fake
+    await cache.set_chapter("84", {"chapter_num": "84"})
+
+    assert await cache.get_chapters(["84", "85"]) == [{"chapter_num": "84"}, None]
+    assert fake.mget_calls == [["nesh:chapter:84", "nesh:chapter:85"]]
+
+
+@pytest.mark.asyncio
+async def test_large_payloads_are_stored_compressed_and_read_back():
+    cache = _cache()
+    fake = _FakeRedis()
+    cache._client = fake
+    chapter = {"chapter_num": "84", "content": "Bombas centrífugas. " * 200}
+
+    await cache.set_chapter("84", chapter)
+    await cache.set_chapter("85", {"chapter_num": "85"})
+
+    stored = fake.store["nesh:chapter:84"]
+    assert stored[:1] == b"x"
+    assert len(stored) < len(orjson.dumps(chapter)) // 4
+    assert fake.store["nesh:chapter:85"] == b'{"chapter_num":"85"}'
+
+    assert await cache.get_chapter("84") == chapter
+    assert await cache.get_chapters(["84", "85"]) == [chapter, {"chapter_num": "85"}]
+
+
+@pytest.mark.asyncio
+async def test_chapter_hash_mode_stores_fields_and_reads_subsets():
+    cache = _cache()
+    cache.chapter_hash_mode = True
+    fake = _FakeRedis()
+    cache._client = fake
+    chapter = {
+        "chapter_num": "84",
+        "content": "Bombas centrífugas. " * 200,
+        "notes": "Notas gerais",
+        "parsed_notes": {"1": "Nota 1"},
+    }
+
+    await cache.set_chapter("84", chapter)
+
+    stored = fake.store["nesh:chapter-hash:84"]
+    assert set(stored) == {b"chapter_num", b"content", b"notes", b"parsed_notes"}
+    assert stored[b"content"][:1] == b"x"  # campo grande vai comprimido
+    assert fake.expires == {"nesh:chapter-hash:84": 120}
+    assert "nesh:chapter:84" not in fake.store
+
+    assert await cache.get_chapter_fields("84", ["parsed_notes", "notes"]) == {
+        "parsed_notes": {"1": "Nota 1"},
+        "notes": "Notas gerais",
+    }
+    assert await cache.get_chapter_fields("85", ["notes"]) is None
+    assert await cache.get_chapter("84") == chapter
+    assert await cache.get_chapters(["84", "85"]) == [chapter, None]
+
+
+@pytest.mark.asyncio
+async def test_set_json_serializes_pydantic_models_and_int_keys():
+    from pydantic import BaseModel
+
+    class _Item(BaseModel):
+        ncm: str
+        score: float
+
+    cache = _cache()
+    fake = _FakeRedis()
+    cache._client = fake
+
+    await cache.set_json("k", {1: _Item(ncm="84.13", score=1.5)}, 10)
+    assert await cache.get_json("k") == {"1": {"ncm": "84.13", "score": 1.5}}
+
+    await cache.set_json("bad", {"x": object()}, 10)
+    assert "bad" not in fake.store
@@ -0,0 +1,52 @@
+import re
+
+import pytest
+from backend.config.constants import (
+    MEASUREMENT_UNITS_PREFILTER_RE,
+    MEASUREMENT_UNITS_RE,
+    NOTE_HEADER_RE,
+    RegexPatterns,
+    compiled,
+)
+
+pytestmark = pytest.mark.unit
+
+
+def test_get_returns_cached_compiled_pattern():
+    pattern = RegexPatterns.get("NOTE_HEADER")
+
+    assert isinstance(pattern, re.Pattern)
+    assert pattern is RegexPatterns.get("NOTE_HEADER")
+    assert pattern is NOTE_HEADER_RE
+    assert pattern.pattern == RegexPatterns.NOTE_HEADER
+
+
+def test_compiled_caches_by_pattern_and_flags():
+    assert compiled(r"\d+") is compiled(r"\d+")
+    assert compiled(r"\d+") is not compiled(r"\d+", re.MULTILINE)
+
+
+def test_get_rejects_unknown_pattern_name():
+    with pytest.raises(AttributeError):
+        RegexPatterns.get("DOES_NOT_EXIST")
+
+
+def test_measurement_units_prefilter_accepts_every_unit_start():
+    text = (
+        "10 kWh 5 MWh 3 VA 2 Hz 900 rpm 4 mbar 5 MPa 8 psi 20 °C 21 ºC "
+        "300 Kelvin 4 toneladas 2 litros 3 m³/h 5 mm [3] 2 g/cm [3] 7 µm "
+        "8 MΩ 2 Ω 3 ohm 4 µF 1 pF 6 nF 2 µH 3 kN 2 daN 4 MJ 500 lux 9 lm "
+        "12000 Btu 80 dB 2 polegadas 3 pol 10 W 220 V 5 A 300 K 2 m 1 l "
+        "3 t 4 g 5 N 6 J 2 bar 10 K 4 μm 9 ω"
+    )
+
+    matches = list(MEASUREMENT_UNITS_RE.finditer(text))
+
+    assert len(matches) >= 45
+    for match in matches:
+        assert MEASUREMENT_UNITS_PREFILTER_RE.match(match.group(0).lstrip())
+
+
+def test_measurement_units_prefilter_rejects_unitless_fragments():
+    for fragment in ("\n", "   ", "84.18", "8418.10.00 - ", "(+)", "1.234,5 ;"):
+        assert MEASUREMENT_UNITS_PREFILTER_RE.search(fragment) is None
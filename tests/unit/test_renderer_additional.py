@@ -129,6 +129,19 @@ def test_inject_glossary_highlights_wraps_terms_when_regex_exists(monkeypatch):
     assert '<span class="glossary-term" data-term="Rotor">Rotor</span>' in out
 
 
+def test_inject_glossary_highlights_skips_regex_when_prefilter_rejects(monkeypatch):
+    class _PrefilteredGlossaryManager(_FakeGlossaryManager):
+        def maybe_has_term(self, text):
+            return False
+
+    monkeypatch.setattr(
+        glossary_module,
+        "glossary_manager",
+        _PrefilteredGlossaryManager(re.compile(r"\bRotor\b")),
+    )
+    assert HtmlRenderer.inject_glossary_highlights("Rotor técnico") == "Rotor técnico"
+
+
 def test_convert_bold_markdown_supports_plain_and_html_text():
     assert (
         HtmlRenderer.convert_bold_markdown("**negrito**") == "<strong>negrito</strong>"
@@ -0,0 +1,55 @@
+import pytest
+
+from backend.infrastructure.schema_cache import SchemaCache
+
+pytestmark = [pytest.mark.unit, pytest.mark.asyncio]
+
+
+class _Probe:
+    def __init__(self) -> None:
+        self.signature = (1, 10, 100, 4096)
+        self.schema_version = 7
+        self.loads = 0
+
+    async def load(self) -> int:
+        self.loads += 1
+        return self.loads
+
+    async def version(self) -> int:
+        return self.schema_version
+
+    async def get(self, cache: SchemaCache[int]) -> int:
+        return await cache.get_or_load(
+            load=self.load,
+            resolve_db_signature=lambda: self.signature,
+            resolve_schema_version=self.version,
+        )
+
+
+async def test_data_only_writes_keep_cached_schema() -> None:
+    cache: SchemaCache[int] = SchemaCache()
+    probe = _Probe()
+
+    assert await probe.get(cache) == 1
+    probe.signature = (1, 10, 200, 8192)  # escrita/checkpoint no mesmo arquivo
+    assert await probe.get(cache) == 1
+    assert probe.loads == 1
+
+
+async def test_schema_version_change_reloads() -> None:
+    cache: SchemaCache[int] = SchemaCache()
+    probe = _Probe()
+
+    await probe.get(cache)
+    probe.signature = (1, 10, 200, 8192)
+    probe.schema_version = 8
+    assert await probe.get(cache) == 2
+
+
+async def test_replaced_file_reloads_even_with_same_schema_version() -> None:
+    cache: SchemaCache[int] = SchemaCache()
+    probe = _Probe()
+
+    await probe.get(cache)
+    probe.signature = (1, 11, 200, 8192)  # novo inode
+    assert await probe.get(cache) == 2
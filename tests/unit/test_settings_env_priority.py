@@ -1,6 +1,16 @@
+import os
+
 import pytest
 
-from backend.config.settings import AppSettings, SecuritySettings
+from backend.config.settings import (
+    AppSettings,
+    CacheSettings,
+    DatabaseSettings,
+    OrjsonConfigSettingsSource,
+    SearchSettings,
+    SecuritySettings,
+    ServerSettings,
+)
 
 pytestmark = pytest.mark.unit
 
@@ -52,3 +62,167 @@ def test_security_settings_respects_explicit_empty_restricted_ui_allowlist():
 
     assert security.ai_chat_allowed_email_set == {"allow@example.com"}
     assert security.restricted_ui_allowed_email_set == set()
+
+
+def test_settings_json_source_is_parsed_with_orjson(tmp_path):
+    json_file = tmp_path / "settings.json"
+    json_file.write_bytes('{"server": {"port": 9123, "env": "produção"}}'.encode())
+
+    source = OrjsonConfigSettingsSource(AppSettings, json_file=json_file)
+
+    assert source.json_data == {"server": {"port": 9123, "env": "produção"}}
+
+
+def test_app_settings_reads_settings_json_through_orjson_source(tmp_path, monkeypatch):
+    from backend.config import settings as settings_module
+
+    json_file = tmp_path / "settings.json"
+    json_file.write_bytes(b'{"server": {"port": 9321}}')
+    monkeypatch.delenv("SERVER__PORT", raising=False)
+    monkeypatch.setitem(AppSettings.model_config, "json_file", str(json_file))
+    monkeypatch.setitem(AppSettings.model_config, "env_file", None)
+
+    calls = []
+    original = settings_module._read_settings_json
+
+    def _spy(path):
+        calls.append(path)
+        return original(path)
+
+    monkeypatch.setattr(settings_module, "_read_settings_json", _spy)
+
+    assert AppSettings().server.port == 9321
+    assert calls == [str(json_file)]
+
+
+def test_settings_json_source_treats_missing_file_as_empty(tmp_path):
+    source = OrjsonConfigSettingsSource(
+        AppSettings, json_file=tmp_path / "missing.json"
+    )
+
+    assert source.json_data == {}
+    assert source() == {}
+
+
+def test_search_stopwords_set_is_frozen_once_at_load():
+    search = SearchSettings(stopwords=["de", "a", "de"])
+
+    assert search.stopwords_set == frozenset({"de", "a"})
+    assert isinstance(search.stopwords_set, frozenset)
+    assert search.stopwords_set is search.stopwords_set
+
+
+def test_database_paths_follow_runtime_filename_changes(tmp_path):
+    database = DatabaseSettings(filename="database/nesh.db")
+    first = database.path
+
+    absolute = str(tmp_path / "other.db")
+    database.filename = absolute
+
+    assert first.endswith(os.path.join("database", "nesh.db"))
+    assert os.path.isabs(first)
+    assert database.path == absolute
+
+
+def test_load_is_memoized_until_environment_changes(monkeypatch):
+    monkeypatch.setenv("CACHE__FTS_CACHE_TTL", "123")
+    first = AppSettings.load()
+
+    assert AppSettings.load() is first
+    assert first.cache.fts_cache_ttl == 123
+
+    monkeypatch.setenv("CACHE__FTS_CACHE_TTL", "321")
+    second = AppSettings.load()
+
+    assert second is not first
+    assert second.cache.fts_cache_ttl == 321
+
+
+def test_load_is_invalidated_when_settings_json_changes(monkeypatch, tmp_path):
+    json_file = tmp_path / "settings.json"
+    json_file.write_text('{"server": {"port": 9001}}', encoding="utf-8")
+    monkeypatch.setitem(AppSettings.model_config, "json_file", str(json_file))
+    monkeypatch.delenv("SERVER__PORT", raising=False)
+
+    first = AppSettings.load()
+    assert first.server.port == 9001
+
+    json_file.write_text('{"server": {"port": 9002}}', encoding="utf-8")
+    stat = os.stat(json_file)
+    os.utime(json_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+    assert AppSettings.load().server.port == 9002
+
+
+def test_trusted_settings_json_skips_validation(monkeypatch, tmp_path):
+    json_file = tmp_path / "settings.json"
+    json_file.write_text(
+        '{"server": {"port": 9003}, "search": {"stopwords": ["de", "para"]}}',
+        encoding="utf-8",
+    )
+    monkeypatch.setitem(AppSettings.model_config, "json_file", str(json_file))
+    monkeypatch.setenv("NESH_TRUST_SETTINGS_JSON", "1")
+    monkeypatch.setenv("SERVER__PORT", "7000")
+
+    loaded = AppSettings.load()
+
+    # Caminho confiável lê só o settings.json e mantém os defaults do resto.
+    assert loaded.server.port == 9003
+    assert loaded.server.host == ServerSettings().host
+    assert loaded.search.stopwords_set == frozenset({"de", "para"})
+    assert loaded.cache.fts_cache_ttl == CacheSettings().fts_cache_ttl
+
+
+def test_admin_credentials_accept_current_and_previous(monkeypatch):
+    from backend.config import settings as settings_module
+
+    auth = settings_module.settings.auth
+    monkeypatch.setattr(auth, "admin_token", "token-atual")
+    monkeypatch.setattr(auth, "admin_token_previous", "token-antigo")
+    monkeypatch.setattr(auth, "admin_password", "senha-atual")
+    monkeypatch.setattr(auth, "admin_password_previous", "")
+
+    assert settings_module.is_valid_admin_token("token-atual") is True
+    assert settings_module.is_valid_admin_token("token-antigo") is True
+    assert settings_module.is_valid_admin_token("token-errado") is False
+    assert settings_module.is_valid_admin_token("") is False
+    assert settings_module.is_valid_admin_password("senha-atual") is True
+    assert settings_module.is_valid_admin_password("") is False
+    assert settings_module.is_valid_admin_password("senha-errada") is False
+
+    # Rotação em runtime: os digests acompanham os valores atuais.
+    monkeypatch.setattr(auth, "admin_token", "token-novo")
+    assert settings_module.is_valid_admin_token("token-novo") is True
+    assert settings_module.is_valid_admin_token("token-atual") is False
+
+
+def test_low_cardinality_settings_strings_are_interned(monkeypatch):
+    import sys
+
+    monkeypatch.setenv("SERVER__ENV", "".join(["produ", "ction"]))
+    monkeypatch.setenv("LOGGING__LEVEL", "".join(["DEB", "UG"]))
+
+    loaded = AppSettings.load()
+
+    assert loaded.server.env is sys.intern("production")
+    assert loaded.logging.level is sys.intern("DEBUG")
+    assert loaded.database.engine is sys.intern("sqlite")
+
+
+def test_reload_settings_swaps_sections_in_place(monkeypatch):
+    from backend.config import settings as settings_module
+
+    current = settings_module.settings
+    old_server = current.server
+    for field_name in AppSettings.model_fields:
+        # Restaura as seções originais ao final do teste.
+        monkeypatch.setitem(current.__dict__, field_name, getattr(current, field_name))
+    monkeypatch.setenv("SERVER__PORT", "8765")
+    monkeypatch.setenv("CACHE__FTS_CACHE_TTL", "42")
+
+    reloaded = settings_module.reload_settings()
+
+    assert reloaded is current
+    assert reloaded.server is not old_server
+    assert reloaded.server.port == 8765
+    assert reloaded.cache.fts_cache_ttl == 42
@@ -0,0 +1,99 @@
+import sys
+
+import pytest
+from sqlalchemy import event
+from sqlalchemy.dialects.postgresql import TSVECTOR
+from sqlalchemy.ext.compiler import compiles
+from sqlmodel import Session, SQLModel, create_engine, select
+
+from backend.domain.sqlmodels import (
+    Position,
+    Subscription,
+    Tenant,
+    TipiPosition,
+    _fill_position_anchor_id,
+    _refresh_position_anchor_id,
+)
+
+pytestmark = pytest.mark.unit
+
+
+@compiles(TSVECTOR, "sqlite")
+def _tsvector_as_text_on_sqlite(_type, _compiler, **_kw):
+    # search_vector só existe no PostgreSQL; no SQLite basta uma coluna TEXT.
+    return "TEXT"
+
+
+def test_orm_load_interns_low_cardinality_columns():
+    engine = create_engine("sqlite://")
+    SQLModel.metadata.create_all(
+        engine, tables=[Tenant.__table__, Subscription.__table__]
+    )
+    with Session(engine) as session:
+        session.add(Tenant(id="org_1", name="Org", subscription_plan="enterprise"))
+        session.add(Subscription(tenant_id="org_1", status="ACTIVE", provider="asaas"))
+        session.commit()
+
+    with Session(engine) as session:
+        tenant = session.exec(select(Tenant)).one()
+        subscription = session.exec(select(Subscription)).one()
+
+        assert tenant.subscription_plan is sys.intern("enterprise")
+        assert subscription.status is sys.intern("ACTIVE")
+        assert subscription.provider is sys.intern("asaas")
+        assert not session.dirty
+
+
+def test_position_anchor_id_is_materialized_on_write():
+    # Position usa TSVECTOR (só PostgreSQL); exercita o hook diretamente.
+    assert event.contains(Position, "before_insert", _fill_position_anchor_id)
+    assert event.contains(Position, "before_update", _refresh_position_anchor_id)
+
+    generated = Position(codigo="85.17", descricao="Telefone", chapter_num="85")
+    custom = Position(
+        codigo="85.18", descricao="Microfone", chapter_num="85", anchor_id="custom"
+    )
+    _fill_position_anchor_id(None, None, generated)
+    _fill_position_anchor_id(None, None, custom)
+
+    assert generated.anchor_id == "pos-85-17"
+    assert custom.anchor_id == "custom"
+
+
+def test_tipi_position_anchor_id_is_materialized_on_write():
+    assert event.contains(TipiPosition, "before_insert", _fill_position_anchor_id)
+    assert event.contains(TipiPosition, "before_update", _refresh_position_anchor_id)
+
+    position = TipiPosition(codigo="8517.12.31", descricao="Tel", chapter_num="85")
+    _fill_position_anchor_id(None, None, position)
+
+    assert position.anchor_id == "pos-8517-12-31"
+
+
+@pytest.mark.parametrize(
+    ("model", "extra"),
+    [(Position, {}), (TipiPosition, {"aliquota": "0"})],
+)
+def test_anchor_id_follows_codigo_on_update(model, extra):
+    engine = create_engine("sqlite://")
+    SQLModel.metadata.create_all(engine, tables=[model.__table__])
+    with Session(engine) as session:
+        session.add(
+            model(codigo="85.17", descricao="Telefone", chapter_num="85", **extra)
+        )
+        session.commit()
+
+    with Session(engine) as session:
+        row = session.exec(select(model)).one()
+        assert row.anchor_id == "pos-85-17"
+        row.codigo = "85.18"
+        session.commit()
+
+    with Session(engine) as session:
+        row = session.exec(select(model)).one()
+        assert row.anchor_id == "pos-85-18"
+        # Sem mudar o código, o anchor persistido é mantido.
+        row.descricao = "Telefone celular"
+        session.commit()
+        session.refresh(row)
+        assert row.anchor_id == "pos-85-18"
@@ -65,25 +65,11 @@ async def test_get_by_chapter_maps_defaults_and_anchor(monkeypatch):
         "backend.infrastructure.repositories.tipi_repository.settings.database.engine",
         "sqlite",
     )
-    positions = [
-        SimpleNamespace(
-            codigo="85.17",
-            chapter_num="85",
-            descricao="Telefone",
-            aliquota=None,
-            nivel=None,
-            parent_ncm=None,
-        ),
-        SimpleNamespace(
-            codigo="85.18",
-            chapter_num="85",
-            descricao="Audio",
-            aliquota="5",
-            nivel=2,
-            parent_ncm="85",
-        ),
+    rows = [
+        ("85.17", "85", "Telefone", None, None, None, "pos-85-17"),
+        ("85.18", "85", "Audio", "5", 2, "85", "pos-85-18"),
     ]
-    session = _FakeSession([_FakeResult(scalars=positions)])
+    session = _FakeSession([_FakeResult(rows=rows)])
     repo = TipiRepository(session)
 
     out = await repo.get_by_chapter("85")
@@ -92,6 +78,10 @@ async def test_get_by_chapter_maps_defaults_and_anchor(monkeypatch):
     assert out[0]["nivel"] == 0
     assert out[0]["anchor_id"] == "pos-85-17"
     assert out[1]["aliquota"] == "5"
+    assert out[1]["parent_ncm"] == "85"
+    stmt, _params = session.calls[0]
+    assert "tipi_positions.search_vector" not in str(stmt)
+    assert "tipi_positions.anchor_id" in str(stmt)
 
 
 @pytest.mark.asyncio
@@ -108,6 +98,7 @@ async def test_get_family_positions_postgres_builds_named_params(monkeypatch):
             aliquota=None,
             nivel=1,
             parent_ncm=None,
+            anchor_id="pos-85-17-10",
         ),
     ]
     session = _FakeSession([_FakeResult(rows=rows)])
@@ -120,7 +111,10 @@ async def test_get_family_positions_postgres_builds_named_params(monkeypatch):
     assert "tipi_positions" in str(stmt)
     assert params["chapter_num"] == "85"
     assert params["prefix"] == "8517"
-    assert any(k.startswith("ancestor") for k in params)
+    assert params["prefix_upper"] == "8518"
+    assert "LIKE" not in str(stmt)
+    assert params["ancestors"] == ["85", "851"]
+    assert "= ANY(:ancestors)" in str(stmt)
 
 
 @pytest.mark.asyncio
@@ -137,6 +131,7 @@ async def test_get_family_positions_sqlite_builds_tuple_params(monkeypatch):
             aliquota="10",
             nivel=2,
             parent_ncm="85",
+            anchor_id="pos-85-17-10",
         ),
     ]
     session = _FakeSession([_FakeResult(rows=rows)])
@@ -145,10 +140,59 @@ async def test_get_family_positions_sqlite_builds_tuple_params(monkeypatch):
     out = await repo.get_family_positions("85", "8517", {"85"})
     assert len(out) == 1
     assert out[0]["aliquota"] == "10"
-    _stmt, params = session.calls[0]
-    assert isinstance(params, tuple)
-    assert params[0] == "85"
-    assert params[1] == "8517"
+    assert out[0]["anchor_id"] == "pos-85-17-10"
+    stmt, params = session.calls[0]
+    assert "'pos-' || REPLACE(REPLACE(ncm, '.', '-'), ' ', '') AS anchor_id" in str(
+        stmt
+    )
+    assert params == {
+        "chapter_num": "85",
+        "prefix": "8517",
+        "prefix_upper": "8518",
+        "ancestors": ["85"],
+    }
+
+
+@pytest.mark.asyncio
+async def test_get_family_positions_sqlite_matches_descendants_and_ancestors(
+    monkeypatch,
+):
+    from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+
+    monkeypatch.setattr(
+        "backend.infrastructure.repositories.tipi_repository.settings.database.engine",
+        "sqlite",
+    )
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+    try:
+        async with engine.begin() as conn:
+            await conn.exec_driver_sql(
+                "CREATE TABLE tipi_positions (ncm TEXT PRIMARY KEY, capitulo TEXT, "
+                "descricao TEXT, aliquota TEXT, nivel INTEGER, parent_ncm TEXT, "
+                "ncm_sort TEXT)"
+            )
+            for ncm, sort in [
+                ("85.16", "00"),
+                ("85.17", "01"),
+                ("8517.1", "02"),
+                ("8517.12.31", "03"),
+                ("8518.10.00", "04"),
+            ]:
+                await conn.exec_driver_sql(
+                    "INSERT INTO tipi_positions VALUES "
+                    "(?, '85', 'd', NULL, 1, NULL, ?)",
+                    (ncm, sort),
+                )
+        async with AsyncSession(engine) as session:
+            repo = TipiRepository(session)
+            family = await repo.get_family_positions("85", "85171", {"8517"})
+            no_ancestors = await repo.get_family_positions("85", "85171", set())
+
+        assert [row["codigo"] for row in family] == ["85.17", "8517.1", "8517.12.31"]
+        assert family[-1]["anchor_id"] == "pos-8517-12-31"
+        assert [row["codigo"] for row in no_ancestors] == ["8517.1", "8517.12.31"]
+    finally:
+        await engine.dispose()
 
 
 @pytest.mark.asyncio
@@ -199,8 +243,16 @@ async def test_fts_postgres_maps_rows(monkeypatch):
     assert out == [
         {"ncm": "8517", "capitulo": "85", "descricao": "Desc", "aliquota": "0"}
     ]
-    _stmt, params = session.calls[0]
+    stmt, params = session.calls[0]
     assert params == {"query": "motor", "limit": 11}
+    sql = str(stmt)
+    assert sql.count("plainto_tsquery('portuguese', :query)") == 1
+    assert "WHERE search_vector @@ q.tsq" in sql
+
+    # Mesma variante de tsquery reaproveita o mesmo TextClause.
+    session2 = _FakeSession([_FakeResult(rows=[])])
+    await TipiRepository(session2)._fts_postgres("bomba", 5)
+    assert session2.calls[0][0] is stmt
 
 
 @pytest.mark.asyncio
@@ -217,8 +269,9 @@ async def test_fts_sqlite_quotes_query(monkeypatch):
     assert out == [
         {"ncm": "8517", "capitulo": "85", "descricao": "Desc", "aliquota": "7"}
     ]
-    _stmt, params = session.calls[0]
+    stmt, params = session.calls[0]
     assert params == {"query": '"motor eletrico"', "limit": 4}
+    assert "ORDER BY rank" in str(stmt)
 
 
 @pytest.mark.asyncio
@@ -421,6 +421,58 @@ async def test_get_family_positions_repository_mode():
     assert rows[0]["capitulo"] == "85"
 
 
+@pytest.mark.asyncio
+async def test_get_family_positions_sqlite_matches_prefix_and_ancestors(tmp_path):
+    db_path = tmp_path / "tipi.db"
+    with sqlite3.connect(db_path) as conn:
+        conn.execute(
+            "CREATE TABLE tipi_positions (ncm TEXT PRIMARY KEY, capitulo TEXT, "
+            "descricao TEXT, aliquota TEXT, nivel INTEGER, ncm_sort TEXT)"
+        )
+        conn.executemany(
+            "INSERT INTO tipi_positions VALUES (?, '85', 'd', '0', 1, ?)",
+            [
+                ("85.16", "00"),
+                ("85.17", "01"),
+                ("8517.1", "02"),
+                ("8517.12.31", "03"),
+                ("8518.10.00", "04"),
+            ],
+        )
+    service = TipiService(db_path=db_path)
+    try:
+        rows = await service._get_family_positions("85", "85171", {"85", "8517"})
+    finally:
+        await TipiService.close_all_pools()
+
+    assert [row["ncm"] for row in rows] == ["85.17", "8517.1", "8517.12.31"]
+
+
+@pytest.mark.asyncio
+async def test_text_search_orders_fts_matches_by_rank(tmp_path):
+    db_path = tmp_path / "tipi.db"
+    with sqlite3.connect(db_path) as conn:
+        conn.execute(
+            "CREATE VIRTUAL TABLE tipi_fts USING fts5(ncm, capitulo UNINDEXED, "
+            "descricao, aliquota UNINDEXED)"
+        )
+        conn.executemany(
+            "INSERT INTO tipi_fts VALUES (?, '84', ?, '0')",
+            [
+                ("84.13", "Outras partes e acessorios de maquinas, inclusive bomba"),
+                ("8413.70", "Bomba centrifuga"),
+            ],
+        )
+    service = TipiService(db_path=db_path)
+    try:
+        payload = await service.searchTipiByTextQuery("bomba", limit=2)
+    finally:
+        await TipiService.close_all_pools()
+
+    # Sem ORDER BY rank o FTS5 devolveria na ordem de inserção (rowid).
+    assert [row["ncm"] for row in payload["results"]] == ["8413.70", "84.13"]
+
+
 @pytest.mark.asyncio
 async def test_search_by_code_handles_multi_part_merge_with_same_chapter(monkeypatch):
     service = TipiService()
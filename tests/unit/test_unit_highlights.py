@@ -6,6 +6,7 @@ Validam a regex MEASUREMENT_UNITS e o método inject_unit_highlights.
 import re
 
 import pytest
+from backend.config.constants import MEASUREMENT_UNITS_RE
 from backend.presentation.renderer import HtmlRenderer
 
 # ═══════════════════════════════════════════════════════════════════
@@ -305,6 +306,16 @@ class TestEdgeCases:
             out = HtmlRenderer.inject_unit_highlights(f"10 {variant}")
             assert "highlight-unit" in out, f"'{variant}' deveria ser destacada"
 
+    def test_long_digit_and_space_runs_are_not_highlighted(self):
+        """Entradas degeneradas (dígitos + espaços) não geram destaque."""
+        text = "1   " * 5000
+        out = HtmlRenderer.inject_unit_highlights(text)
+        assert out == text
+
+    def test_renderer_reuses_precompiled_pattern(self):
+        """O renderer usa o padrão compilado no import de constants."""
+        assert HtmlRenderer.RE_UNIT is MEASUREMENT_UNITS_RE
+
 
 # ═══════════════════════════════════════════════════════════════════
 # 5. HTML-aware — smart-links e tags